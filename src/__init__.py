@@ -1,18 +0,0 @@
-"""
-SpatialSamplingPro: Spatial Sampling Design Framework for Reproducible Urban Studies
-
-A Python package for spatial sampling design and analysis in urban studies,
-developed as part of the Geospatial Processing course at Politecnico di Milano.
-
-Authors:
-    Jiale Guo (jiale.guo@mail.polimi.it)
-    Mingfeng Tang (mingfeng.tang@mail.polimi.it)
-
-Geoinformatics Engineering graduate students at Politecnico di Milano
-"""
-
-__version__ = "0.1.0"
-__author__ = "Jiale Guo, Mingfeng Tang"
-__email__ = "jiale.guo@mail.polimi.it, mingfeng.tang@mail.polimi.it"
-
-__all__ = ["__version__", "__author__", "__email__"]
@@ -23,23 +23,11 @@ Geoinformatics Engineering graduate students at Politecnico di Milano
 __version__ = "0.1.0"
 __author__ = "Jiale Guo, Mingfeng Tang"
 
-from ssp.sampling.base import SamplingConfig
-from ssp.sampling import SamplingStrategy, GridSampling, RoadNetworkSampling
-from ssp.visualization import compare_strategies, plot_coverage_statistics, plot_spatial_distribution
-from ssp.metadata import (
-    SamplingMetadata,
-    MetadataSerializer,
-    MetadataValidator,
-    MetadataExporter,
-    quick_validate
-)
-from ssp.performance import (
-    ParallelProcessor,
-    SpatialChunker,
-    DiskCache,
-    ProgressTracker,
-    TQDM_AVAILABLE
-)
+import importlib
+from typing import Any, List
+
+# Exception classes are a dependency-free leaf module, so they are bound
+# eagerly; ``except ssp.SamplingError`` never has to go through __getattr__.
 from ssp.exceptions import (
     SpatialSamplingProError,
     ConfigurationError,
@@ -49,25 +37,80 @@ from ssp.exceptions import (
     ValidationError,
     ExportError,
     VisualizationError,
-    format_error_context,
-    suggest_fix
-)
-from ssp.utils import (
-    handle_small_boundary,
-    fix_invalid_geometry,
-    ensure_polygon,
-    validate_crs_compatibility,
-    handle_empty_geodataframe,
-    warn_large_output,
-    estimate_processing_time,
-    check_spacing_bounds,
-    safe_geometry_operation,
-    meters_to_degrees,
-    degrees_to_meters,
-    estimate_center_latitude,
-    convert_spacing_for_crs
 )
 
+# Public names are resolved lazily (PEP 562) so that ``import ssp`` does not
+# pull in GeoPandas, Matplotlib or tqdm until an attribute is actually used.
+_LAZY = {
+    # Sampling
+    "SamplingConfig": "ssp.sampling.base",
+    "SamplingStrategy": "ssp.sampling",
+    "GridSampling": "ssp.sampling",
+    "RoadNetworkSampling": "ssp.sampling",
+    # Visualization
+    "compare_strategies": "ssp.visualization",
+    "plot_coverage_statistics": "ssp.visualization",
+    "plot_spatial_distribution": "ssp.visualization",
+    # Metadata
+    "SamplingMetadata": "ssp.metadata",
+    "MetadataSerializer": "ssp.metadata",
+    "MetadataValidator": "ssp.metadata",
+    "MetadataExporter": "ssp.metadata",
+    "quick_validate": "ssp.metadata",
+    # Performance
+    "ParallelProcessor": "ssp.performance",
+    "SpatialChunker": "ssp.performance",
+    "DiskCache": "ssp.performance",
+    "ProgressTracker": "ssp.performance",
+    "TQDM_AVAILABLE": "ssp.performance",
+    # Exception helpers
+    "format_error_context": "ssp.exceptions",
+    "suggest_fix": "ssp.exceptions",
+    # Utils
+    "handle_small_boundary": "ssp.utils",
+    "fix_invalid_geometry": "ssp.utils",
+    "ensure_polygon": "ssp.utils",
+    "validate_crs_compatibility": "ssp.utils",
+    "handle_empty_geodataframe": "ssp.utils",
+    "warn_large_output": "ssp.utils",
+    "estimate_processing_time": "ssp.utils",
+    "check_spacing_bounds": "ssp.utils",
+    "safe_geometry_operation": "ssp.utils",
+    "meters_to_degrees": "ssp.utils",
+    "degrees_to_meters": "ssp.utils",
+    "estimate_center_latitude": "ssp.utils",
+    "convert_spacing_for_crs": "ssp.utils",
+}
+
+# Subpackages that used to be bound as a side effect of the eager imports.
+_SUBMODULES = {
+    "sampling", "visualization", "metadata", "performance", "exceptions",
+    "utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes on first access and cache them."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in ``dir(ssp)``."""
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "__version__",
     "__author__",
@@ -18,22 +18,47 @@ Example:
 """
 
 import click
+import os
+import re
 import sys
-import traceback
 from pathlib import Path
-from typing import Optional
-
-import geopandas as gpd
-from shapely.geometry import Polygon
-
-from ssp import (
-    GridSampling, RoadNetworkSampling, SamplingConfig,
+from typing import Optional, TYPE_CHECKING
+
+# Only the package version and the dependency-free exception module are
+# imported eagerly. GeoPandas, Shapely and the sampling stack are imported
+# inside the commands that use them, so ``ssp --help`` and ``ssp --version``
+# stay fast.
+from ssp import __version__
+from ssp.exceptions import (
     SpatialSamplingProError, ConfigurationError, BoundaryError,
     SamplingError, NetworkDownloadError, ValidationError,
-    ExportError, format_error_context, suggest_fix,
-    check_spacing_bounds, estimate_processing_time, warn_large_output
+    ExportError, format_error_context, suggest_fix
+)
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+
+# Above this many points, points-map clusters markers client-side
+FAST_MARKER_THRESHOLD = 5000
+
+# CRS of OpenStreetMap data; road networks are sampled in it
+OSM_CRS = "EPSG:4326"
+
+# Number of leading bytes inspected when validating an input vector file
+SNIFF_BYTES = 8192
+
+# Top-level GeoJSON object types accepted by the header sniff
+GEOJSON_TYPE_PATTERN = re.compile(
+    rb'"type"\s*:\s*"(FeatureCollection|Feature|Point|MultiPoint|LineString|'
+    rb'MultiLineString|Polygon|MultiPolygon|GeometryCollection)"'
 )
 
+# Parameter types for file options; Click checks the input path with a
+# single stat and hands commands a ready-made Path
+INPUT_FILE = click.Path(exists=True, dir_okay=False, readable=True, path_type=Path)
+OUTPUT_FILE = click.Path(dir_okay=False, path_type=Path)
+
 
 # ANSI color codes for terminal output
 class Colors:
@@ -49,33 +74,52 @@ class Colors:
     UNDERLINE = '\033[4m' # underline
 
 
+# Honour NO_COLOR (https://no-color.org): only a non-empty value disables
+# colour; click.echo already strips ANSI codes when output is not a terminal
+_USE_COLOR = not os.environ.get('NO_COLOR')
+
+
+def _colored(text: str, color: str) -> str:
+    """Wrap text in an ANSI color code unless color output is disabled."""
+    return f"{color}{text}{Colors.ENDC}" if _USE_COLOR else text
+
+
+# Message prefixes, built once instead of on every call
+_OK = _colored('✓', Colors.OKGREEN) + ' '
+_ERR = _colored('✗', Colors.FAIL) + ' '
+_INFO = _colored('ℹ', Colors.OKBLUE) + ' '
+_WARN = _colored('⚠', Colors.WARNING) + ' '
+_TIP = _colored('💡', Colors.OKCYAN) + ' '
+_BULLET = '  ' + _colored('•', Colors.WARNING) + ' '
+
+
 def success_msg(message: str) -> None:
     """Print success message in green."""
-    click.echo(f"{Colors.OKGREEN}✓{Colors.ENDC} {message}")
+    click.echo(_OK + message)
 
 
 def error_msg(message: str, details: Optional[dict] = None) -> None:
     """Print error message in red with optional details."""
-    click.echo(f"{Colors.FAIL}✗{Colors.ENDC} {message}", err=True)
+    click.echo(_ERR + message, err=True)
     if details:
-        click.echo(f"{Colors.WARNING}  Details:{Colors.ENDC}", err=True)
+        click.echo(_colored('  Details:', Colors.WARNING), err=True)
         for key, value in details.items():
             click.echo(f"    {key}: {value}", err=True)
 
 
 def info_msg(message: str) -> None:
     """Print info message in blue."""
-    click.echo(f"{Colors.OKBLUE}ℹ{Colors.ENDC} {message}")
+    click.echo(_INFO + message)
 
 
 def warning_msg(message: str) -> None:
     """Print warning message in yellow."""
-    click.echo(f"{Colors.WARNING}⚠{Colors.ENDC} {message}")
+    click.echo(_WARN + message)
 
 
 def tip_msg(message: str) -> None:
     """Print tip message in cyan."""
-    click.echo(f"{Colors.OKCYAN}💡{Colors.ENDC} {message}")
+    click.echo(_TIP + message)
 
 
 def handle_ssp_error(error: SpatialSamplingProError) -> None:
@@ -90,7 +134,7 @@ def handle_ssp_error(error: SpatialSamplingProError) -> None:
     # Show details if available
     if error.details:
         for key, value in error.details.items():
-            click.echo(f"  {Colors.WARNING}•{Colors.ENDC} {key}: {value}", err=True)
+            click.echo(f"{_BULLET}{key}: {value}", err=True)
 
     # Show suggestion if available
     suggestion = suggest_fix(error)
@@ -110,7 +154,7 @@ def handle_unexpected_error(error: Exception) -> None:
     error_msg(f"An unexpected error occurred: {error}")
 
     # Show error type
-    click.echo(f"\n{Colors.WARNING}Error type:{Colors.ENDC} {error.__class__.__name__}", err=True)
+    click.echo(f"\n{_colored('Error type:', Colors.WARNING)} {error.__class__.__name__}", err=True)
 
     # Check if it might be related to SpatialSamplingPro
     if isinstance(error, (ValueError, TypeError, AttributeError)):
@@ -121,22 +165,129 @@ def handle_unexpected_error(error: Exception) -> None:
 
     # Suggest reporting bug if unexpected
     click.echo(
-        f"\n{Colors.FAIL}If this error persists, please report it at:{Colors.ENDC}\n"
+        f"\n{_colored('If this error persists, please report it at:', Colors.FAIL)}\n"
         f"  https://github.com/GuojialeGeographer/GProcessing2025/issues",
         err=True
     )
 
     # Show traceback in verbose mode
     if '--verbose' in sys.argv or '-v' in sys.argv:
-        click.echo(f"\n{Colors.WARNING}Stack trace:{Colors.ENDC}", err=True)
+        import traceback
+
+        click.echo(f"\n{_colored('Stack trace:', Colors.WARNING)}", err=True)
         traceback.print_exc()
 
     sys.exit(1)
 
 
-def validate_aoi_file(ctx, param, value: str) -> str:
+def _read_vector(path, **kwargs) -> "gpd.GeoDataFrame":
     """
-    Validate that AOI file exists and is readable.
+    Read a vector file with the pyogrio engine, falling back to the default.
+
+    pyogrio reads features through GDAL's bulk vector API, which is much
+    faster than Fiona's per-feature loop for GeoJSON/Shapefile inputs.
+
+    Args:
+        path: Path to the vector file
+        **kwargs: Extra arguments passed to ``geopandas.read_file``
+
+    Returns:
+        GeoDataFrame read from ``path``
+    """
+    import geopandas as gpd
+
+    try:
+        return gpd.read_file(path, engine="pyogrio", **kwargs)
+    except ImportError:
+        return gpd.read_file(path, **kwargs)
+
+
+def _area_unit(crs: str) -> str:
+    """
+    Describe the unit of areas measured in ``crs`` coordinates.
+
+    Args:
+        crs: CRS identifier (e.g. 'EPSG:4326')
+
+    Returns:
+        Human-readable area unit, e.g. 'square degrees'
+    """
+    from pyproj import CRS
+
+    crs = CRS.from_user_input(crs)
+    if crs.is_geographic:
+        return "square degrees"
+
+    unit = crs.axis_info[0].unit_name if crs.axis_info else "units"
+    return "square meters" if unit == "metre" else f"square {unit}"
+
+
+def _load_boundary(path, target_crs: str):
+    """
+    Load an AOI file as a single sampling boundary in ``target_crs``.
+
+    Multi-feature AOIs are unioned, and the AOI is reprojected only when
+    its CRS differs from ``target_crs``. Geometries that are still not a
+    Polygon fall back to their convex hull, since the sampling strategies
+    require a Polygon.
+
+    Args:
+        path: Path to the AOI file
+        target_crs: CRS the boundary coordinates must be expressed in
+
+    Returns:
+        Boundary polygon
+    """
+    from shapely import unary_union
+
+    aoi_gdf = _read_vector(path)
+
+    if aoi_gdf.crs is not None and aoi_gdf.crs != target_crs:
+        aoi_gdf = aoi_gdf.to_crs(target_crs)
+
+    # Extract boundary (single feature or union of all)
+    if len(aoi_gdf) == 1:
+        boundary = aoi_gdf.geometry.iloc[0]
+    else:
+        boundary = unary_union(aoi_gdf.geometry.to_numpy())
+
+    if boundary.geom_type != "Polygon":
+        # MultiPolygons and other geometries: sample their convex hull
+        boundary = boundary.convex_hull
+
+    return boundary
+
+
+def _export_points(strategy, output: Path, output_format: str, metadata: bool) -> None:
+    """
+    Write generated sample points in the requested output format.
+
+    FeatureCollection-level metadata only exists in GeoJSON, so
+    ``--metadata`` is ignored (with a warning) for other formats.
+
+    Args:
+        strategy: Sampling strategy holding the generated points
+        output: Output file path
+        output_format: One of 'geojson', 'fgb' or 'gpkg'
+        metadata: Whether to embed generation metadata
+    """
+    output_format = output_format.lower()
+
+    if output_format == 'geojson':
+        strategy.to_geojson(output, include_metadata=metadata)
+        return
+
+    if metadata:
+        warning_msg("--metadata is only written to GeoJSON output; ignoring it.")
+    strategy.export(output, output_format)
+
+
+def validate_aoi_file(ctx, param, value: Path) -> Path:
+    """
+    Validate that AOI file contains vector geometries.
+
+    Existence and readability are already checked by the ``INPUT_FILE``
+    parameter type.
 
     Args:
         ctx: Click context
@@ -147,27 +298,39 @@ def validate_aoi_file(ctx, param, value: str) -> str:
         Validated file path
 
     Raises:
-        click.BadParameter: If file doesn't exist or can't be read
+        click.BadParameter: If file can't be read as vector data
     """
-    path = Path(value)
-
-    if not path.exists():
-        raise click.BadParameter(
-            f"AOI file not found: {value}"
-        )
-
-    if not path.is_file():
+    # Sniff the file header instead of parsing it; the command body does
+    # the full read
+    try:
+        with open(value, 'rb') as f:
+            head = f.read(SNIFF_BYTES)
+            complete = not f.read(1)
+    except OSError as e:
         raise click.BadParameter(
-            f"AOI path must be a file, not directory: {value}"
+            f"Failed to read GeoJSON file '{value}': {e}"
         )
 
-    # Try to read as GeoJSON to validate format
-    try:
-        gdf = gpd.read_file(path)
-        if 'geometry' not in gdf.columns:
+    if head.lstrip().startswith(b'{'):
+        if GEOJSON_TYPE_PATTERN.search(head):
+            return value
+        if complete:
             raise click.BadParameter(
-                f"Invalid GeoJSON file (no geometry column): {value}"
+                f"Invalid GeoJSON file (no Feature, FeatureCollection or "
+                f"geometry type): {value}"
             )
+
+    # Not recognisable from the header (other vector formats, or a very
+    # large first feature): ask GDAL for the schema without reading features
+    try:
+        try:
+            import pyogrio
+        except ImportError:
+            _read_vector(value, rows=1)
+        else:
+            info = pyogrio.read_info(value)
+            if not info.get('geometry_type'):
+                raise ValueError("no geometry column")
     except Exception as e:
         raise click.BadParameter(
             f"Failed to read GeoJSON file '{value}': {e}"
@@ -176,7 +339,7 @@ def validate_aoi_file(ctx, param, value: str) -> str:
     return value
 
 
-def validate_output_path(ctx, param, value: str) -> str:
+def validate_output_path(ctx, param, value: Path) -> Path:
     """
     Validate output path and create directory if needed.
 
@@ -191,11 +354,9 @@ def validate_output_path(ctx, param, value: str) -> str:
     Raises:
         click.BadParameter: If path is invalid
     """
-    path = Path(value)
-
     # Create parent directory if it doesn't exist
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
+        value.parent.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         raise click.BadParameter(
             f"Cannot create output directory: {e}"
@@ -205,7 +366,7 @@ def validate_output_path(ctx, param, value: str) -> str:
 
 
 @click.group()
-@click.version_option(version="0.1.0")
+@click.version_option(__version__, '-V', '--version')
 def cli():
     """
     SpatialSamplingPro Command Line Interface.
@@ -250,17 +411,17 @@ def sample():
 )
 @click.option(
     '--aoi',
-    type=str,
+    type=INPUT_FILE,
     required=True,
     callback=validate_aoi_file,
     help='Path to AOI boundary file (GeoJSON format)'
 )
 @click.option(
     '--output',
-    type=str,
+    type=OUTPUT_FILE,
     required=True,
     callback=validate_output_path,
-    help='Output file path for sample points (GeoJSON format)'
+    help='Output file path for sample points (see --format)'
 )
 @click.option(
     '--metadata',
@@ -269,7 +430,22 @@ def sample():
     show_default=True,
     help='Include metadata in output GeoJSON'
 )
-def grid(spacing: float, crs: str, seed: int, aoi: str, output: str, metadata: bool):
+@click.option(
+    '--format', 'output_format',
+    type=click.Choice(['geojson', 'fgb', 'gpkg'], case_sensitive=False),
+    default='geojson',
+    show_default=True,
+    help='Output format: GeoJSON, FlatGeobuf or GeoPackage'
+)
+def grid(
+    spacing: float,
+    crs: str,
+    seed: int,
+    aoi: Path,
+    output: Path,
+    metadata: bool,
+    output_format: str
+):
     """
     Generate grid-based sample points within the given boundary.
 
@@ -285,26 +461,18 @@ def grid(spacing: float, crs: str, seed: int, aoi: str, output: str, metadata: b
         $ ssp sample grid --spacing 50 --crs EPSG:3857 --aoi hk.geojson --output hk_points.geojson --metadata
     """
     try:
+        from ssp import GridSampling, SamplingConfig
+        from ssp.utils import check_spacing_bounds, warn_large_output
+
         info_msg(f"Loading AOI from: {aoi}")
 
         # Validate spacing parameter
         check_spacing_bounds(spacing)
 
         # Read AOI
-        aoi_gdf = gpd.read_file(aoi)
-
-        # Extract boundary (assuming first feature or union all)
-        if len(aoi_gdf) == 1:
-            boundary = aoi_gdf.geometry.iloc[0]
-        else:
-            # Union all geometries if multiple features
-            boundary = aoi_gdf.unary_union_all()
-
-        if not isinstance(boundary, Polygon):
-            # If not a polygon, try to get the convex hull
-            boundary = boundary.convex_hull
+        boundary = _load_boundary(aoi, crs)
 
-        info_msg(f"Boundary area: {boundary.area:.2f} square degrees")
+        info_msg(f"Boundary area: {boundary.area:.2f} {_area_unit(crs)}")
 
         # Create configuration
         config = SamplingConfig(
@@ -335,9 +503,8 @@ def grid(spacing: float, crs: str, seed: int, aoi: str, output: str, metadata: b
         info_msg(f"Coverage area: {metrics['area_km2']:.4f} km²")
         info_msg(f"Sampling density: {metrics['density_pts_per_km2']:.2f} pts/km²")
 
-        # Export to GeoJSON
         info_msg(f"Exporting to: {output}")
-        strategy.to_geojson(output, include_metadata=metadata)
+        _export_points(strategy, output, output_format, metadata)
 
         success_msg(f"Sample points saved to: {output}")
 
@@ -385,17 +552,17 @@ def grid(spacing: float, crs: str, seed: int, aoi: str, output: str, metadata: b
 )
 @click.option(
     '--aoi',
-    type=str,
+    type=INPUT_FILE,
     required=True,
     callback=validate_aoi_file,
     help='Path to AOI boundary file (GeoJSON format)'
 )
 @click.option(
     '--output',
-    type=str,
+    type=OUTPUT_FILE,
     required=True,
     callback=validate_output_path,
-    help='Output file path for sample points (GeoJSON format)'
+    help='Output file path for sample points (see --format)'
 )
 @click.option(
     '--metadata',
@@ -404,15 +571,38 @@ def grid(spacing: float, crs: str, seed: int, aoi: str, output: str, metadata: b
     show_default=True,
     help='Include metadata in output GeoJSON'
 )
+@click.option(
+    '--format', 'output_format',
+    type=click.Choice(['geojson', 'fgb', 'gpkg'], case_sensitive=False),
+    default='geojson',
+    show_default=True,
+    help='Output format: GeoJSON, FlatGeobuf or GeoPackage'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    default=False,
+    help='Always download the road network instead of using the local OSM '
+         'cache (stored in .ssp_cache/osm under the current directory)'
+)
+@click.option(
+    '--refresh-cache',
+    is_flag=True,
+    default=False,
+    help='Re-download the road network and replace the cached copy'
+)
 def road_network(
     spacing: float,
     crs: str,
     seed: int,
     network_type: str,
     road_types: tuple,
-    aoi: str,
-    output: str,
-    metadata: bool
+    aoi: Path,
+    output: Path,
+    metadata: bool,
+    output_format: str,
+    no_cache: bool,
+    refresh_cache: bool
 ):
     """
     Generate road network sample points within the given boundary.
@@ -432,25 +622,25 @@ def road_network(
     access to roads is required for image capture. Points are distributed along
     actual road networks, providing realistic placement for field surveys.
     """
+    if no_cache and refresh_cache:
+        raise click.UsageError(
+            "--refresh-cache cannot be combined with --no-cache"
+        )
+
     try:
+        from ssp import RoadNetworkSampling, SamplingConfig
+        from ssp.utils import check_spacing_bounds, warn_large_output
+
         info_msg(f"Loading AOI from: {aoi}")
 
         # Validate spacing parameter
         check_spacing_bounds(spacing)
 
-        # Read AOI
-        aoi_gdf = gpd.read_file(aoi)
+        # OSM data is in WGS84, so the road network is sampled there and
+        # only the resulting points are reprojected to --crs
+        boundary = _load_boundary(aoi, OSM_CRS)
 
-        # Extract boundary
-        if len(aoi_gdf) == 1:
-            boundary = aoi_gdf.geometry.iloc[0]
-        else:
-            boundary = aoi_gdf.unary_union_all()
-
-        if not isinstance(boundary, Polygon):
-            boundary = boundary.convex_hull
-
-        info_msg(f"Boundary area: {boundary.area:.2f} square degrees")
+        info_msg(f"Boundary area: {boundary.area:.2f} {_area_unit(OSM_CRS)}")
 
         # Process road types if provided
         road_types_set = None
@@ -461,7 +651,7 @@ def road_network(
         # Create configuration
         config = SamplingConfig(
             spacing=spacing,
-            crs=crs,
+            crs=OSM_CRS,
             seed=seed
         )
 
@@ -471,7 +661,9 @@ def road_network(
         strategy = RoadNetworkSampling(
             config,
             network_type=network_type,
-            road_types=road_types_set
+            road_types=road_types_set,
+            use_cache=not no_cache,
+            refresh_cache=refresh_cache
         )
 
         points = strategy.generate(boundary)
@@ -487,6 +679,9 @@ def road_network(
 
         success_msg(f"Generated {len(points)} sample points")
 
+        if points.crs != crs:
+            strategy._sample_points = points.to_crs(crs)
+
         # Warn if generating very large output
         warn_large_output(len(points))
 
@@ -497,12 +692,13 @@ def road_network(
 
         if metrics['road_type_distribution']:
             info_msg("Road type distribution:")
-            for road_type, count in sorted(metrics['road_type_distribution'].items()):
-                click.echo(f"  - {road_type}: {count} points")
+            click.echo("\n".join(
+                f"  - {road_type}: {count} points"
+                for road_type, count in sorted(metrics['road_type_distribution'].items())
+            ))
 
-        # Export to GeoJSON
         info_msg(f"Exporting to: {output}")
-        strategy.to_geojson(output, include_metadata=metadata)
+        _export_points(strategy, output, output_format, metadata)
 
         success_msg(f"Sample points saved to: {output}")
 
@@ -527,19 +723,19 @@ def protocol():
 @protocol.command()
 @click.option(
     '--points',
-    type=str,
+    type=INPUT_FILE,
     required=True,
     callback=validate_aoi_file,
     help='Path to sample points GeoJSON file'
 )
 @click.option(
     '--output',
-    type=str,
+    type=OUTPUT_FILE,
     default='sampling_protocol.yaml',
     show_default=True,
     help='Output protocol file path (YAML format)'
 )
-def create(points: str, output: str):
+def create(points: Path, output: Path):
     """
     Generate sampling protocol file from sample points.
 
@@ -552,8 +748,8 @@ def create(points: str, output: str):
     try:
         info_msg(f"Loading sample points from: {points}")
 
-        # Read sample points
-        points_gdf = gpd.read_file(points)
+        # Read sample points; only the attributes used below are needed
+        points_gdf = _read_vector(points, columns=['strategy', 'spacing_m'])
 
         if len(points_gdf) == 0:
             error_msg("Sample points file is empty")
@@ -561,14 +757,22 @@ def create(points: str, output: str):
 
         # Extract metadata
         strategy_name = points_gdf['strategy'].iloc[0] if 'strategy' in points_gdf.columns else 'unknown'
-        spacing = points_gdf['spacing_m'].iloc[0] if 'spacing_m' in points_gdf.columns else 0
+        spacing = float(points_gdf['spacing_m'].iloc[0]) if 'spacing_m' in points_gdf.columns else 0
         n_points = len(points_gdf)
 
         # Calculate metrics
         bounds = points_gdf.total_bounds
-        from shapely.geometry import box
-        bbox = box(*bounds)
-        area_m2 = bbox.area
+        width = bounds[2] - bounds[0]
+        height = bounds[3] - bounds[1]
+
+        if points_gdf.crs is not None and points_gdf.crs.is_geographic:
+            # Bounds are in degrees; approximate the extent in meters
+            from ssp.utils import degrees_to_meters
+            center_lat = (bounds[1] + bounds[3]) / 2
+            width = degrees_to_meters(width, center_lat)
+            height = degrees_to_meters(height)
+
+        area_m2 = float(width * height)
         area_km2 = area_m2 / 1e6
 
         # Generate protocol content
@@ -584,7 +788,7 @@ def create(points: str, output: str):
                     'Mingfeng Tang <mingfeng.tang@mail.polimi.it>'
                 ],
                 'aoi': {
-                    'source_file': points,
+                    'source_file': str(points),
                     'bounds': [float(bounds[0]), float(bounds[1]), float(bounds[2]), float(bounds[3])],
                     'crs': str(points_gdf.crs)
                 },
@@ -614,11 +818,18 @@ def create(points: str, output: str):
         }
 
         # Write protocol file
-        output_path = Path(output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            yaml.dump(protocol_data, f, default_flow_style=False, sort_keys=False)
+        # Prefer the libyaml-backed emitter when PyYAML was built with it
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+        with open(output, 'w') as f:
+            yaml.dump(
+                protocol_data, f,
+                Dumper=dumper,
+                default_flow_style=False,
+                sort_keys=False
+            )
 
         success_msg(f"Protocol file saved to: {output}")
 
@@ -644,12 +855,12 @@ def quality():
 @quality.command()
 @click.option(
     '--points',
-    type=str,
+    type=INPUT_FILE,
     required=True,
     callback=validate_aoi_file,
     help='Path to sample points GeoJSON file'
 )
-def metrics(points: str):
+def metrics(points: Path):
     """
     Calculate and display coverage quality metrics.
 
@@ -663,8 +874,8 @@ def metrics(points: str):
     try:
         info_msg(f"Loading sample points from: {points}")
 
-        # Read sample points
-        points_gdf = gpd.read_file(points)
+        # Read sample points; metrics only need geometry and spacing
+        points_gdf = _read_vector(points, columns=['spacing_m'])
 
         if len(points_gdf) == 0:
             error_msg("Sample points file is empty")
@@ -680,23 +891,26 @@ def metrics(points: str):
         strategy._sample_points = points_gdf
         metrics = strategy.calculate_coverage_metrics()
 
-        # Display metrics
-        click.echo(f"\n{Colors.BOLD}Sampling Quality Metrics{Colors.ENDC}")
-        click.echo("=" * 50)
+        # Display metrics (collected and written in one call)
+        lines = [
+            f"\n{_colored('Sampling Quality Metrics', Colors.BOLD)}",
+            "=" * 50,
 
-        click.echo(f"\n📊 {Colors.OKCYAN}Coverage Metrics:{Colors.ENDC}")
-        click.echo(f"  Number of points:     {Colors.BOLD}{metrics['n_points']}{Colors.ENDC}")
-        click.echo(f"  Coverage area:       {metrics['area_km2']:.4f} km²")
-        click.echo(f"  Sampling density:    {metrics['density_pts_per_km2']:.2f} pts/km²")
+            f"\n📊 {_colored('Coverage Metrics:', Colors.OKCYAN)}",
+            f"  Number of points:     {_colored(str(metrics['n_points']), Colors.BOLD)}",
+            f"  Coverage area:       {metrics['area_km2']:.4f} km²",
+            f"  Sampling density:    {metrics['density_pts_per_km2']:.2f} pts/km²",
 
-        click.echo(f"\n📍 {Colors.OKCYAN}Spatial Extent:{Colors.ENDC}")
-        click.echo(f"  Min X: {metrics['bounds'][0]:.4f}")
-        click.echo(f"  Min Y: {metrics['bounds'][1]:.4f}")
-        click.echo(f"  Max X: {metrics['bounds'][2]:.4f}")
-        click.echo(f"  Max Y: {metrics['bounds'][3]:.4f}")
+            f"\n📍 {_colored('Spatial Extent:', Colors.OKCYAN)}",
+            f"  Min X: {metrics['bounds'][0]:.4f}",
+            f"  Min Y: {metrics['bounds'][1]:.4f}",
+            f"  Max X: {metrics['bounds'][2]:.4f}",
+            f"  Max Y: {metrics['bounds'][3]:.4f}",
 
-        click.echo(f"\n🌐 {Colors.OKCYAN}Coordinate System:{Colors.ENDC}")
-        click.echo(f"  CRS: {metrics['crs']}")
+            f"\n🌐 {_colored('Coordinate System:', Colors.OKCYAN)}",
+            f"  CRS: {metrics['crs']}",
+        ]
+        click.echo("\n".join(lines))
 
         success_msg("\nMetrics calculated successfully")
 
@@ -723,14 +937,14 @@ def visualize():
 @visualize.command()
 @click.option(
     '--points',
-    type=str,
+    type=INPUT_FILE,
     required=True,
     callback=validate_aoi_file,
     help='Path to sample points GeoJSON file'
 )
 @click.option(
     '--output',
-    type=str,
+    type=OUTPUT_FILE,
     default='coverage_map.html',
     show_default=True,
     help='Output HTML file path for the map'
@@ -742,7 +956,7 @@ def visualize():
     show_default=True,
     help='Title for the map'
 )
-def points_map(points: str, output: str, title: str):
+def points_map(points: Path, output: Path, title: str):
     """
     Create an interactive map showing sample points.
 
@@ -760,7 +974,7 @@ def points_map(points: str, output: str, title: str):
         info_msg(f"Loading sample points from: {points}")
 
         # Read sample points
-        points_gdf = gpd.read_file(points)
+        points_gdf = _read_vector(points)
 
         if len(points_gdf) == 0:
             error_msg("Sample points file is empty")
@@ -776,28 +990,35 @@ def points_map(points: str, output: str, title: str):
         # Create map
         m = folium.Map(location=[center_lat, center_lon], zoom_start=13)
 
-        # Add sample points
-        for idx, row in points_gdf.iterrows():
-            folium.CircleMarker(
-                location=[row.geometry.y, row.geometry.x],
-                radius=5,
-                popup=f"Point: {row.get('sample_id', idx)}",
-                color='blue',
-                fill=True,
-                fill_opacity=0.6,
-                weight=2
-            ).add_to(m)
+        # Add sample points as a single layer instead of one marker per row
+        if len(points_gdf) > FAST_MARKER_THRESHOLD:
+            # Large point sets: client-side clustering keeps the HTML small
+            import shapely
+            from folium.plugins import FastMarkerCluster
 
-        # Add bounds outline
-        folium.GeoJson(
-            data=points_gdf.geometry.__geo_interface__,
-            style_function=lambda x: {
-                'fillColor': 'green',
-                'color': 'green',
-                'weight': 2,
-                'fillOpacity': 0.1
-            }
-        ).add_to(m)
+            # One vectorized GEOS call for all (x, y) pairs, flipped to the
+            # (lat, lon) order Leaflet expects
+            xy = shapely.get_coordinates(points_gdf.geometry.to_numpy())
+            FastMarkerCluster(data=xy[:, ::-1].tolist()).add_to(m)
+        else:
+            # Popup label: sample_id when present, otherwise the row index
+            labels = (
+                points_gdf['sample_id'] if 'sample_id' in points_gdf.columns
+                else points_gdf.index.to_series(index=points_gdf.index)
+            )
+            layer = points_gdf[['geometry']].assign(point=labels.astype(str))
+
+            folium.GeoJson(
+                data=layer,
+                marker=folium.CircleMarker(
+                    radius=5,
+                    color='blue',
+                    fill=True,
+                    fill_opacity=0.6,
+                    weight=2
+                ),
+                popup=folium.GeoJsonPopup(fields=['point'], aliases=['Point:'])
+            ).add_to(m)
 
         # Add tile layer with labels
         folium.TileLayer('OpenStreetMap', attr='© <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors').add_to(m)
@@ -806,10 +1027,9 @@ def points_map(points: str, output: str, title: str):
         m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
 
         # Save map
-        output_path = Path(output)
-        m.save(str(output_path))
+        m.save(str(output))
 
-        success_msg(f"Interactive map saved to: {output_path}")
+        success_msg(f"Interactive map saved to: {output}")
         info_msg(f"Open the file in a web browser to view the map.")
 
     except FileNotFoundError as e:
@@ -823,14 +1043,14 @@ def points_map(points: str, output: str, title: str):
 @visualize.command()
 @click.option(
     '--points',
-    type=str,
+    type=INPUT_FILE,
     required=True,
     callback=validate_aoi_file,
     help='Path to sample points GeoJSON file'
 )
 @click.option(
     '--output',
-    type=str,
+    type=OUTPUT_FILE,
     default='coverage_statistics.png',
     show_default=True,
     help='Output PNG file path for the statistics plot'
@@ -841,7 +1061,13 @@ def points_map(points: str, output: str, title: str):
     default=None,
     help='Optional boundary file (GeoJSON) for context'
 )
-def statistics(points: str, output: str, boundary: str):
+@click.option(
+    '--no-render',
+    is_flag=True,
+    default=False,
+    help='Print the summary statistics without rendering the plot'
+)
+def statistics(points: Path, output: Path, boundary: str, no_render: bool):
     """
     Generate coverage statistics plots for sample points.
 
@@ -854,14 +1080,13 @@ def statistics(points: str, output: str, boundary: str):
     Example:
         $ ssp visualize statistics --points samples.geojson --output stats.png
         $ ssp visualize statistics --points samples.geojson --boundary aoi.geojson --output stats.png
+        $ ssp visualize statistics --points samples.geojson --no-render
     """
     try:
-        from ssp import plot_coverage_statistics
-
         info_msg(f"Loading sample points from: {points}")
 
         # Read sample points
-        points_gdf = gpd.read_file(points)
+        points_gdf = _read_vector(points)
 
         if len(points_gdf) == 0:
             error_msg("Sample points file is empty")
@@ -869,6 +1094,23 @@ def statistics(points: str, output: str, boundary: str):
 
         info_msg(f"Analyzing {len(points_gdf)} sample points...")
 
+        if no_render:
+            # Same figures as the summary table, without loading Matplotlib
+            bounds = points_gdf.total_bounds
+            click.echo("\n".join([
+                f"  Total points: {len(points_gdf):,}",
+                f"  Bounds:       {bounds[0]:.4f}, {bounds[1]:.4f}, "
+                f"{bounds[2]:.4f}, {bounds[3]:.4f}",
+                f"  X range:      {bounds[2] - bounds[0]:.4f}",
+                f"  Y range:      {bounds[3] - bounds[1]:.4f}",
+                f"  CRS:          {points_gdf.crs}",
+            ]))
+            return
+
+        # Use the non-interactive backend; the figure is only written to file
+        os.environ.setdefault("MPLBACKEND", "Agg")
+        from ssp import plot_coverage_statistics
+
         # Generate statistics plot
         info_msg("Generating coverage statistics visualization...")
         fig = plot_coverage_statistics(points_gdf, output_path=output)
@@ -910,14 +1152,14 @@ def statistics(points: str, output: str, boundary: str):
 )
 @click.option(
     '--aoi',
-    type=str,
+    type=INPUT_FILE,
     required=True,
     callback=validate_aoi_file,
     help='Path to AOI boundary file (GeoJSON format)'
 )
 @click.option(
     '--output',
-    type=str,
+    type=OUTPUT_FILE,
     default='strategy_comparison.png',
     show_default=True,
     help='Output PNG file path for the comparison plot'
@@ -933,8 +1175,8 @@ def compare(
     grid_spacing: float,
     road_spacing: float,
     network_type: str,
-    aoi: str,
-    output: str,
+    aoi: Path,
+    output: Path,
     include_road: bool
 ):
     """
@@ -950,23 +1192,16 @@ def compare(
         $ ssp visualize compare --grid-spacing 50 --road-spacing 100 --include-road --aoi hk.geojson --output hk_comparison.png
     """
     try:
+        # Use the non-interactive backend; the figure is only written to file
+        os.environ.setdefault("MPLBACKEND", "Agg")
         from ssp import compare_strategies, GridSampling, RoadNetworkSampling, SamplingConfig
 
         info_msg(f"Loading AOI from: {aoi}")
 
-        # Read AOI
-        aoi_gdf = gpd.read_file(aoi)
-
-        # Extract boundary
-        if len(aoi_gdf) == 1:
-            boundary = aoi_gdf.geometry.iloc[0]
-        else:
-            boundary = aoi_gdf.unary_union_all()
-
-        if not isinstance(boundary, Polygon):
-            boundary = boundary.convex_hull
+        # Read AOI in the strategies' (default) CRS
+        boundary = _load_boundary(aoi, SamplingConfig().crs)
 
-        info_msg(f"Boundary area: {boundary.area:.2f} square degrees")
+        info_msg(f"Boundary area: {boundary.area:.2f} {_area_unit(SamplingConfig().crs)}")
 
         # Create strategies
         strategies = {
@@ -40,50 +40,62 @@ Example usage:
     ... )
 """
 
-from ssp.metadata.models import (
-    SamplingMetadata,
-    SamplingStrategyType,
-    BoundaryMetadata,
-    SamplingParametersMetadata,
-    ExecutionMetadata,
-    DataSourceMetadata,
-    ResultsMetadata
-)
+import importlib
+from typing import Any, List
 
-from ssp.metadata.serializer import (
-    MetadataSerializer,
-    MetadataBatchSerializer
-)
+# Public names per submodule, resolved lazily (PEP 562): the exporter and
+# serializer pull in GeoPandas and PyYAML, which callers that only need the
+# models should not pay for.
+_EXPORTS = {
+    'ssp.metadata.models': (
+        'SamplingMetadata',
+        'SamplingStrategyType',
+        'BoundaryMetadata',
+        'SamplingParametersMetadata',
+        'ExecutionMetadata',
+        'DataSourceMetadata',
+        'ResultsMetadata',
+        'batched_timestamp',
+    ),
+    'ssp.metadata.serializer': (
+        'MetadataSerializer',
+        'MetadataBatchSerializer',
+    ),
+    'ssp.metadata.validator': (
+        'MetadataValidator',
+        'MetadataValidationError',
+        'quick_validate',
+    ),
+    'ssp.metadata.exporter': (
+        'MetadataExporter',
+    ),
+}
 
-from ssp.metadata.validator import (
-    MetadataValidator,
-    MetadataValidationError,
-    quick_validate
-)
+# Public name -> defining module, and the submodule names themselves
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+_SUBMODULES = {module.rpartition('.')[2] for module in _EXPORTS}
 
-from ssp.metadata.exporter import (
-    MetadataExporter
-)
 
-__all__ = [
-    # Models
-    'SamplingMetadata',
-    'SamplingStrategyType',
-    'BoundaryMetadata',
-    'SamplingParametersMetadata',
-    'ExecutionMetadata',
-    'DataSourceMetadata',
-    'ResultsMetadata',
+def __getattr__(name: str) -> Any:
+    """Import the defining module on first access and bind all its exports."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
 
-    # Serializer
-    'MetadataSerializer',
-    'MetadataBatchSerializer',
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
 
-    # Validator
-    'MetadataValidator',
-    'MetadataValidationError',
-    'quick_validate',
+    module = importlib.import_module(module_name)
+    globals().update({n: getattr(module, n) for n in _EXPORTS[module_name]})
+    return globals()[name]
 
-    # Exporter
-    'MetadataExporter',
-]
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in ``dir(ssp.metadata)``."""
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
@@ -8,12 +8,83 @@ This module provides structured metadata classes that capture all aspects
 of the sampling process including configuration, execution, and results.
 """
 
-from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from enum import Enum
 import sys
 import platform
+from weakref import WeakKeyDictionary
+
+from ssp import __version__ as _SSP_VERSION
+
+# Execution environment details are fixed for the life of the process, so
+# they are looked up once rather than on every create_from_strategy() call
+_PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+_OS_INFO = f"{platform.system()} {platform.release()}"
+_HOSTNAME = platform.node()
+
+# Metrics per strategy object, stored with the sample points they were
+# computed from so that calling generate() again invalidates them. Entries
+# go away with the strategy.
+_COVERAGE_CACHE: "WeakKeyDictionary[Any, tuple]" = WeakKeyDictionary()
+_ROAD_METRICS_CACHE: "WeakKeyDictionary[Any, tuple]" = WeakKeyDictionary()
+
+# Shared created_at timestamp set by batched_timestamp()
+_BATCH_TIMESTAMP: ContextVar[Optional[str]] = ContextVar('_BATCH_TIMESTAMP', default=None)
+
+
+def _default_created_at() -> str:
+    """Return the batch timestamp if one is active, else the current time."""
+    return _BATCH_TIMESTAMP.get() or datetime.now().isoformat()
+
+
+@contextmanager
+def batched_timestamp(timestamp: Optional[str] = None) -> Iterator[str]:
+    """
+    Give every SamplingMetadata created in the block the same created_at.
+
+    Saves a clock read and ISO formatting per record when many records
+    are built at once, e.g. one per chunk of a large study area. Records
+    that pass created_at explicitly are unaffected.
+
+    Args:
+        timestamp: ISO 8601 timestamp to use. Defaults to the time the
+                  block is entered.
+
+    Yields:
+        The shared timestamp.
+
+    Example:
+        >>> with batched_timestamp():
+        ...     records = [SamplingMetadata(pid, name, desc) for pid in ids]
+    """
+    timestamp = timestamp or datetime.now().isoformat()
+    token = _BATCH_TIMESTAMP.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _BATCH_TIMESTAMP.reset(token)
+
+
+class _CompactPickle:
+    """
+    Pickle support for the slotted metadata records.
+
+    Slotted instances otherwise pickle their state as a name-to-value
+    dict; a tuple of field values in declaration order is about half
+    the size for a single record.
+    """
+    __slots__ = ()
+
+    def __reduce__(self):
+        cls = type(self)
+        return (
+            _reconstruct,
+            (cls, tuple(getattr(self, name) for name in _field_names(cls)))
+        )
 
 
 class SamplingStrategyType(Enum):
@@ -24,8 +95,8 @@ class SamplingStrategyType(Enum):
     STRATIFIED_RANDOM = "stratified_random"
 
 
-@dataclass
-class BoundaryMetadata:
+@dataclass(slots=True)
+class BoundaryMetadata(_CompactPickle):
     """
     Metadata for the area of interest (AOI) boundary.
 
@@ -45,8 +116,8 @@ class BoundaryMetadata:
     description: Optional[str] = None
 
 
-@dataclass
-class SamplingParametersMetadata:
+@dataclass(slots=True)
+class SamplingParametersMetadata(_CompactPickle):
     """
     Metadata for sampling parameters.
 
@@ -64,8 +135,8 @@ class SamplingParametersMetadata:
     additional_params: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
-class ExecutionMetadata:
+@dataclass(slots=True)
+class ExecutionMetadata(_CompactPickle):
     """
     Metadata for sampling execution environment.
 
@@ -87,8 +158,8 @@ class ExecutionMetadata:
     runtime_seconds: Optional[float] = None
 
 
-@dataclass
-class DataSourceMetadata:
+@dataclass(slots=True)
+class DataSourceMetadata(_CompactPickle):
     """
     Metadata for external data sources used.
 
@@ -106,8 +177,8 @@ class DataSourceMetadata:
     quality_notes: Optional[str] = None
 
 
-@dataclass
-class ResultsMetadata:
+@dataclass(slots=True)
+class ResultsMetadata(_CompactPickle):
     """
     Metadata for sampling results.
 
@@ -123,8 +194,8 @@ class ResultsMetadata:
     strategy_metrics: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
-class SamplingMetadata:
+@dataclass(slots=True)
+class SamplingMetadata(_CompactPickle):
     """
     Complete metadata for a sampling protocol.
 
@@ -162,7 +233,7 @@ class SamplingMetadata:
     protocol_name: str
     description: str
     version: str = "1.0.0"
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_default_created_at)
     boundary: Optional[BoundaryMetadata] = None
     parameters: Optional[SamplingParametersMetadata] = None
     execution: Optional[ExecutionMetadata] = None
@@ -178,23 +249,23 @@ class SamplingMetadata:
         """
         Convert metadata to dictionary for serialization.
 
+        Unlike ``dataclasses.asdict`` this does not deep-copy field values:
+        the returned dicts are new, but lists and dicts such as ``tags`` or
+        ``custom_fields`` are shared with this instance.
+
         Returns:
             Dictionary representation of all metadata fields.
         """
-        data = asdict(self)
+        data = _fast_asdict(self)
 
         # Convert dataclass objects to dicts
-        if self.boundary:
-            data['boundary'] = asdict(self.boundary)
-        if self.parameters:
-            data['parameters'] = asdict(self.parameters)
-        if self.execution:
-            data['execution'] = asdict(self.execution)
-        if self.results:
-            data['results'] = asdict(self.results)
+        for name in _NESTED_FIELDS:
+            value = data[name]
+            if value is not None:
+                data[name] = _fast_asdict(value)
 
         # Convert data sources
-        data['data_sources'] = [asdict(ds) for ds in self.data_sources]
+        data['data_sources'] = [_fast_asdict(ds) for ds in self.data_sources]
 
         return data
 
@@ -212,38 +283,37 @@ class SamplingMetadata:
         Raises:
             ValueError: If required fields are missing.
         """
-        required_fields = ['protocol_id', 'protocol_name', 'description']
-        missing = [f for f in required_fields if f not in data]
-        if missing:
+        # One C-level set comparison on the happy path
+        if not data.keys() >= _REQUIRED_KEYS:
+            missing = [f for f in _REQUIRED_FIELDS if f not in data]
             raise ValueError(f"Missing required fields: {missing}")
 
-        # Create data objects from nested dicts
-        kwargs = {}
+        # Copy plain fields present in data; absent ones keep their defaults
+        kwargs = {key: data[key] for key in _PLAIN_FIELDS if key in data}
 
-        if 'boundary' in data and data['boundary']:
-            kwargs['boundary'] = BoundaryMetadata(**data['boundary'])
+        # Create data objects from nested dicts, one lookup per key
+        boundary = data.get('boundary')
+        if boundary:
+            kwargs['boundary'] = BoundaryMetadata(**boundary)
 
-        if 'parameters' in data and data['parameters']:
-            kwargs['parameters'] = SamplingParametersMetadata(**data['parameters'])
+        parameters = data.get('parameters')
+        if parameters:
+            kwargs['parameters'] = SamplingParametersMetadata(**parameters)
 
-        if 'execution' in data and data['execution']:
-            kwargs['execution'] = ExecutionMetadata(**data['execution'])
+        execution = data.get('execution')
+        if execution:
+            kwargs['execution'] = ExecutionMetadata(**execution)
 
-        if 'results' in data and data['results']:
-            kwargs['results'] = ResultsMetadata(**data['results'])
+        results = data.get('results')
+        if results:
+            kwargs['results'] = ResultsMetadata(**results)
 
-        if 'data_sources' in data and data['data_sources']:
+        data_sources = data.get('data_sources')
+        if data_sources:
             kwargs['data_sources'] = [
-                DataSourceMetadata(**ds) for ds in data['data_sources']
+                DataSourceMetadata(**ds) for ds in data_sources
             ]
 
-        # Copy other fields
-        for key in ['protocol_id', 'protocol_name', 'description', 'version',
-                    'created_at', 'custom_fields', 'tags', 'author',
-                    'institution', 'contact']:
-            if key in data:
-                kwargs[key] = data[key]
-
         return cls(**kwargs)
 
     @classmethod
@@ -275,16 +345,6 @@ class SamplingMetadata:
         Returns:
             SamplingMetadata instance populated with strategy information.
         """
-        from shapely.geometry import box
-        import ssp
-
-        # Get strategy info
-        try:
-            import ssp
-            ssp_version = ssp.__version__
-        except (ImportError, AttributeError):
-            ssp_version = "0.1.0"
-
         # Create boundary metadata
         boundary_meta = BoundaryMetadata(
             geometry_wkt=boundary.wkt,
@@ -295,12 +355,102 @@ class SamplingMetadata:
             description=description
         )
 
+        return cls._from_strategy_parts(
+            strategy, boundary_meta, protocol_name, description,
+            author, institution, contact
+        )
+
+    @classmethod
+    def create_from_strategies_bulk(
+        cls,
+        strategies: List[Any],
+        boundaries: List[Any],
+        protocol_names: List[str],
+        description: str,
+        author: Optional[str] = None,
+        institution: Optional[str] = None,
+        contact: Optional[str] = None
+    ) -> List['SamplingMetadata']:
+        """
+        Create metadata for many strategy/boundary pairs at once.
+
+        Equivalent to calling create_from_strategy() for each pair, but the
+        boundary WKT, area and bounds are computed with one vectorized
+        Shapely call each instead of several GEOS calls per polygon. Useful
+        for the many sub-boundaries produced by SpatialChunker.
+
+        Args:
+            strategies: SamplingStrategy instances, one per boundary
+            boundaries: Shapely Polygon boundaries used for sampling
+            protocol_names: Protocol name for each boundary
+            description: Description shared by all protocols
+            author: Optional author name
+            institution: Optional institution name
+            contact: Optional contact email
+
+        Returns:
+            List of SamplingMetadata instances, in input order.
+
+        Raises:
+            ValueError: If the input sequences differ in length.
+        """
+        import numpy as np
+        import shapely
+
+        if not len(strategies) == len(boundaries) == len(protocol_names):
+            raise ValueError(
+                "strategies, boundaries and protocol_names must have the same "
+                f"length, got {len(strategies)}, {len(boundaries)} and "
+                f"{len(protocol_names)}"
+            )
+
+        geometries = np.empty(len(boundaries), dtype=object)
+        geometries[:] = boundaries
+
+        # rounding_precision=-1 matches Polygon.wkt exactly
+        wkts = shapely.to_wkt(geometries, rounding_precision=-1).tolist()
+        areas = shapely.area(geometries).tolist()
+        bounds = shapely.bounds(geometries).tolist()
+
+        return [
+            cls._from_strategy_parts(
+                strategy,
+                BoundaryMetadata(
+                    geometry_wkt=wkt,
+                    crs=strategy.config.crs,
+                    area_km2=round(area / 1e6, 4),
+                    bounds=tuple(bbox),
+                    source="user_provided",
+                    description=description
+                ),
+                protocol_name, description, author, institution, contact
+            )
+            for strategy, wkt, area, bbox, protocol_name
+            in zip(strategies, wkts, areas, bounds, protocol_names)
+        ]
+
+    @classmethod
+    def _from_strategy_parts(
+        cls,
+        strategy: Any,
+        boundary_meta: BoundaryMetadata,
+        protocol_name: str,
+        description: str,
+        author: Optional[str],
+        institution: Optional[str],
+        contact: Optional[str]
+    ) -> 'SamplingMetadata':
+        """Build metadata for a strategy whose boundary metadata is ready."""
+        # Road-network settings, read once; grid strategies have neither
+        network_type = getattr(strategy, 'network_type', None)
+        road_types = getattr(strategy, 'road_types', None)
+
         # Create parameters metadata
         additional_params = {}
-        if hasattr(strategy, 'network_type'):
-            additional_params['network_type'] = strategy.network_type
-        if hasattr(strategy, 'road_types') and strategy.road_types:
-            additional_params['road_types'] = list(strategy.road_types)
+        if network_type is not None:
+            additional_params['network_type'] = network_type
+        if road_types:
+            additional_params['road_types'] = list(road_types)
 
         params_meta = SamplingParametersMetadata(
             spacing=strategy.config.spacing,
@@ -319,16 +469,16 @@ class SamplingMetadata:
 
         exec_meta = ExecutionMetadata(
             timestamp=timestamp_str,
-            python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-            ssp_version=ssp_version,
-            os_info=f"{platform.system()} {platform.release()}",
-            hostname=platform.node(),
+            python_version=_PYTHON_VERSION,
+            ssp_version=_SSP_VERSION,
+            os_info=_OS_INFO,
+            hostname=_HOSTNAME,
             runtime_seconds=None  # Would need to be measured externally
         )
 
         # Create data source metadata if road network
         data_sources = []
-        if hasattr(strategy, 'network_type'):
+        if network_type is not None:
             ds_meta = DataSourceMetadata(
                 source_type="osm",
                 source_url="https://www.openstreetmap.org/",
@@ -342,12 +492,17 @@ class SamplingMetadata:
         results_meta = None
         if strategy._sample_points is not None:
             try:
-                coverage = strategy.calculate_coverage_metrics()
+                coverage = _cached_metrics(
+                    _COVERAGE_CACHE, strategy, strategy.calculate_coverage_metrics
+                )
                 strategy_metrics = {}
 
                 # Add strategy-specific metrics
                 if hasattr(strategy, 'calculate_road_network_metrics'):
-                    strategy_metrics = strategy.calculate_road_network_metrics()
+                    strategy_metrics = _cached_metrics(
+                        _ROAD_METRICS_CACHE, strategy,
+                        strategy.calculate_road_network_metrics
+                    )
 
                 results_meta = ResultsMetadata(
                     n_points=len(strategy._sample_points),
@@ -364,8 +519,14 @@ class SamplingMetadata:
                     strategy_metrics={}
                 )
 
-        # Generate protocol ID from name and timestamp
-        protocol_id = f"{protocol_name.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Generate protocol ID from name and timestamp (integer formatting
+        # instead of strftime, which goes through the C locale machinery)
+        now = datetime.now()
+        protocol_id = (
+            f"{protocol_name.lower().replace(' ', '_')}_"
+            f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        )
 
         return cls(
             protocol_id=protocol_id,
@@ -389,3 +550,77 @@ class SamplingMetadata:
             f"SamplingMetadata(id='{self.protocol_id}', "
             f"name='{self.protocol_name}', version='{self.version}')"
         )
+
+
+# Field names per metadata dataclass, resolved once instead of on every
+# to_dict() call
+_FIELDS = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (
+        BoundaryMetadata,
+        SamplingParametersMetadata,
+        ExecutionMetadata,
+        DataSourceMetadata,
+        ResultsMetadata,
+        SamplingMetadata,
+    )
+}
+
+# SamplingMetadata fields holding a single nested metadata object
+_NESTED_FIELDS = ('boundary', 'parameters', 'execution', 'results')
+
+# SamplingMetadata fields without a default, in declaration order
+_REQUIRED_FIELDS = tuple(
+    f.name for f in fields(SamplingMetadata)
+    if f.default is MISSING and f.default_factory is MISSING
+)
+_REQUIRED_KEYS = frozenset(_REQUIRED_FIELDS)
+
+# SamplingMetadata fields that from_dict copies through unchanged
+_PLAIN_FIELDS = tuple(
+    name for name in _FIELDS[SamplingMetadata]
+    if name not in _NESTED_FIELDS and name != 'data_sources'
+)
+
+
+def _cached_metrics(cache: WeakKeyDictionary, strategy: Any, compute: Any) -> Dict[str, Any]:
+    """
+    Return metrics for strategy's current sample points, computing them once.
+
+    Args:
+        cache: Per-strategy cache to look up and fill
+        strategy: Sampling strategy the metrics belong to
+        compute: Zero-argument callable calculating the metrics
+
+    Returns:
+        A fresh copy of the metrics dictionary, so records built from the
+        same strategy do not share it.
+    """
+    points = strategy._sample_points
+    entry = cache.get(strategy)
+    if entry is None or entry[0] is not points:
+        entry = (points, compute())
+        cache[strategy] = entry
+    return dict(entry[1])
+
+
+def _field_names(cls: type) -> tuple:
+    """Return the cached field names of a metadata dataclass or subclass."""
+    try:
+        return _FIELDS[cls]
+    except KeyError:
+        names = _FIELDS[cls] = tuple(f.name for f in fields(cls))
+        return names
+
+
+def _fast_asdict(obj: Any) -> Dict[str, Any]:
+    """Shallow dataclass-to-dict conversion using the cached field names."""
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
+def _reconstruct(cls: type, state: tuple) -> Any:
+    """Rebuild a metadata record pickled by _CompactPickle.__reduce__."""
+    obj = object.__new__(cls)
+    for name, value in zip(_field_names(cls), state):
+        object.__setattr__(obj, name, value)
+    return obj
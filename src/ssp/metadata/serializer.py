@@ -15,6 +15,21 @@ from pathlib import Path
 
 from ssp.metadata.models import SamplingMetadata
 
+# orjson is optional: it encodes the metadata dataclasses directly to bytes
+# in C, without the intermediate to_dict() tree
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode values orjson has no native support for, e.g. pandas Timestamps."""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 
 class MetadataSerializer:
     """
@@ -67,20 +82,49 @@ class MetadataSerializer:
             IOError: If filepath cannot be written.
             ValueError: If metadata is invalid.
         """
-        data = metadata.to_dict()
-
-        if pretty:
-            json_str = json.dumps(data, indent=2, ensure_ascii=False)
-        else:
-            json_str = json.dumps(data, ensure_ascii=False)
+        json_bytes = self.to_json_bytes(metadata, pretty=pretty)
 
         if filepath:
             try:
-                Path(filepath).write_text(json_str, encoding='utf-8')
+                Path(filepath).write_bytes(json_bytes)
             except Exception as e:
                 raise IOError(f"Failed to write JSON to {filepath}: {e}")
         else:
-            return json_str
+            return json_bytes.decode('utf-8')
+
+    def to_json_bytes(
+        self,
+        metadata: SamplingMetadata,
+        pretty: bool = True
+    ) -> bytes:
+        """
+        Serialize metadata to UTF-8 encoded JSON.
+
+        Uses orjson when it is installed, falling back to the standard
+        library for values orjson cannot encode.
+
+        Args:
+            metadata: SamplingMetadata instance to serialize.
+            pretty: If True, formats JSON with indentation.
+
+        Returns:
+            UTF-8 encoded JSON document.
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(metadata, option=option)
+            except TypeError:
+                pass
+
+        json_str = json.dumps(
+            metadata.to_dict(),
+            indent=2 if pretty else None,
+            ensure_ascii=False
+        )
+        return json_str.encode('utf-8')
 
     def from_json(self, source: str) -> SamplingMetadata:
         """
@@ -97,18 +141,16 @@ class MetadataSerializer:
             ValueError: If JSON is invalid or metadata is malformed.
         """
         try:
-            # Check if source is a file path or JSON string
-            if Path(source).exists():
-                json_str = Path(source).read_text(encoding='utf-8')
-            else:
-                json_str = source
+            # Try source as a file path first; one open() instead of stat+open
+            json_doc = Path(source).read_bytes()
         except (OSError, IOError):
             # Not a file path, treat as JSON string
-            json_str = source
+            json_doc = source
 
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_doc) if ORJSON_AVAILABLE else json.loads(json_doc)
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise ValueError(f"Invalid JSON: {e}")
 
         return SamplingMetadata.from_dict(data)
@@ -169,11 +211,8 @@ class MetadataSerializer:
             ValueError: If YAML is invalid or metadata is malformed.
         """
         try:
-            # Check if source is a file path or YAML string
-            if Path(source).exists():
-                yaml_str = Path(source).read_text(encoding='utf-8')
-            else:
-                yaml_str = source
+            # Try source as a file path first; one open() instead of stat+open
+            yaml_str = Path(source).read_text(encoding='utf-8')
         except (OSError, IOError):
             # Not a file path, treat as YAML string
             yaml_str = source
@@ -222,6 +261,29 @@ class MetadataSerializer:
                 f"points_gdf must be GeoDataFrame, got {type(points_gdf)}"
             )
 
+        if ORJSON_AVAILABLE:
+            # Features come from one vectorized to_geo_dict() call and orjson
+            # encodes the metadata dataclass itself, skipping to_dict()
+            collection = {
+                'type': 'FeatureCollection',
+                'properties': metadata,
+                'features': points_gdf.to_geo_dict(drop_id=True)['features'],
+            }
+            try:
+                json_bytes = orjson.dumps(
+                    collection,
+                    default=_orjson_default,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )
+            except TypeError:
+                pass
+            else:
+                try:
+                    Path(filepath).write_bytes(json_bytes)
+                except Exception as e:
+                    raise IOError(f"Failed to write GeoJSON to {filepath}: {e}")
+                return
+
         # Convert points to features
         features = []
         for _, row in points_gdf.iterrows():
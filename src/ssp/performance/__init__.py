@@ -36,62 +36,66 @@ Example usage:
     ...     cache.put("my_key", result)
 """
 
-from ssp.performance.parallel import (
-    ParallelProcessor,
-    parallelize_sampling,
-    get_optimal_n_workers
-)
+import importlib
+from typing import Any, List
 
-from ssp.performance.chunking import (
-    SpatialChunker,
-    TemporalChunker,
-    StreamingGeoDataFrameProcessor,
-    auto_chunk_size
-)
+# Public names per submodule, resolved lazily (PEP 562) so that importing
+# one tool does not load tqdm, multiprocessing and GeoPandas for all of them.
+_EXPORTS = {
+    'ssp.performance.parallel': (
+        'ParallelProcessor',
+        'parallelize_sampling',
+        'get_optimal_n_workers',
+    ),
+    'ssp.performance.chunking': (
+        'SpatialChunker',
+        'TemporalChunker',
+        'StreamingGeoDataFrameProcessor',
+        'auto_chunk_size',
+    ),
+    'ssp.performance.cache': (
+        'DiskCache',
+        'Memoized',
+        'get_osm_cache',
+        'cached_osm_download',
+        'clear_all_caches',
+    ),
+    'ssp.performance.progress': (
+        'ProgressTracker',
+        'progress_context',
+        'track_progress',
+        'track_parallel_progress',
+        'SamplingProgressTracker',
+        'require_tqdm',
+        'TQDM_AVAILABLE',
+    ),
+}
 
-from ssp.performance.cache import (
-    DiskCache,
-    Memoized,
-    get_osm_cache,
-    cached_osm_download,
-    clear_all_caches
-)
+# Public name -> defining module, and the submodule names themselves
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+_SUBMODULES = {module.rpartition('.')[2] for module in _EXPORTS}
 
-from ssp.performance.progress import (
-    ProgressTracker,
-    progress_context,
-    track_progress,
-    track_parallel_progress,
-    SamplingProgressTracker,
-    require_tqdm,
-    TQDM_AVAILABLE
-)
 
-__all__ = [
-    # Parallel processing
-    'ParallelProcessor',
-    'parallelize_sampling',
-    'get_optimal_n_workers',
+def __getattr__(name: str) -> Any:
+    """Import the defining module on first access and bind all its exports."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
 
-    # Chunking
-    'SpatialChunker',
-    'TemporalChunker',
-    'StreamingGeoDataFrameProcessor',
-    'auto_chunk_size',
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
 
-    # Caching
-    'DiskCache',
-    'Memoized',
-    'get_osm_cache',
-    'cached_osm_download',
-    'clear_all_caches',
+    module = importlib.import_module(module_name)
+    globals().update({n: getattr(module, n) for n in _EXPORTS[module_name]})
+    return globals()[name]
 
-    # Progress tracking
-    'ProgressTracker',
-    'progress_context',
-    'track_progress',
-    'track_parallel_progress',
-    'SamplingProgressTracker',
-    'require_tqdm',
-    'TQDM_AVAILABLE',
-]
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in ``dir(ssp.performance)``."""
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
@@ -14,11 +14,162 @@ Features:
 import hashlib
 import pickle
 import json
-from typing import Optional, Any, Dict, Callable
+import os
+import warnings
+from typing import Optional, Any, BinaryIO, Dict, List, Callable
 from pathlib import Path
-from datetime import datetime, timedelta
+from collections import OrderedDict
+import time
+from datetime import datetime
 import functools
-from threading import Lock
+from contextlib import contextmanager
+from threading import Condition, Lock, get_ident
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# orjson is optional: it speeds up the metadata snapshot and journal, which
+# are otherwise handled by the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# First byte of every cache file, naming the codec of the payload after it
+_FORMAT_MSGPACK = b'\x01'
+_FORMAT_PICKLE = b'\x02'
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode metadata as compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes written by _json_dumps() (or older json.dump)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Matches the two-hex-digit shard directories that hold cache files
+_SHARD_GLOB = "[0-9a-f][0-9a-f]/"
+
+
+def _is_shard_dir(path: Path) -> bool:
+    """Check whether path is a hash-prefix directory matched by _SHARD_GLOB."""
+    name = path.name
+    return len(name) == 2 and all(c in "0123456789abcdef" for c in name)
+
+# Write buffer for cache files; large values are streamed through it
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _dump(value: Any, f: BinaryIO) -> None:
+    """Serialize a value to f, preferring msgpack and falling back to pickle."""
+    if MSGPACK_AVAILABLE:
+        try:
+            # strict_types sends tuples and subclasses to pickle so they
+            # come back as the same type rather than as plain lists/dicts
+            payload = msgpack.packb(value, use_bin_type=True, strict_types=True)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        else:
+            f.write(_FORMAT_MSGPACK)
+            f.write(payload)
+            return
+    f.write(_FORMAT_PICKLE)
+    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load(f: BinaryIO) -> Any:
+    """Deserialize a value written by _dump()."""
+    header = f.read(1)
+    if header == _FORMAT_PICKLE:
+        return pickle.load(f)
+    if header == _FORMAT_MSGPACK:
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("Cache entry was written with msgpack, which is not installed")
+        return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+    raise ValueError(f"Unknown cache entry format: {header!r}")
+
+
+def _migrate_times(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert ISO-format times from older metadata to epoch seconds."""
+    if 'timestamp' in record:
+        record['ts'] = int(
+            datetime.fromisoformat(record.pop('timestamp')).timestamp()
+        )
+    if isinstance(record.get('last_access'), str):
+        record['last_access'] = int(
+            datetime.fromisoformat(record['last_access']).timestamp()
+        )
+    return record
+
+
+class _ReadWriteLock:
+    """
+    Readers-writer lock built on a Condition.
+
+    Any number of readers may hold the lock together; a writer holds it
+    alone. Waiting writers block new readers so they are not starved. The
+    write side is reentrant, and the writing thread may also take the read
+    side, so locked methods can call each other.
+    """
+
+    def __init__(self):
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        """Hold the lock shared for the duration of the block."""
+        if self._writer == get_ident():
+            yield
+            return
+        with self._cond:
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        """Hold the lock exclusively for the duration of the block."""
+        me = get_ident()
+        with self._cond:
+            if self._writer != me:
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._writers_waiting -= 1
+                self._writer = me
+            self._write_depth += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._write_depth -= 1
+                if not self._write_depth:
+                    self._writer = None
+                    self._cond.notify_all()
 
 
 class DiskCache:
@@ -40,11 +191,20 @@ class DiskCache:
         ...     cache.put("my_key", result)
     """
 
+    # Number of deferred access times that triggers a metadata write
+    _ACCESS_FLUSH_THRESHOLD = 64
+    # Journal size that triggers folding it into the metadata snapshot
+    _JOURNAL_MAX_RECORDS = 1024
+    _JOURNAL_MAX_BYTES = 1024 * 1024
+    # Number of key -> path lookups remembered
+    _PATH_MEMO_SIZE = 4096
+
     def __init__(
         self,
         cache_dir: str = ".ssp_cache",
         max_age_days: int = 7,
-        max_size_mb: int = 1024
+        max_size_mb: int = 1024,
+        durable: bool = False
     ):
         """
         Initialize disk cache.
@@ -53,40 +213,165 @@ class DiskCache:
             cache_dir: Directory to store cache files.
             max_age_days: Maximum age of cache files in days.
             max_size_mb: Maximum cache size in MB.
+            durable: If True, fsync each value before it replaces the
+                previous file. Writes are atomic either way; this only
+                guards against losing them to a power failure.
         """
         self.cache_dir = Path(cache_dir)
         self.max_age_days = max_age_days
         self.max_size_mb = max_size_mb
-        self.lock = Lock()
+        self.durable = durable
+        # Shared for lookups, exclusive for anything that changes the cache
+        self.lock = _ReadWriteLock()
+        # last_access bumps from get(), folded into metadata on the next write
+        self._pending_access: Dict[str, int] = {}
+        # Memoized key -> file path, reset whenever it fills up
+        self._paths: Dict[str, Path] = {}
 
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create metadata file
+        # Metadata is a JSON snapshot plus an append-only journal of the
+        # changes made since; the journal is folded into the snapshot once
+        # it grows past _JOURNAL_MAX_RECORDS or _JOURNAL_MAX_BYTES
         self.metadata_file = self.cache_dir / "cache_metadata.json"
+        self.journal_file = self.cache_dir / "cache_metadata.log"
+        self._journal_records = 0
+        self._journal_bytes = 0
+        # Ordered least to most recently used, so eviction pops from the front
         self.metadata = self._load_metadata()
+        self._total_size = sum(
+            meta['size_bytes'] for meta in self.metadata.values()
+        )
+
+        self._migrate_flat_files()
+
+    def _migrate_flat_files(self) -> None:
+        """Move entries from the old flat layout into shard directories."""
+        for flat_path in self.cache_dir.glob("*.cache"):
+            shard_dir = self.cache_dir / flat_path.name[:2]
+            shard_dir.mkdir(exist_ok=True)
+            os.replace(flat_path, shard_dir / flat_path.name)
 
-    def _load_metadata(self) -> Dict[str, Any]:
-        """Load cache metadata from disk."""
+    def _load_metadata(self) -> "OrderedDict[str, Any]":
+        """Load the metadata snapshot from disk and replay the journal."""
+        metadata: "OrderedDict[str, Any]" = OrderedDict()
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
+                snapshot = _json_loads(self.metadata_file.read_bytes())
+                for meta in snapshot.values():
+                    _migrate_times(meta)
+                # Snapshots are saved in LRU order, but older ones are not
+                metadata = OrderedDict(sorted(
+                    snapshot.items(), key=lambda item: item[1]['last_access']
+                ))
             except Exception:
-                return {}
-        return {}
+                metadata = OrderedDict()
+
+        if self.journal_file.exists():
+            data = self.journal_file.read_bytes()
+            self._journal_bytes = len(data)
+            for line in data.splitlines():
+                try:
+                    record = _json_loads(line)
+                except ValueError:
+                    # Torn final write from an interrupted process
+                    continue
+                self._replay(metadata, record)
+                self._journal_records += 1
+
+        return metadata
+
+    @staticmethod
+    def _replay(metadata: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """Apply one journal record to a metadata dict."""
+        op, key = record['op'], record.get('key')
+        if op == 'put':
+            metadata.pop(key, None)
+            metadata[key] = _migrate_times(record['meta'])
+        elif op == 'del':
+            metadata.pop(key, None)
+        elif op == 'access' and key in metadata:
+            metadata[key]['last_access'] = _migrate_times(record)['last_access']
+            metadata.move_to_end(key)
+
+    def _log(self, *records: Dict[str, Any]) -> None:
+        """Append records, and any deferred access times, to the journal."""
+        with self.lock.write():
+            records = self._drain_pending_access() + list(records)
+            if not records:
+                return
+
+            data = b''.join(_json_dumps(record) + b'\n' for record in records)
+            with open(self.journal_file, 'ab') as f:
+                f.write(data)
+
+            self._journal_records += len(records)
+            self._journal_bytes += len(data)
+            if (self._journal_records >= self._JOURNAL_MAX_RECORDS
+                    or self._journal_bytes >= self._JOURNAL_MAX_BYTES):
+                self._save_metadata()
 
     def _save_metadata(self) -> None:
-        """Save cache metadata to disk."""
-        with self.lock:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
+        """Write a metadata snapshot to disk and truncate the journal."""
+        with self.lock.write():
+            self._drain_pending_access()
+            tmp_file = self.metadata_file.with_suffix('.tmp')
+            tmp_file.write_bytes(_json_dumps(self.metadata))
+            os.replace(tmp_file, self.metadata_file)
+
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_records = 0
+            self._journal_bytes = 0
+
+    def _drain_pending_access(self) -> List[Dict[str, Any]]:
+        """Fold deferred access times into metadata (write lock held)."""
+        records = []
+        while self._pending_access:
+            key, last_access = self._pending_access.popitem()
+            if key in self.metadata:
+                self.metadata[key]['last_access'] = last_access
+                self.metadata.move_to_end(key)
+                records.append(
+                    {'op': 'access', 'key': key, 'last_access': last_access}
+                )
+        return records
+
+    def flush(self) -> None:
+        """
+        Persist access times recorded by get() since the last write.
+
+        Example:
+            >>> cache.flush()
+        """
+        if self._pending_access:
+            self._log()
+
+    def _forget(self, key: str) -> bool:
+        """Drop a key from metadata and journal it (write lock held)."""
+        meta = self.metadata.pop(key, None)
+        if meta is None:
+            return False
+        self._total_size -= meta['size_bytes']
+        self._log({'op': 'del', 'key': key})
+        return True
 
     def _get_cache_path(self, key: str) -> Path:
         """Get file path for cache key."""
-        # Hash key to create safe filename
-        key_hash = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.pkl"
+        try:
+            return self._paths[key]
+        except KeyError:
+            pass
+
+        # Hash key to create safe filename; a file name, not a security use
+        key_hash = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+        # Two-level layout (as in git's object store) keeps directories small
+        path = self.cache_dir / key_hash[:2] / f"{key_hash}.cache"
+
+        if len(self._paths) >= self._PATH_MEMO_SIZE:
+            self._paths.clear()
+        self._paths[key] = path
+        return path
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -103,42 +388,42 @@ class DiskCache:
             >>> if result is not None:
             ...     print("Cache hit!")
         """
-        cache_path = self._get_cache_path(key)
-
-        with self.lock:
-            # Check if file exists
-            if not cache_path.exists():
+        with self.lock.read():
+            # Metadata lists every stored key, so misses never touch the disk
+            meta = self.metadata.get(key)
+            if meta is None:
                 return None
 
             # Check if expired
-            if key in self.metadata:
-                cached_time = datetime.fromisoformat(
-                    self.metadata[key]['timestamp']
-                )
-                age = datetime.now() - cached_time
-
-                if age > timedelta(days=self.max_age_days):
-                    # Expired, delete file
-                    cache_path.unlink()
-                    del self.metadata[key]
-                    self._save_metadata()
-                    return None
-
-            # Load from disk
-            try:
-                with open(cache_path, 'rb') as f:
-                    value = pickle.load(f)
-
-                # Update access time
-                if key in self.metadata:
-                    self.metadata[key]['last_access'] = datetime.now().isoformat()
-                    self._save_metadata()
-
-                return value
-            except Exception:
-                # Cache corruption, delete file
-                cache_path.unlink()
-                return None
+            cache_path = self._get_cache_path(key)
+            expired = time.time() - meta['ts'] > self.max_age_days * 86400
+
+            if not expired:
+                # Load from disk; a vanished file counts as corrupted
+                try:
+                    with open(cache_path, 'rb') as f:
+                        value = _load(f)
+                except Exception:
+                    value = None
+                    corrupted = True
+                else:
+                    corrupted = False
+
+        if expired or corrupted:
+            # Expired or corrupted: only now take the lock exclusively, and
+            # leave the entry alone if a put() replaced it in the meantime
+            with self.lock.write():
+                if self.metadata.get(key) is meta:
+                    cache_path.unlink(missing_ok=True)
+                    self._forget(key)
+            return None
+
+        # Defer the access-time write; flushed with the next metadata save
+        self._pending_access[key] = int(time.time())
+        if len(self._pending_access) >= self._ACCESS_FLUSH_THRESHOLD:
+            self.flush()
+
+        return value
 
     def put(self, key: str, value: Any) -> None:
         """
@@ -153,20 +438,25 @@ class DiskCache:
         """
         cache_path = self._get_cache_path(key)
 
-        with self.lock:
+        with self.lock.write():
             # Save to disk
             try:
-                with open(cache_path, 'wb') as f:
-                    pickle.dump(value, f)
+                self._write_atomic(cache_path, value)
 
                 # Update metadata
+                self._pending_access.pop(key, None)
+                now = int(time.time())
+                old = self.metadata.pop(key, None)
+                if old is not None:
+                    self._total_size -= old['size_bytes']
                 self.metadata[key] = {
-                    'timestamp': datetime.now().isoformat(),
-                    'last_access': datetime.now().isoformat(),
+                    'ts': now,
+                    'last_access': now,
                     'size_bytes': cache_path.stat().st_size
                 }
 
-                self._save_metadata()
+                self._total_size += self.metadata[key]['size_bytes']
+                self._log({'op': 'put', 'key': key, 'meta': self.metadata[key]})
 
                 # Clean up if cache is too large
                 self._cleanup_if_needed()
@@ -175,6 +465,21 @@ class DiskCache:
                 # Failed to cache, continue without caching
                 warnings.warn(f"Failed to cache key '{key}': {e}")
 
+    def _write_atomic(self, cache_path: Path, value: Any) -> None:
+        """Write a value beside cache_path, then move it into place."""
+        tmp_path = cache_path.with_suffix('.tmp')
+        cache_path.parent.mkdir(exist_ok=True)
+        try:
+            with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                _dump(value, f)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def delete(self, key: str) -> bool:
         """
         Delete value from cache.
@@ -190,16 +495,11 @@ class DiskCache:
         """
         cache_path = self._get_cache_path(key)
 
-        with self.lock:
+        with self.lock.write():
             if cache_path.exists():
                 cache_path.unlink()
 
-            if key in self.metadata:
-                del self.metadata[key]
-                self._save_metadata()
-                return True
-
-            return False
+            return self._forget(key)
 
     def clear(self) -> None:
         """
@@ -208,43 +508,27 @@ class DiskCache:
         Example:
             >>> cache.clear()
         """
-        with self.lock:
-            # Delete all cache files
-            for cache_file in self.cache_dir.glob("*.pkl"):
-                cache_file.unlink()
+        with self.lock.write():
+            # Delete all cache files, including pre-header ".pkl" entries
+            # and temporaries left behind by an interrupted write
+            for pattern in ("*.cache", "*.pkl", "*.tmp"):
+                for cache_file in self.cache_dir.glob(pattern):
+                    cache_file.unlink()
+                for cache_file in self.cache_dir.glob(_SHARD_GLOB + pattern):
+                    cache_file.unlink()
 
             # Clear metadata
             self.metadata.clear()
+            self._total_size = 0
             self._save_metadata()
 
     def _cleanup_if_needed(self) -> None:
-        """Clean up old cache entries if cache is too large."""
-        # Calculate total cache size
-        total_size = sum(
-            meta['size_bytes']
-            for meta in self.metadata.values()
-        )
-
+        """Clean up least recently used entries if cache is too large."""
         max_size_bytes = self.max_size_mb * 1024 * 1024
 
-        if total_size > max_size_bytes:
-            # Sort by last access time
-            sorted_keys = sorted(
-                self.metadata.keys(),
-                key=lambda k: self.metadata[k]['last_access']
-            )
-
-            # Delete oldest entries until under limit
-            for key in sorted_keys:
-                self.delete(key)
-
-                total_size = sum(
-                    meta['size_bytes']
-                    for meta in self.metadata.values()
-                )
-
-                if total_size <= max_size_bytes:
-                    break
+        # Metadata is kept in LRU order, so the oldest entry is always first
+        while self.metadata and self._total_size > max_size_bytes:
+            self.delete(next(iter(self.metadata)))
 
     def cleanup_expired(self) -> int:
         """
@@ -257,17 +541,12 @@ class DiskCache:
             >>> n_removed = cache.cleanup_expired()
             >>> print(f"Removed {n_removed} expired entries")
         """
-        with self.lock:
+        with self.lock.write():
             removed = 0
-            now = datetime.now()
+            cutoff = time.time() - self.max_age_days * 86400
 
             for key in list(self.metadata.keys()):
-                cached_time = datetime.fromisoformat(
-                    self.metadata[key]['timestamp']
-                )
-                age = now - cached_time
-
-                if age > timedelta(days=self.max_age_days):
+                if self.metadata[key]['ts'] < cutoff:
                     self.delete(key)
                     removed += 1
 
@@ -285,13 +564,12 @@ class DiskCache:
             >>> print(f"Cache entries: {stats['n_entries']}")
             >>> print(f"Cache size: {stats['size_mb']} MB")
         """
-        total_size = sum(
-            meta['size_bytes']
-            for meta in self.metadata.values()
-        )
+        with self.lock.read():
+            total_size = self._total_size
+            n_entries = len(self.metadata)
 
         return {
-            'n_entries': len(self.metadata),
+            'n_entries': n_entries,
             'size_mb': round(total_size / (1024 * 1024), 2),
             'max_size_mb': self.max_size_mb,
             'max_age_days': self.max_age_days,
@@ -299,6 +577,10 @@ class DiskCache:
         }
 
 
+# Separates positional from keyword arguments in Memoized keys
+_KWARGS_MARK = object()
+
+
 class Memoized:
     """
     Memoization decorator for functions.
@@ -317,50 +599,87 @@ class Memoized:
         >>> result2 = expensive_function(1, 2)
     """
 
-    def __init__(self, func: Callable):
+    # Number of cache shards; must be a power of two
+    _N_SHARDS = 16
+
+    def __init__(
+        self,
+        func: Callable,
+        key_func: Optional[Callable[..., Any]] = None
+    ):
         """
         Initialize memoization.
 
         Args:
             func: Function to memoize.
+            key_func: Optional function called with the same arguments as
+                func that returns a hashable cache key. Useful for arrays
+                and frames, e.g. keyed on shape, dtype and a digest of the
+                data.
         """
         self.func = func
-        self.cache = {}
-        self.lock = Lock()
+        self.key_func = key_func
+        # Entries are spread over shards, each with its own lock, so misses
+        # on different keys can compute concurrently
+        self._shards = [{} for _ in range(self._N_SHARDS)]
+        self._locks = [Lock() for _ in range(self._N_SHARDS)]
 
     def __call__(self, *args, **kwargs):
         """Call function with caching."""
         # Create cache key from arguments
         key = self._make_key(args, kwargs)
-
-        with self.lock:
-            if key not in self.cache:
-                self.cache[key] = self.func(*args, **kwargs)
-
-            return self.cache[key]
-
-    def _make_key(self, args, kwargs) -> tuple:
+        try:
+            index = hash(key) & (self._N_SHARDS - 1)
+        except TypeError:
+            # Unhashable arguments (lists, dicts, ...) fall back to reprs
+            key = ('repr', str(args), str(sorted(kwargs.items())))
+            index = hash(key) & (self._N_SHARDS - 1)
+        shard = self._shards[index]
+
+        # Hits are a plain dict lookup; dict reads are atomic under the GIL
+        try:
+            return shard[key]
+        except KeyError:
+            pass
+
+        with self._locks[index]:
+            if key not in shard:
+                shard[key] = self.func(*args, **kwargs)
+
+            return shard[key]
+
+    def _make_key(self, args, kwargs) -> Any:
         """Create cache key from arguments."""
-        # For simplicity, convert to string
-        # In production, you'd want a more sophisticated approach
-        args_str = str(args)
-        kwargs_str = str(sorted(kwargs.items()))
-        return (args_str, kwargs_str)
+        if self.key_func is not None:
+            return self.key_func(*args, **kwargs)
+
+        # Flat tuple as in functools.lru_cache, typed so that f(1) and
+        # f(1.0) are cached separately
+        key = args
+        if kwargs:
+            items = tuple(sorted(kwargs.items()))
+            key += (_KWARGS_MARK,) + items
+            key += tuple(map(type, args)) + tuple(type(v) for _, v in items)
+        else:
+            key += tuple(map(type, args))
+        return key
 
     def cache_clear(self):
         """Clear cache."""
-        with self.lock:
-            self.cache.clear()
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
 
     def cache_info(self) -> Dict[str, int]:
         """Get cache information."""
         return {
-            'size': len(self.cache)
+            'size': sum(len(shard) for shard in self._shards)
         }
 
 
-# Global cache instance for OSM networks
+# Global cache instance for OSM networks, created on first use
 _osm_cache: Optional[DiskCache] = None
+_osm_cache_lock = Lock()
 
 
 def get_osm_cache() -> DiskCache:
@@ -379,12 +698,16 @@ def get_osm_cache() -> DiskCache:
     """
     global _osm_cache
 
+    # Double-checked so concurrent first calls still build a single
+    # instance, while later calls return without taking the lock
     if _osm_cache is None:
-        _osm_cache = DiskCache(
-            cache_dir=".ssp_cache/osm",
-            max_age_days=30,  # OSM data valid for 30 days
-            max_size_mb=512   # Max 512MB for OSM cache
-        )
+        with _osm_cache_lock:
+            if _osm_cache is None:
+                _osm_cache = DiskCache(
+                    cache_dir=".ssp_cache/osm",
+                    max_age_days=30,  # OSM data valid for 30 days
+                    max_size_mb=512   # Max 512MB for OSM cache
+                )
 
     return _osm_cache
 
@@ -445,10 +768,15 @@ def clear_all_caches() -> None:
     osm_cache = get_osm_cache()
     osm_cache.clear()
 
-    # Clear other caches if they exist
+    # Clear the default cache and any other caches under it. Two-hex-char
+    # directories are the default cache's own shards, not sub-caches
     cache_dir = Path(".ssp_cache")
     if cache_dir.exists():
+        DiskCache(cache_dir=str(cache_dir)).clear()
         for subcache_dir in cache_dir.iterdir():
-            if subcache_dir.is_dir():
-                cache = DiskCache(cache_dir=str(subcache_dir))
-                cache.clear()
+            if not subcache_dir.is_dir() or _is_shard_dir(subcache_dir):
+                continue
+            if subcache_dir.resolve() == osm_cache.cache_dir.resolve():
+                continue
+            cache = DiskCache(cache_dir=str(subcache_dir))
+            cache.clear()
@@ -11,9 +11,13 @@ Features:
 - Automatic chunk size optimization
 """
 
+import math
+from itertools import islice
 from typing import List, Tuple, Optional, Callable, Any, Iterator
 import numpy as np
-from shapely.geometry import Polygon, box
+import pandas as pd
+import shapely
+from shapely.geometry import Polygon
 import geopandas as gpd
 from pathlib import Path
 
@@ -87,39 +91,47 @@ class SpatialChunker:
         n_chunks_x = int(np.ceil(width / self.chunk_size_m))
         n_chunks_y = int(np.ceil(height / self.chunk_size_m))
 
-        chunk_count = 0
-
-        for i in range(n_chunks_x):
-            for j in range(n_chunks_y):
-                # Calculate chunk bounds with overlap
-                chunk_minx = minx + i * self.chunk_size_m - self.overlap_m
-                chunk_miny = miny + j * self.chunk_size_m - self.overlap_m
-                chunk_maxx = min(
-                    minx + (i + 1) * self.chunk_size_m + self.overlap_m,
-                    maxx
-                )
-                chunk_maxy = min(
-                    miny + (j + 1) * self.chunk_size_m + self.overlap_m,
-                    maxy
-                )
-
-                # Create chunk polygon
-                chunk = box(chunk_minx, chunk_miny, chunk_maxx, chunk_maxy)
-
-                # Intersect with boundary
-                chunk = chunk.intersection(boundary)
-
-                # Skip empty chunks
-                if chunk.is_empty or chunk.area == 0:
-                    continue
-
-                yield chunk
-
-                chunk_count += 1
-
-                # Stop if max chunks reached
-                if max_chunks and chunk_count >= max_chunks:
-                    return
+        # Chunk edges along each axis, with overlap; max edges are clipped
+        # to the boundary's extent
+        step = self.chunk_size_m
+        col_minx = minx + np.arange(n_chunks_x) * step - self.overlap_m
+        col_maxx = np.minimum(
+            minx + np.arange(1, n_chunks_x + 1) * step + self.overlap_m, maxx
+        )
+        row_miny = miny + np.arange(n_chunks_y) * step - self.overlap_m
+        row_maxy = np.minimum(
+            miny + np.arange(1, n_chunks_y + 1) * step + self.overlap_m, maxy
+        )
+
+        # Broadcast them into one (n_chunks_x, n_chunks_y, 4) bounds buffer,
+        # so the grid is ordered column by column (x outer, y inner)
+        bounds = np.empty((n_chunks_x, n_chunks_y, 4))
+        bounds[..., 0] = col_minx[:, None]
+        bounds[..., 1] = row_miny[None, :]
+        bounds[..., 2] = col_maxx[:, None]
+        bounds[..., 3] = row_maxy[None, :]
+        bounds = bounds.reshape(-1, 4)
+        cells = shapely.box(
+            bounds[:, 0], bounds[:, 1], bounds[:, 2], bounds[:, 3]
+        )
+
+        # Cells wholly inside the boundary are their own intersection; only
+        # cells crossing its edge are clipped, in one batched GEOS call
+        shapely.prepare(boundary)
+        inside = shapely.contains_properly(boundary, cells)
+        on_edge = shapely.intersects(boundary, cells) & ~inside
+        cells[on_edge] = shapely.intersection(cells[on_edge], boundary)
+
+        # Skip empty chunks
+        keep = (inside | on_edge) & ~shapely.is_empty(cells)
+        keep[keep] = shapely.area(cells[keep]) > 0
+        chunks = cells[keep]
+
+        # Stop if max chunks reached
+        if max_chunks:
+            chunks = chunks[:max_chunks]
+
+        yield from chunks
 
     def estimate_chunk_count(self, boundary: Polygon) -> int:
         """
@@ -211,8 +223,9 @@ class TemporalChunker:
 
     def chunk_generator(
         self,
-        generator: Iterator[Any]
-    ) -> Iterator[List[Any]]:
+        generator: Iterator[Any],
+        dtype: Optional[Any] = None
+    ) -> Iterator[Any]:
         """
         Chunk items from a generator.
 
@@ -220,9 +233,11 @@ class TemporalChunker:
 
         Args:
             generator: Generator yielding items.
+            dtype: If given, numeric items are packed straight into NumPy
+                arrays of this dtype instead of lists.
 
         Yields:
-            Chunks of items.
+            Chunks of items, as lists or (with dtype) 1-D arrays.
 
         Example:
             >>> def read_large_file():
@@ -233,15 +248,19 @@ class TemporalChunker:
             >>> for chunk in chunker.chunk_generator(read_large_file()):
             ...     process(chunk)
         """
-        chunk = []
-        for item in generator:
-            chunk.append(item)
-            if len(chunk) >= self.chunk_size:
+        items = iter(generator)
+
+        if dtype is not None:
+            while True:
+                chunk = np.fromiter(islice(items, self.chunk_size), dtype=dtype)
+                if not len(chunk):
+                    return
                 yield chunk
-                chunk = []
 
-        # Yield remaining items
-        if chunk:
+        while True:
+            chunk = list(islice(items, self.chunk_size))
+            if not chunk:
+                return
             yield chunk
 
     def estimate_chunk_count(self, n_items: int) -> int:
@@ -278,11 +297,39 @@ class StreamingGeoDataFrameProcessor:
         """
         self.chunk_size = chunk_size
 
+    def _iter_processed(
+        self,
+        gdf: gpd.GeoDataFrame,
+        process_func: Callable[[gpd.GeoDataFrame], gpd.GeoDataFrame],
+        show_progress: bool,
+        copy_chunks: bool
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Yield process_func applied to each chunk of gdf in order."""
+        # Calculate total number of chunks
+        n_chunks = int(np.ceil(len(gdf) / self.chunk_size))
+
+        for i in range(n_chunks):
+            start_idx = i * self.chunk_size
+            end_idx = min((i + 1) * self.chunk_size, len(gdf))
+
+            # Extract chunk; a view is enough when process_func is pure
+            chunk = gdf.iloc[start_idx:end_idx]
+            if copy_chunks:
+                chunk = chunk.copy()
+
+            # Process chunk
+            yield process_func(chunk)
+
+            # Show progress
+            if show_progress:
+                print(f"Processed chunk {i + 1}/{n_chunks}")
+
     def process_large_gdf(
         self,
         gdf: gpd.GeoDataFrame,
         process_func: Callable[[gpd.GeoDataFrame], gpd.GeoDataFrame],
-        show_progress: bool = False
+        show_progress: bool = False,
+        copy_chunks: bool = True
     ) -> gpd.GeoDataFrame:
         """
         Process large GeoDataFrame in chunks.
@@ -291,9 +338,14 @@ class StreamingGeoDataFrameProcessor:
             gdf: Large GeoDataFrame to process.
             process_func: Function to apply to each chunk.
             show_progress: If True, shows progress.
+            copy_chunks: If False, process_func receives slices of gdf
+                rather than copies. Only safe if it does not modify them.
 
         Returns:
-            Processed GeoDataFrame.
+            Processed GeoDataFrame with a fresh RangeIndex. Results of
+            process_func that still carry the geometry column come back
+            as a GeoDataFrame in gdf's CRS even if they were plain
+            DataFrames.
 
         Example:
             >>> def densify_points(chunk):
@@ -305,31 +357,75 @@ class StreamingGeoDataFrameProcessor:
             ...     process_func=densify_points
             ... )
         """
-        results = []
+        results = list(
+            self._iter_processed(gdf, process_func, show_progress, copy_chunks)
+        )
 
-        # Calculate total number of chunks
-        n_chunks = int(np.ceil(len(gdf) / self.chunk_size))
+        # Combine results
+        if not results:
+            return gdf.iloc[0:0].reset_index(drop=True)  # Empty GeoDataFrame
 
-        for i in range(n_chunks):
-            start_idx = i * self.chunk_size
-            end_idx = min((i + 1) * self.chunk_size, len(gdf))
+        combined = pd.concat(results, ignore_index=True)
 
-            # Extract chunk
-            chunk = gdf.iloc[start_idx:end_idx].copy()
+        # pd.concat only returns a GeoDataFrame if the first chunk is one;
+        # restore it when process_func handed back plain DataFrames
+        geometry = gdf.geometry.name
+        if not isinstance(combined, gpd.GeoDataFrame) and geometry in combined:
+            combined = gpd.GeoDataFrame(combined, geometry=geometry)
+            if combined.crs is None:
+                combined = combined.set_crs(gdf.crs)
 
-            # Process chunk
-            processed_chunk = process_func(chunk)
-            results.append(processed_chunk)
+        return combined
 
-            # Show progress
-            if show_progress:
-                print(f"Processed chunk {i + 1}/{n_chunks}")
+    def process_to_file(
+        self,
+        gdf: gpd.GeoDataFrame,
+        process_func: Callable[[gpd.GeoDataFrame], gpd.GeoDataFrame],
+        filepath: str,
+        driver: str = "GPKG",
+        show_progress: bool = False,
+        copy_chunks: bool = True
+    ) -> Path:
+        """
+        Process large GeoDataFrame in chunks, appending each to a file.
 
-        # Combine results
-        if results:
-            return gpd.GeoDataFrame.pd.concat(results)
-        else:
-            return gdf.iloc[0:0]  # Empty GeoDataFrame
+        Unlike process_large_gdf(), the processed chunks are never held
+        in memory together.
+
+        Args:
+            gdf: Large GeoDataFrame to process.
+            process_func: Function to apply to each chunk.
+            filepath: Output file path. Overwritten if it exists.
+            driver: OGR driver that supports appending (e.g. "GPKG").
+            show_progress: If True, shows progress.
+            copy_chunks: If False, process_func receives slices of gdf
+                rather than copies. Only safe if it does not modify them.
+
+        Returns:
+            Path of the written file.
+
+        Example:
+            >>> processor = StreamingGeoDataFrameProcessor(chunk_size=10000)
+            >>> processor.process_to_file(
+            ...     large_gdf,
+            ...     process_func=lambda chunk: chunk,
+            ...     filepath="processed.gpkg"
+            ... )
+        """
+        filepath = Path(filepath)
+        mode = "w"
+
+        for processed_chunk in self._iter_processed(
+            gdf, process_func, show_progress, copy_chunks
+        ):
+            processed_chunk.to_file(filepath, driver=driver, mode=mode)
+            mode = "a"
+
+        if mode == "w":
+            # Nothing to process; still leave an (empty) output behind
+            gdf.iloc[0:0].to_file(filepath, driver=driver)
+
+        return filepath
 
 
 def auto_chunk_size(
@@ -357,11 +453,20 @@ def auto_chunk_size(
         ... )
         >>> print(f"Optimal chunk size: {chunk_size}")
     """
+    # Unknown item size: fall back to the item count, within reason
+    if item_size_mb <= 0:
+        return min(max(n_items, 10), 10_000_000)
+
     # Calculate how many items fit in memory
-    max_items_in_memory = int(available_memory_mb / item_size_mb)
+    items_in_memory = available_memory_mb / item_size_mb
+
+    # Clearly everything fits in 80% of memory; this also covers an
+    # infinite ratio from a tiny item size, which cannot be floored
+    if (items_in_memory - 1) * 0.8 >= n_items:
+        return max(n_items, 10)
 
     # Use 80% of available memory
-    chunk_size = int(max_items_in_memory * 0.8)
+    chunk_size = math.floor(math.floor(items_in_memory) * 0.8)
 
     # But don't exceed total items
     chunk_size = min(chunk_size, n_items)
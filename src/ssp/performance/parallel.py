@@ -12,9 +12,188 @@ Features:
 """
 
 import multiprocessing as mp
-from typing import Callable, List, Any, Optional, Tuple
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import pickle
+import sys
+import time
+from functools import partial
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, List, Any, Optional, Tuple
 import warnings
+from contextlib import contextmanager
+
+
+# CPUs this process may run on, read once at import. The affinity mask
+# respects cgroup/taskset/Slurm limits, unlike the machine-wide count
+if hasattr(os, "sched_getaffinity"):
+    _CPU_COUNT = len(os.sched_getaffinity(0))
+else:
+    _CPU_COUNT = os.cpu_count() or 1
+
+# Keyword arguments shared by every task of a map() call, installed once per
+# worker process by _init_worker instead of being pickled with each batch
+_WORKER_KWARGS: dict = {}
+
+
+def _init_worker(kwargs: dict) -> None:
+    """Pool initializer: install the shared keyword arguments."""
+    _WORKER_KWARGS.clear()
+    _WORKER_KWARGS.update(kwargs)
+
+
+def _call_with_worker_kwargs(func: Callable, item: Any) -> Any:
+    """Call func on item with the worker's shared keyword arguments."""
+    return func(item, **_WORKER_KWARGS)
+
+
+def _to_shared_memory(obj: Any) -> Tuple[str, List[int]]:
+    """
+    Pickle obj into a new shared memory block and return a handle to it.
+
+    Uses pickle protocol 5 so large buffers (NumPy arrays behind
+    GeoDataFrame columns and geometries) are copied straight into shared
+    memory rather than into the pickle stream first.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    frames = [memoryview(data)] + [buffer.raw() for buffer in buffers]
+    sizes = [frame.nbytes for frame in frames]
+
+    shm = SharedMemory(create=True, size=max(1, sum(sizes)))
+    offset = 0
+    for frame in frames:
+        shm.buf[offset:offset + frame.nbytes] = frame
+        offset += frame.nbytes
+    shm.close()
+    return shm.name, sizes
+
+
+def _from_shared_memory(handle: Tuple[str, List[int]]) -> Any:
+    """Rebuild an object from a _to_shared_memory() handle and free it."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    name, sizes = handle
+    shm = SharedMemory(name=name)
+    try:
+        # Copied out so the block can be released; bytearrays keep the
+        # rebuilt arrays writable
+        frames = []
+        offset = 0
+        for size in sizes:
+            frames.append(bytearray(shm.buf[offset:offset + size]))
+            offset += size
+        return pickle.loads(frames[0], buffers=frames[1:])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _shared_memory_call(func: Callable, item: Any) -> Any:
+    """
+    Call func on item and return its result through shared memory.
+
+    A failure is returned, not raised: the pool would otherwise drop the
+    whole batch, including blocks already written for earlier items.
+    """
+    try:
+        result = func(item)
+    except Exception as e:
+        return e
+    return _to_shared_memory(result)
+
+
+def _for_transport(func: Callable, transport: str) -> Callable:
+    """
+    Wrap a worker-side callable so its results use the given transport.
+
+    Results of the returned callable must be passed through
+    _from_transport() in the parent.
+    """
+    if transport == "shared_memory":
+        from multiprocessing import resource_tracker
+
+        # Start the tracker first so workers share it with us, and the
+        # blocks they create are released when we unlink them
+        resource_tracker.ensure_running()
+        return partial(_shared_memory_call, func)
+    return func
+
+
+def _from_transport(result: Any, transport: str) -> Any:
+    """Turn what a _for_transport() callable returned into its result."""
+    if transport == "shared_memory":
+        if isinstance(result, Exception):
+            raise result
+        return _from_shared_memory(result)
+    return result
+
+
+def _free_shared_memory(handle: Tuple[str, List[int]]) -> None:
+    """Release a _to_shared_memory() block without reading it."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        shm = SharedMemory(name=handle[0])
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _discard_pending(outcomes: Iterator[Any], transport: str) -> None:
+    """
+    Drain results nobody will read, freeing any transport resources.
+
+    Shared memory blocks are only released when the parent decodes them,
+    so after a failure or an early stop the outstanding ones must still be
+    collected, or they outlive the process in /dev/shm.
+    """
+    if transport != "shared_memory":
+        return
+    while True:
+        try:
+            handle = next(outcomes)
+        except StopIteration:
+            return
+        except Exception:
+            continue
+        if not isinstance(handle, Exception):
+            _free_shared_memory(handle)
+
+
+def _get_context(start_method: Optional[str] = None):
+    """
+    Get the multiprocessing context for a start method.
+
+    Without an explicit method, Linux uses "fork": workers start quickly
+    and share the parent's already loaded data (road graphs, boundary
+    arrays, configs) copy-on-write instead of re-importing and unpickling
+    it. Elsewhere the platform default is kept, since fork is unsafe on
+    macOS and unavailable on Windows.
+    """
+    if start_method is None and sys.platform.startswith("linux"):
+        start_method = "fork"
+    return mp.get_context(start_method)
+
+
+def _same_kwargs(a: Optional[dict], b: dict) -> bool:
+    """Check whether two kwargs dicts hold the very same objects."""
+    return a is not None and a.keys() == b.keys() and all(
+        a[name] is b[name] for name in a
+    )
+
+
+def _auto_chunksize(n_items: int, n_workers: int) -> int:
+    """
+    Pick a batch size giving each worker about four batches.
+
+    This is the heuristic multiprocessing.Pool.map uses: big enough that
+    IPC is amortized, small enough that a slow batch does not leave the
+    other workers idle at the end.
+    """
+    return max(1, n_items // (n_workers * 4))
 
 
 class ParallelProcessor:
@@ -33,18 +212,82 @@ class ParallelProcessor:
         ... )
     """
 
-    def __init__(self, n_workers: Optional[int] = None):
+    TRANSPORTS = ("pipe", "shared_memory")
+
+    def __init__(
+        self,
+        n_workers: Optional[int] = None,
+        adaptive_chunksize: bool = False,
+        transport: str = "pipe",
+        start_method: Optional[str] = None
+    ):
         """
         Initialize parallel processor.
 
         Args:
-            n_workers: Number of worker processes. If None, uses CPU count.
+            n_workers: Number of worker processes. If None, uses the
+                number of CPUs this process is allowed to run on.
+            adaptive_chunksize: If True, map() tunes its batch size while
+                it runs, doubling it while throughput improves and halving
+                it when throughput drops. Helps when per-item cost is
+                unknown; costs a short synchronization every few batches.
+            transport: How map() returns results from workers. "pipe"
+                pickles them through the pool's pipe. "shared_memory"
+                writes each one to a shared memory block and sends back
+                only its name, which is faster for large results such as
+                GeoDataFrames and slower for small ones.
+            start_method: multiprocessing start method ("fork", "spawn"
+                or "forkserver"). If None, uses "fork" on Linux, so data
+                loaded in the parent is shared copy-on-write with the
+                workers, and the platform default elsewhere.
+
+        Raises:
+            ValueError: If transport or start_method is not supported.
         """
+        if transport not in self.TRANSPORTS:
+            raise ValueError(
+                f"Unsupported transport '{transport}'. "
+                f"Supported: {', '.join(self.TRANSPORTS)}"
+            )
+
         if n_workers is None:
-            n_workers = mp.cpu_count()
+            n_workers = _CPU_COUNT
 
         self.n_workers = n_workers
-        self._pool: Optional[ProcessPoolExecutor] = None
+        self.adaptive_chunksize = adaptive_chunksize
+        self.transport = transport
+        self._ctx = _get_context(start_method)
+        # Inside a with block the pool outlives single calls; it is rebuilt
+        # only when the shared kwargs it was initialized with change
+        self._pool: Optional[Any] = None
+        self._pool_kwargs: Optional[dict] = None
+        self._persistent = False
+
+    def _run_inline(self, n_items: int) -> bool:
+        """
+        Check whether n_items are better processed in this process.
+
+        With a single worker, or fewer than two items per worker, starting
+        a pool and pickling every item costs more than it can save.
+        """
+        return self.n_workers <= 1 or n_items < 2 * self.n_workers
+
+    @staticmethod
+    def _map_inline(
+        func: Callable,
+        items: Iterable[Any],
+        kwargs: dict
+    ) -> List[Any]:
+        """Run func over items in this process, failing as map() does."""
+        results = []
+        for item in items:
+            try:
+                results.append(func(item, **kwargs))
+            except Exception as e:
+                raise RuntimeError(
+                    f"Worker failed on item {len(results)}"
+                ) from e
+        return results
 
     def map(
         self,
@@ -64,53 +307,239 @@ class ParallelProcessor:
             List of results in the same order as items.
 
         Raises:
-            Exception: If any worker fails.
+            RuntimeError: If any worker fails. The worker's exception is
+                its __cause__.
         """
         if not items:
             return []
 
-        # Use single process for small lists
-        if len(items) < self.n_workers:
-            return [func(item, **kwargs) for item in items]
+        return self._map_iterable(func, items, len(items), kwargs)
+
+    def _map_iterable(
+        self,
+        func: Callable,
+        items: Iterable[Any],
+        n_items: int,
+        kwargs: dict,
+        inline: Optional[bool] = None
+    ) -> List[Any]:
+        """
+        Body of map() for any iterable of n_items items.
+
+        Items are consumed lazily, so callers can pass a generator and
+        never hold every item at once. inline overrides _run_inline() for
+        callers whose items are not single units of work.
+        """
+        if inline is None:
+            inline = self._run_inline(n_items)
+        if inline:
+            return self._map_inline(func, items, kwargs)
+
+        results = []
+
+        # Ship kwargs to each worker once, at startup, and send items in
+        # batches of chunksize so IPC is one message per batch, not per item
+        task = _for_transport(
+            partial(_call_with_worker_kwargs, func), self.transport
+        )
+        chunksize = _auto_chunksize(n_items, self.n_workers)
+
+        with self._worker_pool(kwargs) as pool:
+            if self.adaptive_chunksize:
+                outcomes = self._imap_adaptive(pool, task, items, chunksize)
+            else:
+                outcomes = pool.imap(task, items, chunksize=chunksize)
+
+            # Results arrive in item order, so a worker's exception is
+            # re-raised here at the position of the item that caused it
+            try:
+                for result in outcomes:
+                    results.append(_from_transport(result, self.transport))
+            except Exception as e:
+                if self.adaptive_chunksize:
+                    # Closing it frees the round in flight and submits no more
+                    outcomes.close()
+                else:
+                    _discard_pending(outcomes, self.transport)
+                raise RuntimeError(
+                    f"Worker failed on item {len(results)}"
+                ) from e
 
-        results = [None] * len(items)
+        return results
 
-        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
-            # Submit all tasks
-            future_to_index = {
-                executor.submit(func, item, **kwargs): idx
-                for idx, item in enumerate(items)
-            }
+    def imap(
+        self,
+        func: Callable,
+        items: List[Any],
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Apply function to items in parallel, yielding results as they finish.
+
+        Unlike map(), results are not collected, so memory stays bounded by
+        the batches in flight rather than growing with len(items); callers
+        can write each result out (e.g. to a GeoPackage) as it arrives.
+        The price is ordering: results come in completion order, not item
+        order. Use map() when order matters. With the "shared_memory"
+        transport, stopping early still waits for the queued tasks so their
+        result blocks can be freed.
+
+        Args:
+            func: Function to apply to each item.
+            items: List of items to process.
+            **kwargs: Additional keyword arguments passed to func.
 
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                idx = future_to_index[future]
+        Yields:
+            Results in the order they complete.
+
+        Raises:
+            RuntimeError: If any worker fails. The worker's exception is
+                its __cause__.
+
+        Example:
+            >>> processor = ParallelProcessor(n_workers=4)
+            >>> for gdf in processor.imap(strategy.generate, boundaries):
+            ...     gdf.to_file("samples.gpkg", mode="a")
+        """
+        if not items:
+            return
+
+        if self._run_inline(len(items)):
+            for item in items:
                 try:
-                    results[idx] = future.result()
+                    result = func(item, **kwargs)
                 except Exception as e:
-                    raise Exception(
-                        f"Worker failed on item {idx}: {e}"
-                    )
+                    raise RuntimeError("Worker failed") from e
+                yield result
+            return
+
+        task = _for_transport(
+            partial(_call_with_worker_kwargs, func), self.transport
+        )
+        chunksize = _auto_chunksize(len(items), self.n_workers)
+
+        # Leaving the generator early ends the with block, which stops the
+        # tasks still queued (after draining them for shared memory)
+        with self._worker_pool(kwargs) as pool:
+            outcomes = pool.imap_unordered(task, items, chunksize=chunksize)
+            try:
+                while True:
+                    try:
+                        result = _from_transport(
+                            next(outcomes), self.transport
+                        )
+                    except StopIteration:
+                        return
+                    except Exception as e:
+                        raise RuntimeError("Worker failed") from e
+                    yield result
+            finally:
+                _discard_pending(outcomes, self.transport)
+
+    @contextmanager
+    def _worker_pool(self, kwargs: dict):
+        """
+        Provide a pool whose workers hold kwargs as their shared arguments.
 
-        return results
+        Outside a with block every call gets a fresh pool. Inside one, the
+        pool is kept and reused while kwargs refer to the same objects, so
+        worker startup is paid once rather than per call.
+        """
+        if not self._persistent:
+            with self._ctx.Pool(
+                self.n_workers, initializer=_init_worker, initargs=(kwargs,)
+            ) as pool:
+                yield pool
+            return
+
+        stale = not _same_kwargs(self._pool_kwargs, kwargs)
+        if self._pool is not None and stale:
+            self._shutdown_pool()
+        if self._pool is None:
+            self._pool = self._ctx.Pool(
+                self.n_workers, initializer=_init_worker, initargs=(kwargs,)
+            )
+            # Held so the objects compared by identity stay alive
+            self._pool_kwargs = kwargs
+
+        try:
+            yield self._pool
+        except BaseException:
+            # Tasks of the failed call may still be queued; drop them
+            self._shutdown_pool(terminate=True)
+            raise
+
+    def _shutdown_pool(self, terminate: bool = False) -> None:
+        """Stop the persistent pool, if there is one."""
+        if self._pool is None:
+            return
+        if terminate:
+            self._pool.terminate()
+        else:
+            self._pool.close()
+        self._pool.join()
+        self._pool = None
+        self._pool_kwargs = None
+
+    def _imap_adaptive(
+        self,
+        pool: Any,
+        task: Callable,
+        items: Iterable[Any],
+        chunksize: int
+    ):
+        """Run task over items in rounds, retuning chunksize between them."""
+        remaining = iter(items)
+        previous_rate = None
+
+        while True:
+            # About ten batches per round, enough for a stable rate
+            window = list(islice(remaining, chunksize * 10))
+            if not window:
+                return
+
+            start = time.perf_counter()
+            outcomes = pool.imap(task, window, chunksize=chunksize)
+            try:
+                # Not "yield from": that would close outcomes on the way out,
+                # dropping results that still hold shared memory
+                for outcome in outcomes:
+                    yield outcome
+            except BaseException:
+                # The caller stops here; free what this round still holds
+                _discard_pending(outcomes, self.transport)
+                raise
+            rate = len(window) / max(time.perf_counter() - start, 1e-9)
+
+            if previous_rate is not None:
+                if rate >= previous_rate:
+                    chunksize *= 2
+                else:
+                    chunksize = max(1, chunksize // 2)
+            previous_rate = rate
 
     def map_chunks(
         self,
         func: Callable,
         items: List[Any],
-        chunk_size: int,
+        chunk_size: Optional[int] = None,
         **kwargs
     ) -> List[Any]:
         """
         Apply function to chunks of items in parallel.
 
         Useful for processing many small items more efficiently
-        by grouping them into chunks.
+        by grouping them into chunks. Chunk results come back through
+        the processor's transport, as in map().
 
         Args:
-            func: Function that takes a list of items.
-            items: List of items to process.
-            chunk_size: Number of items per chunk.
+            func: Function that takes a list of items and returns a list
+                of results, one per item. Its lists are concatenated, so
+                it must return a list (or another iterable of results)
+                even for a single result.
+            items: List (or NumPy array) of items to process.
+            chunk_size: Number of items per chunk. If None, picks one
+                giving each worker about four chunks.
             **kwargs: Additional keyword arguments passed to func.
 
         Returns:
@@ -126,27 +555,29 @@ class ParallelProcessor:
             ...     chunk_size=10
             ... )
         """
-        if not items:
+        if len(items) == 0:
             return []
 
-        # Split items into chunks
-        chunks = [
+        if chunk_size is None:
+            chunk_size = _auto_chunksize(len(items), self.n_workers)
+
+        # Slice chunks as the pool asks for them rather than copying all
+        # of items into sublists up front (NumPy arrays slice to views)
+        n_chunks = -(-len(items) // chunk_size)
+        chunks = (
             items[i:i + chunk_size]
             for i in range(0, len(items), chunk_size)
-        ]
-
-        # Process chunks in parallel
-        chunk_results = self.map(func, chunks, **kwargs)
+        )
 
-        # Flatten results
-        results = []
-        for chunk_result in chunk_results:
-            if isinstance(chunk_result, list):
-                results.extend(chunk_result)
-            else:
-                results.append(chunk_result)
+        # Each chunk is already a coarse batch of work, so even a few of
+        # them pay off in parallel; stay in-process only with one worker or
+        # fewer chunks than workers
+        inline = self.n_workers <= 1 or n_chunks < self.n_workers
+        chunk_results = self._map_iterable(
+            func, chunks, n_chunks, kwargs, inline=inline
+        )
 
-        return results
+        return list(chain.from_iterable(chunk_results))
 
     def starmap(
         self,
@@ -178,25 +609,31 @@ class ParallelProcessor:
         if not args_list:
             return []
 
-        def wrapper(args):
-            return func(*args)
+        if self._run_inline(len(args_list)):
+            return [func(*args) for args in args_list]
 
-        return self.map(wrapper, args_list)
+        # Pool.starmap unpacks the tuples in the workers, so func itself is
+        # what gets pickled and any start method works
+        chunksize = _auto_chunksize(len(args_list), self.n_workers)
+        with self._worker_pool({}) as pool:
+            return pool.starmap(func, args_list, chunksize=chunksize)
 
     def __enter__(self):
-        """Context manager entry."""
+        """Context manager entry: keep one worker pool across calls."""
+        self._persistent = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if self._pool is not None:
-            self._pool.shutdown(wait=True)
+        self._persistent = False
+        self._shutdown_pool()
 
 
 def parallelize_sampling(
     strategy_func: Callable,
     boundaries: List[Any],
     n_workers: Optional[int] = None,
+    io_bound: bool = False,
     **kwargs
 ) -> List[Any]:
     """
@@ -206,11 +643,20 @@ def parallelize_sampling(
         strategy_func: Sampling strategy function (e.g., GridSampling().generate).
         boundaries: List of boundary polygons.
         n_workers: Number of worker processes.
+        io_bound: If True, run strategy_func in threads instead of
+            processes (up to n_workers * 4, at most 32). Suits network
+            bound work such as OSM downloads, where the GIL is released
+            while waiting and process startup and result pickling are
+            pure overhead. CPU-bound sampling should keep the default.
         **kwargs: Additional arguments passed to strategy_func.
 
     Returns:
         List of GeoDataFrames with sample points.
 
+    Raises:
+        RuntimeError: If strategy_func fails on any boundary. Its
+            exception is the __cause__.
+
     Example:
         >>> from shapely.geometry import box
         >>> from ssp import GridSampling, SamplingConfig
@@ -226,6 +672,25 @@ def parallelize_sampling(
         ...     n_workers=4
         ... )
     """
+    if io_bound:
+        from concurrent.futures import ThreadPoolExecutor
+
+        if n_workers is None:
+            n_workers = _CPU_COUNT
+
+        results = []
+        with ThreadPoolExecutor(max_workers=min(32, n_workers * 4)) as pool:
+            try:
+                for result in pool.map(
+                    partial(strategy_func, **kwargs), boundaries
+                ):
+                    results.append(result)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Worker failed on item {len(results)}"
+                ) from e
+        return results
+
     processor = ParallelProcessor(n_workers=n_workers)
     return processor.map(strategy_func, boundaries, **kwargs)
 
@@ -240,7 +705,7 @@ def get_optimal_n_workers(task_type: str = "sampling") -> int:
     Returns:
         Optimal number of workers.
     """
-    cpu_count = mp.cpu_count()
+    cpu_count = _CPU_COUNT
 
     if task_type == "osm_download":
         # Limit network requests to avoid overloading servers
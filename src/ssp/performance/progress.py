@@ -11,7 +11,6 @@ Features:
 """
 
 import time
-import sys
 from typing import Optional, Callable, Any, List
 from contextlib import contextmanager
 
@@ -58,13 +57,19 @@ class ProgressTracker:
         self._pbar = None
         self._start_time = None
         self._completed = 0
+        self._last_print_t = 0.0
+        self._last_pct = -1
 
         if self.show_progress:
+            # Redraw at most twice a second and about every 0.5% of items,
+            # so bar updates stay cheap in tight loops
             self._pbar = tqdm(
                 total=total,
                 desc=description,
                 unit='item',
-                disable=False
+                disable=False,
+                mininterval=0.5,
+                miniters=max(1, total // 200)
             )
             self._start_time = time.time()
 
@@ -80,10 +85,18 @@ class ProgressTracker:
         if self._pbar:
             self._pbar.update(n)
         elif not self.silent:
-            # Simple text progress
+            # Simple text progress, redrawn only when the shown percentage
+            # changes and at most ten times a second (always at the end)
+            pct = self._completed * 1000 // max(self.total, 1)
+            if pct == self._last_pct:
+                return
+            now = time.monotonic()
+            if now - self._last_print_t <= 0.1 and self._completed < self.total:
+                return
+            self._last_pct = pct
+            self._last_print_t = now
             percent = (self._completed / self.total) * 100
-            print(f"\r{self.description}: {self._completed}/{self.total} ({percent:.1f}%)", end='')
-            sys.stdout.flush()
+            print(f"\r{self.description}: {self._completed}/{self.total} ({percent:.1f}%)", end='', flush=True)
 
     def close(self) -> None:
         """Close progress tracker."""
@@ -131,11 +144,44 @@ class ProgressTracker:
         return remaining / rate
 
 
+class _NullTracker:
+    """
+    Do-nothing stand-in for ProgressTracker when progress is hidden.
+
+    Keeps update() in tight loops down to a bare method call.
+    """
+
+    def update(self, n: int = 1) -> None:
+        """Ignore progress."""
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+
+    def get_elapsed_time(self) -> float:
+        """Elapsed time is not tracked."""
+        return 0.0
+
+    def get_eta(self) -> float:
+        """ETA is not tracked."""
+        return 0.0
+
+
+_NULL_TRACKER = _NullTracker()
+
+
 @contextmanager
 def progress_context(
     total: int,
     description: str = "Processing",
-    show_progress: bool = True
+    show_progress: bool = True,
+    silent: bool = False
 ):
     """
     Context manager for progress tracking.
@@ -144,9 +190,11 @@ def progress_context(
         total: Total number of items.
         description: Operation description.
         show_progress: Whether to show progress.
+        silent: If True, never show progress.
 
     Yields:
-        ProgressTracker instance.
+        ProgressTracker instance, or a shared no-op tracker when
+        show_progress is False or silent is True.
 
     Example:
         >>> with progress_context(100, "Sampling") as tracker:
@@ -154,6 +202,10 @@ def progress_context(
         ...         # Do work
         ...         tracker.update(1)
     """
+    if not show_progress or silent:
+        yield _NULL_TRACKER
+        return
+
     tracker = ProgressTracker(total, description, show_progress)
     try:
         yield tracker
@@ -189,13 +241,24 @@ def track_progress(
         ...     description="Doubling numbers"
         ... )
     """
+    if not show_progress:
+        return [func(item) for item in items]
+
     results = []
+    # Report in steps of about 0.5% rather than once per item
+    step = max(1, len(items) // 200)
+    pending = 0
 
     with progress_context(len(items), description, show_progress) as tracker:
         for item in items:
             result = func(item)
             results.append(result)
-            tracker.update(1)
+            pending += 1
+            if pending >= step:
+                tracker.update(pending)
+                pending = 0
+        if pending:
+            tracker.update(pending)
 
     return results
 
@@ -205,7 +268,9 @@ def track_parallel_progress(
     items: List[Any],
     n_workers: int = 4,
     description: str = "Parallel processing",
-    show_progress: bool = True
+    show_progress: bool = False,
+    transport: str = "pipe",
+    start_method: Optional[str] = None
 ) -> List[Any]:
     """
     Apply function to items in parallel with progress tracking.
@@ -215,11 +280,21 @@ def track_parallel_progress(
         items: List of items to process.
         n_workers: Number of worker processes.
         description: Operation description.
-        show_progress: Whether to show progress.
+        show_progress: Whether to show progress. Off by default: with
+            many fast items, redrawing the bar from the parent can cost
+            more than the work itself. When off, nothing is printed.
+        transport: How results come back from workers, as for
+            ParallelProcessor: "pipe" or "shared_memory".
+        start_method: multiprocessing start method, as for
+            ParallelProcessor. If None, "fork" on Linux and the platform
+            default elsewhere.
 
     Returns:
         List of results.
 
+    Raises:
+        ValueError: If transport or start_method is not supported.
+
     Example:
         >>> from ssp.performance import track_parallel_progress
         >>>
@@ -230,18 +305,36 @@ def track_parallel_progress(
         ...     func=expensive_computation,
         ...     items=list(range(1000)),
         ...     n_workers=4,
-        ...     description="Computing squares"
+        ...     description="Computing squares",
+        ...     show_progress=True
         ... )
     """
     from concurrent.futures import ProcessPoolExecutor, as_completed
+    from ssp.performance.parallel import (
+        ParallelProcessor,
+        _for_transport,
+        _from_transport,
+        _get_context,
+    )
+
+    if transport not in ParallelProcessor.TRANSPORTS:
+        raise ValueError(
+            f"Unsupported transport '{transport}'. "
+            f"Supported: {', '.join(ParallelProcessor.TRANSPORTS)}"
+        )
 
+    task = _for_transport(func, transport)
     results = [None] * len(items)
+    step = max(1, len(items) // 200)
+    pending = 0
 
     with progress_context(len(items), description, show_progress) as tracker:
-        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=_get_context(start_method)
+        ) as executor:
             # Submit all tasks
             future_to_index = {
-                executor.submit(func, item): idx
+                executor.submit(task, item): idx
                 for idx, item in enumerate(items)
             }
 
@@ -249,11 +342,16 @@ def track_parallel_progress(
             for future in as_completed(future_to_index):
                 idx = future_to_index[future]
                 try:
-                    results[idx] = future.result()
+                    results[idx] = _from_transport(future.result(), transport)
                 except Exception as e:
                     results[idx] = e
 
-                tracker.update(1)
+                pending += 1
+                if pending >= step:
+                    tracker.update(pending)
+                    pending = 0
+            if pending:
+                tracker.update(pending)
 
     return results
 
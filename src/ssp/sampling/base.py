@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import geopandas as gpd
+import numpy as np
 from shapely.geometry import Point, Polygon
 import warnings
 
@@ -21,6 +22,13 @@ from ssp.exceptions import (
     SamplingError
 )
 
+# Output formats supported by SamplingStrategy.export(), mapped to GDAL drivers
+EXPORT_DRIVERS = {
+    'geojson': 'GeoJSON',
+    'fgb': 'FlatGeobuf',
+    'gpkg': 'GPKG',
+}
+
 
 @dataclass
 class SamplingConfig:
@@ -192,6 +200,9 @@ class SamplingStrategy(ABC):
         self.config: SamplingConfig = config
         self._sample_points: Optional[gpd.GeoDataFrame] = None
         self._generation_timestamp: Optional[datetime] = None
+        # Per-strategy random generator, seeded in generate(); kept off the
+        # global NumPy RNG so strategies can be generated concurrently
+        self._rng: Optional[np.random.Generator] = None
         self.strategy_name: str = self.__class__.__name__
 
     @abstractmethod
@@ -513,12 +524,61 @@ class SamplingStrategy(ABC):
                 with open(filepath, 'w') as f:
                     dump(collection, f)
             else:
-                # Use geopandas built-in export
-                self._sample_points.to_file(filepath, driver='GeoJSON')
+                self.export(filepath, 'geojson')
 
         except Exception as e:
             raise IOError(f"Failed to write GeoJSON to {filepath}: {e}")
 
+    def export(self, filepath: str, fmt: str = 'geojson') -> None:
+        """
+        Save sample points in a GDAL vector format.
+
+        Writes through pyogrio when it is installed, which avoids the
+        per-feature Python loop of the Fiona engine. FlatGeobuf and
+        GeoPackage outputs are considerably smaller and faster to read
+        back than GeoJSON for large point sets.
+
+        Args:
+            filepath: Output file path (e.g., "sampling_points.fgb")
+            fmt: One of "geojson", "fgb" or "gpkg".
+
+        Raises:
+            ValueError: If no sample points have been generated yet, or if
+                       fmt is not a supported format.
+            IOError: If filepath cannot be written.
+
+        Example:
+            >>> strategy.export("output.fgb", fmt="fgb")
+        """
+        if self._sample_points is None:
+            raise ValueError(
+                "No sample points generated yet. "
+                "Call generate() method first."
+            )
+
+        if fmt not in EXPORT_DRIVERS:
+            raise ValueError(
+                f"Unsupported export format '{fmt}'. "
+                f"Choose from: {', '.join(EXPORT_DRIVERS)}"
+            )
+
+        driver = EXPORT_DRIVERS[fmt]
+        # Write a bounding box so readers can skip a pass over the features
+        layer_options = {'WRITE_BBOX': 'YES'} if driver == 'GeoJSON' else None
+
+        try:
+            try:
+                from pyogrio import write_dataframe
+            except ImportError:
+                self._sample_points.to_file(filepath, driver=driver)
+            else:
+                write_dataframe(
+                    self._sample_points, filepath,
+                    driver=driver, layer_options=layer_options
+                )
+        except Exception as e:
+            raise IOError(f"Failed to write {driver} to {filepath}: {e}")
+
     def __repr__(self) -> str:
         """Return string representation of the sampling strategy."""
         return (
@@ -125,7 +125,7 @@ class GridSampling(SamplingStrategy):
         # Set random seed for reproducibility
         # Although grid generation is deterministic, this ensures
         # consistency if any stochastic operations are added
-        np.random.seed(self.config.seed)
+        self._rng = np.random.default_rng(self.config.seed)
 
         # Get boundary bounds
         minx, miny, maxx, maxy = boundary.bounds
@@ -76,7 +76,9 @@ class RoadNetworkSampling(SamplingStrategy):
         self,
         config: Optional[SamplingConfig] = None,
         network_type: str = 'all',
-        road_types: Optional[Set[str]] = None
+        road_types: Optional[Set[str]] = None,
+        use_cache: bool = False,
+        refresh_cache: bool = False
     ):
         """
         Initialize road network sampling strategy.
@@ -87,6 +89,11 @@ class RoadNetworkSampling(SamplingStrategy):
                          Default is 'all' for complete road network.
             road_types: Set of OSM highway types to include (e.g., {'primary', 'secondary'}).
                        If None, includes all road types in the network.
+            use_cache: If True, downloaded road graphs are stored in the
+                      on-disk OSM cache and reused for the same boundary
+                      and network_type.
+            refresh_cache: If True (with use_cache), discards any cached
+                          graph for this request and downloads it again.
 
         Raises:
             TypeError: If config is not None and not a SamplingConfig.
@@ -124,6 +131,8 @@ class RoadNetworkSampling(SamplingStrategy):
                     f"Valid types are: {sorted(self.HIGHWAY_TYPES)}"
                 )
         self.road_types = road_types
+        self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
 
         # Store road network graph
         self._road_graph: Optional[nx.MultiDiGraph] = None
@@ -190,7 +199,7 @@ class RoadNetworkSampling(SamplingStrategy):
         self._generation_timestamp = datetime.now()
 
         # Set random seed for reproducibility
-        np.random.seed(self.config.seed)
+        self._rng = np.random.default_rng(self.config.seed)
 
         # Provide spacing guidance for geographic CRS
         import sys
@@ -232,15 +241,8 @@ class RoadNetworkSampling(SamplingStrategy):
             # Convert boundary to bounding box for OSM query
             boundary_polygon = boundary
 
-            # Download road network from OSM
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                self._road_graph = ox.graph_from_polygon(
-                    boundary_polygon,
-                    network_type=self.network_type,
-                    simplify=True,
-                    retain_all=False
-                )
+            # Download road network from OSM (or the on-disk cache)
+            self._road_graph = self._download_graph(boundary_polygon)
 
             download_time = time.time() - start_time
             if download_time > 10:  # Only print if download took > 10 seconds
@@ -420,6 +422,43 @@ class RoadNetworkSampling(SamplingStrategy):
 
         return gdf
 
+    def _download_graph(self, boundary: Polygon) -> nx.MultiDiGraph:
+        """
+        Download the OSM road graph for a boundary, optionally via the cache.
+
+        The graph depends only on the boundary and network_type (road type
+        filtering happens afterwards), so those two form the cache key.
+
+        Args:
+            boundary: Area of interest polygon.
+
+        Returns:
+            Road network graph from OSMnx.
+        """
+        def download() -> nx.MultiDiGraph:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                return ox.graph_from_polygon(
+                    boundary,
+                    network_type=self.network_type,
+                    simplify=True,
+                    retain_all=False
+                )
+
+        if not self.use_cache:
+            return download()
+
+        import hashlib
+        from ssp.performance.cache import cached_osm_download, get_osm_cache
+
+        boundary_hash = hashlib.blake2b(boundary.wkb, digest_size=16).hexdigest()
+        cache_key = f"road_graph_{self.network_type}_{boundary_hash}"
+
+        if self.refresh_cache:
+            get_osm_cache().delete(cache_key)
+
+        return cached_osm_download(download, cache_key)
+
     def calculate_road_network_metrics(self) -> dict:
         """
         Calculate road network-specific metrics.
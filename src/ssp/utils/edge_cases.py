@@ -18,6 +18,14 @@ from ssp.exceptions import BoundaryError, ValidationError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Base time estimates per point (in seconds), used by estimate_processing_time
+BASE_TIME_PER_POINT = {
+    'grid': 0.0001,      # Very fast
+    'road_network': 0.01,  # Slower due to OSM download
+    'random': 0.0005,
+    'optimized': 0.005
+}
+
 
 def handle_small_boundary(
     boundary: Polygon,
@@ -355,15 +363,7 @@ def estimate_processing_time(
         >>> time_est = estimate_processing_time(1000, "grid")
         >>> print(f"Estimated time: {time_est:.1f} seconds")
     """
-    # Base time estimates per point (in seconds)
-    base_times = {
-        'grid': 0.0001,      # Very fast
-        'road_network': 0.01,  # Slower due to OSM download
-        'random': 0.0005,
-        'optimized': 0.005
-    }
-
-    time_per_point = base_times.get(strategy, 0.001)
+    time_per_point = BASE_TIME_PER_POINT.get(strategy, 0.001)
     return n_points * time_per_point
 
 
@@ -14,6 +14,7 @@ import pandas as pd
 import numpy as np
 from shapely.geometry import Polygon, Point
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 from ssp.sampling.base import SamplingStrategy
 
@@ -72,12 +73,38 @@ def compare_strategies(
     if not isinstance(boundary, Polygon):
         raise TypeError(f"boundary must be shapely Polygon, got {type(boundary)}")
 
-    # Generate samples for each strategy
+    def _generate(strategy: SamplingStrategy) -> tuple:
+        points = strategy.generate(boundary)
+        return points, strategy.calculate_coverage_metrics()
+
+    def _config_key(strategy: SamplingStrategy) -> tuple:
+        road_types = getattr(strategy, 'road_types', None)
+        return (
+            type(strategy),
+            strategy.config.spacing,
+            strategy.config.crs,
+            strategy.config.seed,
+            getattr(strategy, 'network_type', None),
+            frozenset(road_types) if road_types else None
+        )
+
+    # Generate samples for each strategy concurrently. Strategies are
+    # independent (each has its own RNG; grid generation runs in
+    # NumPy/GEOS, road network waits on OSM downloads), and strategies with
+    # identical configurations are generated only once.
+    with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+        futures_by_config = {}
+        futures = {}
+        for name, strategy in strategies.items():
+            key = _config_key(strategy)
+            if key not in futures_by_config:
+                futures_by_config[key] = executor.submit(_generate, strategy)
+            futures[name] = futures_by_config[key]
+
     results = {}
-    for name, strategy in strategies.items():
+    for name, future in futures.items():
         try:
-            points = strategy.generate(boundary)
-            metrics = strategy.calculate_coverage_metrics()
+            points, metrics = future.result()
             results[name] = {
                 'points': points,
                 'metrics': metrics
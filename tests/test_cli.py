@@ -8,12 +8,14 @@ including all commands and their error handling.
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import geojson
 import geopandas as gpd
+import networkx as nx
 import pytest
 from click.testing import CliRunner
-from shapely.geometry import box
+from shapely.geometry import box, LineString, Point
 from shapely import to_wkt
 
 from ssp.cli import cli
@@ -46,6 +48,22 @@ def temp_boundary_file():
     Path(temp_path).unlink(missing_ok=True)
 
 
+@pytest.fixture
+def road_graph():
+    """Create a one-edge OSMnx-style road graph inside the test boundary."""
+    graph = nx.MultiDiGraph(crs='EPSG:4326')
+    graph.add_node(1, x=0.01, y=0.05)
+    graph.add_node(2, x=0.09, y=0.05)
+    graph.add_edge(
+        1, 2, 0,
+        osmid=10,
+        highway='primary',
+        length=8900.0,
+        geometry=LineString([(0.01, 0.05), (0.09, 0.05)])
+    )
+    return graph
+
+
 @pytest.fixture
 def temp_output_file():
     """Create a temporary output file path for testing."""
@@ -73,6 +91,12 @@ class TestCLI:
         assert result.exit_code == 0
         assert '0.1.0' in result.output
 
+    def test_cli_version_short_flag(self, runner):
+        """Test the -V alias for --version."""
+        result = runner.invoke(cli, ['-V'])
+        assert result.exit_code == 0
+        assert '0.1.0' in result.output
+
 
 class TestSampleGrid:
     """Test suite for 'ssp sample grid' command."""
@@ -151,6 +175,91 @@ class TestSampleGrid:
         # Should fail with spacing validation error
         assert result.exit_code != 0
 
+    def test_sample_grid_multi_feature_aoi(self, runner, temp_output_file):
+        """Test grid sampling with an AOI made of several features."""
+        parts = [box(0, 0, 0.05, 0.1), box(0.05, 0, 0.1, 0.1)]
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.geojson', delete=False) as f:
+            collection = geojson.FeatureCollection([
+                geojson.Feature(
+                    geometry=geojson.loads(json.dumps(part.__geo_interface__)),
+                    properties={}
+                )
+                for part in parts
+            ])
+            geojson.dump(collection, f)
+            aoi_path = f.name
+
+        try:
+            result = runner.invoke(cli, [
+                'sample', 'grid',
+                '--spacing', '500',
+                '--aoi', aoi_path,
+                '--output', temp_output_file
+            ])
+
+            assert result.exit_code == 0
+            assert len(gpd.read_file(temp_output_file)) > 0
+        finally:
+            Path(aoi_path).unlink(missing_ok=True)
+
+    def test_sample_grid_disjoint_aoi(self, runner, temp_output_file):
+        """Test that a MultiPolygon AOI falls back to its convex hull."""
+        aoi = gpd.GeoDataFrame(
+            geometry=[box(0, 0, 0.02, 0.02).union(box(0.08, 0.08, 0.1, 0.1))],
+            crs="EPSG:4326"
+        )
+        aoi_path = temp_output_file.replace('.geojson', '_aoi.geojson')
+        aoi.to_file(aoi_path, driver='GeoJSON')
+
+        try:
+            result = runner.invoke(cli, [
+                'sample', 'grid',
+                '--spacing', '1000',
+                '--aoi', aoi_path,
+                '--output', temp_output_file
+            ])
+
+            assert result.exit_code == 0
+            points = gpd.read_file(temp_output_file)
+            # The hull covers the diagonal band between the two parts
+            assert points.geometry.within(box(0.03, 0.03, 0.07, 0.07)).any()
+        finally:
+            Path(aoi_path).unlink(missing_ok=True)
+
+    def test_sample_grid_reprojects_aoi(self, runner, temp_boundary_file, temp_output_file):
+        """Test that the AOI is reprojected to the requested CRS."""
+        result = runner.invoke(cli, [
+            'sample', 'grid',
+            '--spacing', '1000',
+            '--crs', 'EPSG:3857',
+            '--aoi', temp_boundary_file,
+            '--output', temp_output_file
+        ])
+
+        assert result.exit_code == 0
+        points = gpd.read_file(temp_output_file)
+        assert points.crs == 'EPSG:3857'
+        # 0.1 degrees is roughly 11 km in Web Mercator
+        assert points.total_bounds[2] > 1000
+
+    def test_sample_grid_flatgeobuf_format(self, runner, temp_boundary_file):
+        """Test grid sampling written as FlatGeobuf."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = Path(tmp_dir) / 'points.fgb'
+            result = runner.invoke(cli, [
+                'sample', 'grid',
+                '--spacing', '1000',
+                '--format', 'fgb',
+                '--metadata',
+                '--aoi', temp_boundary_file,
+                '--output', str(output)
+            ])
+
+            assert result.exit_code == 0
+            assert 'only written to GeoJSON' in result.output
+            assert len(gpd.read_file(output)) > 0
+
     def test_sample_grid_custom_seed(self, runner, temp_boundary_file, temp_output_file):
         """Test grid sampling with custom seed."""
         result = runner.invoke(cli, [
@@ -208,6 +317,47 @@ class TestSampleRoadNetwork:
         # May fail due to network issues
         assert result.exit_code in [0, 1]
 
+    def test_sample_road_network_projected_crs(
+        self, runner, temp_boundary_file, temp_output_file, road_graph
+    ):
+        """Test that OSM is queried in WGS84 and only the output is reprojected."""
+        with patch(
+            'ssp.sampling.road_network.ox.graph_from_polygon',
+            return_value=road_graph
+        ) as mock_download:
+            result = runner.invoke(cli, [
+                'sample', 'road-network',
+                '--spacing', '1000',
+                '--crs', 'EPSG:3857',
+                '--no-cache',
+                '--aoi', temp_boundary_file,
+                '--output', temp_output_file
+            ])
+
+        assert result.exit_code == 0, result.output
+        queried = mock_download.call_args[0][0]
+        assert queried.bounds == pytest.approx((0, 0, 0.1, 0.1))
+
+        points = gpd.read_file(temp_output_file)
+        assert len(points) > 0
+        assert points.crs == 'EPSG:3857'
+        # 0.01-0.09 degrees of longitude is roughly 1-10 km in Web Mercator
+        assert points.total_bounds[0] > 1000
+
+
+    def test_sample_road_network_cache_flags_conflict(self, runner, temp_boundary_file, temp_output_file):
+        """Test that --no-cache and --refresh-cache are mutually exclusive."""
+        result = runner.invoke(cli, [
+            'sample', 'road-network',
+            '--no-cache',
+            '--refresh-cache',
+            '--aoi', temp_boundary_file,
+            '--output', temp_output_file
+        ])
+
+        assert result.exit_code == 2
+        assert '--refresh-cache cannot be combined with --no-cache' in result.output
+
 
 class TestQualityMetrics:
     """Test suite for 'ssp quality metrics' command."""
@@ -298,6 +448,50 @@ class TestVisualize:
         assert result.exit_code == 0
         assert Path(map_file).exists()
 
+    def test_visualize_points_map_index_popup(self, runner, temp_output_file):
+        """Test that points without sample_id get an index-based popup."""
+        points_file = temp_output_file.replace('.geojson', '_points.geojson')
+        gpd.GeoDataFrame(
+            geometry=[Point(0.01, 0.01), Point(0.02, 0.02)], crs="EPSG:4326"
+        ).to_file(points_file, driver='GeoJSON')
+
+        map_file = temp_output_file.replace('.geojson', '_map.html')
+        result = runner.invoke(cli, [
+            'visualize', 'points-map',
+            '--points', points_file,
+            '--output', map_file
+        ])
+
+        assert result.exit_code == 0
+        html = Path(map_file).read_text()
+        assert 'Point:' in html
+        assert '"point": "1"' in html
+
+    def test_visualize_points_map_fast_cluster(self, runner, temp_boundary_file,
+                                               temp_output_file, monkeypatch):
+        """Test that large point sets are drawn with FastMarkerCluster."""
+        sample_file = temp_output_file.replace('.geojson', '_samples.geojson')
+        sample_result = runner.invoke(cli, [
+            'sample', 'grid',
+            '--spacing', '100',
+            '--aoi', temp_boundary_file,
+            '--output', sample_file
+        ])
+        assert sample_result.exit_code == 0
+
+        monkeypatch.setattr('ssp.cli.FAST_MARKER_THRESHOLD', 1)
+        map_file = temp_output_file.replace('.geojson', '_map.html')
+        result = runner.invoke(cli, [
+            'visualize', 'points-map',
+            '--points', sample_file,
+            '--output', map_file
+        ])
+
+        assert result.exit_code == 0
+        html = Path(map_file).read_text()
+        assert 'fast_marker_cluster' in html
+        assert 'circle_marker' not in html
+
     def test_visualize_statistics(self, runner, temp_boundary_file, temp_output_file):
         """Test creating statistics visualization."""
         # First generate sample points
@@ -322,6 +516,30 @@ class TestVisualize:
         assert result.exit_code == 0
         assert Path(stats_file).exists()
 
+    def test_visualize_statistics_no_render(self, runner, temp_boundary_file, temp_output_file):
+        """Test printing statistics without rendering a plot."""
+        sample_file = temp_output_file.replace('.geojson', '_samples.geojson')
+        sample_result = runner.invoke(cli, [
+            'sample', 'grid',
+            '--spacing', '100',
+            '--aoi', temp_boundary_file,
+            '--output', sample_file
+        ])
+
+        assert sample_result.exit_code == 0
+
+        stats_file = temp_output_file.replace('.geojson', '_stats.png')
+        result = runner.invoke(cli, [
+            'visualize', 'statistics',
+            '--points', sample_file,
+            '--output', stats_file,
+            '--no-render'
+        ])
+
+        assert result.exit_code == 0
+        assert 'Total points' in result.output
+        assert not Path(stats_file).exists()
+
     def test_visualize_compare(self, runner, temp_boundary_file, temp_output_file):
         """Test creating strategy comparison visualization."""
         # Create comparison
@@ -355,6 +573,53 @@ class TestValidationErrorHandling:
 
         assert result.exit_code != 0
 
+    def test_json_without_geojson_type_rejected(self, runner, temp_output_file):
+        """Test that JSON with a non-GeoJSON type is rejected at parse time."""
+        with open(temp_output_file, 'w') as f:
+            f.write('{"type": "Foo", "geometry": 1}')
+
+        result = runner.invoke(cli, [
+            'sample', 'grid',
+            '--spacing', '100',
+            '--aoi', temp_output_file,
+            '--output', temp_output_file + '_out.geojson'
+        ])
+
+        # Click parameter errors exit with code 2
+        assert result.exit_code == 2
+        assert 'Invalid GeoJSON file' in result.output
+
+    def test_non_json_aoi_validated_with_gdal(self, runner, temp_output_file):
+        """Test AOI formats that the header sniff cannot recognise."""
+        gpkg_path = temp_output_file.replace('.geojson', '.gpkg')
+        gpd.GeoDataFrame(
+            geometry=[box(0, 0, 0.1, 0.1)], crs='EPSG:4326'
+        ).to_file(gpkg_path, driver='GPKG')
+
+        garbage_path = temp_output_file.replace('.geojson', '.bin')
+        Path(garbage_path).write_bytes(b'not a vector file')
+
+        try:
+            result = runner.invoke(cli, [
+                'sample', 'grid',
+                '--spacing', '1000',
+                '--aoi', gpkg_path,
+                '--output', temp_output_file
+            ])
+            assert result.exit_code == 0
+
+            result = runner.invoke(cli, [
+                'sample', 'grid',
+                '--spacing', '1000',
+                '--aoi', garbage_path,
+                '--output', temp_output_file
+            ])
+            assert result.exit_code == 2
+            assert 'Failed to read' in result.output
+        finally:
+            Path(gpkg_path).unlink(missing_ok=True)
+            Path(garbage_path).unlink(missing_ok=True)
+
     def test_missing_output_directory(self, runner, temp_boundary_file):
         """Test creating output in non-existent directory."""
         output_path = '/nonexistent/dir/output.geojson'
@@ -6,6 +6,7 @@ Tests metadata models, serialization, validation, and export functionality.
 
 import pytest
 import json
+import re
 import tempfile
 import yaml
 from pathlib import Path
@@ -164,6 +165,98 @@ class TestMetadataModels:
         assert 'parameters' in data
         assert data['boundary']['crs'] == "EPSG:4326"
 
+    def test_sampling_metadata_to_dict_matches_asdict(self):
+        """Test that to_dict converts every nested dataclass like asdict."""
+        from dataclasses import asdict
+
+        meta = SamplingMetadata(
+            protocol_id="test_001",
+            protocol_name="Test Protocol",
+            description="Test description",
+            boundary=BoundaryMetadata(
+                geometry_wkt="POLYGON ((0 0, 1 0, 1 1, 0 0))",
+                crs="EPSG:4326",
+                area_km2=1.0,
+                bounds=(0, 0, 1, 1)
+            ),
+            execution=ExecutionMetadata(
+                timestamp="2025-01-22T10:00:00",
+                python_version="3.11.0",
+                ssp_version="0.1.0",
+                os_info="Linux"
+            ),
+            data_sources=[DataSourceMetadata(source_type="osm")],
+            results=ResultsMetadata(n_points=10, density_pts_per_km2=5.0),
+            tags=["urban"]
+        )
+
+        data = meta.to_dict()
+
+        assert data == asdict(meta)
+        assert data['parameters'] is None
+        assert data['data_sources'] == [asdict(meta.data_sources[0])]
+
+    def test_batched_timestamp(self):
+        """Test that records created in a batch share one created_at."""
+        from ssp.metadata import batched_timestamp
+
+        with batched_timestamp("2025-01-22T10:00:00") as timestamp:
+            first = SamplingMetadata("id_1", "Test Protocol", "Test description")
+            second = SamplingMetadata("id_2", "Test Protocol", "Test description")
+            explicit = SamplingMetadata(
+                "id_3", "Test Protocol", "Test description",
+                created_at="2024-06-01T00:00:00"
+            )
+
+        outside = SamplingMetadata("id_4", "Test Protocol", "Test description")
+
+        assert timestamp == "2025-01-22T10:00:00"
+        assert first.created_at == second.created_at == timestamp
+        assert explicit.created_at == "2024-06-01T00:00:00"
+        assert outside.created_at != timestamp
+
+    def test_metadata_models_use_slots(self):
+        """Test that metadata records carry no per-instance __dict__."""
+        import pickle
+
+        meta = SamplingMetadata(
+            protocol_id="test_001",
+            protocol_name="Test Protocol",
+            description="Test description",
+            results=ResultsMetadata(n_points=10, density_pts_per_km2=5.0)
+        )
+
+        assert not hasattr(meta, '__dict__')
+        assert not hasattr(meta.results, '__dict__')
+        with pytest.raises(AttributeError):
+            meta.unknown_field = 'value'
+        assert pickle.loads(pickle.dumps(meta)) == meta
+
+    def test_metadata_pickle_roundtrip(self):
+        """Test that nested metadata records pickle as compact field tuples."""
+        import pickle
+
+        meta = SamplingMetadata(
+            protocol_id="test_001",
+            protocol_name="Test Protocol",
+            description="Test description",
+            boundary=BoundaryMetadata(
+                geometry_wkt="POLYGON ((0 0, 1 0, 1 1, 0 0))",
+                crs="EPSG:4326",
+                area_km2=1.0,
+                bounds=(0, 0, 1, 1)
+            ),
+            data_sources=[DataSourceMetadata(source_type="osm")],
+            tags=["urban"]
+        )
+
+        restored = pickle.loads(pickle.dumps(meta))
+
+        assert restored == meta
+        assert restored.boundary.bounds == (0, 0, 1, 1)
+        # Field names are not written into the pickle stream
+        assert b'geometry_wkt' not in pickle.dumps(meta.boundary)
+
     def test_sampling_metadata_from_dict(self):
         """Test SamplingMetadata deserialization from dictionary."""
         data = {
@@ -198,6 +291,32 @@ class TestMetadataModels:
         assert meta.boundary is not None
         assert meta.parameters is not None
 
+    def test_sampling_metadata_from_dict_missing_fields(self):
+        """Test that from_dict lists missing required fields in order."""
+        with pytest.raises(ValueError) as excinfo:
+            SamplingMetadata.from_dict({'protocol_name': 'Test Protocol'})
+
+        assert "['protocol_id', 'description']" in str(excinfo.value)
+
+    def test_sampling_metadata_dict_roundtrip(self):
+        """Test that from_dict restores to_dict output and ignores unknown keys."""
+        meta = SamplingMetadata(
+            protocol_id="test_001",
+            protocol_name="Test Protocol",
+            description="Test description",
+            results=ResultsMetadata(n_points=10, density_pts_per_km2=5.0),
+            data_sources=[DataSourceMetadata(source_type="osm")],
+            tags=["urban"],
+            author="Test Author"
+        )
+
+        data = meta.to_dict()
+        data['unknown_field'] = 'ignored'
+        restored = SamplingMetadata.from_dict(data)
+
+        assert restored == meta
+        assert restored.parameters is None
+
     def test_sampling_metadata_from_strategy(self):
         """Test creating SamplingMetadata from GridSampling strategy."""
         boundary = box(0, 0, 1000, 1000)
@@ -237,6 +356,142 @@ class TestMetadataModels:
         assert metadata.results.n_points == len(points)
         assert metadata.results.density_pts_per_km2 > 0
 
+    def test_create_from_strategy_execution_environment(self):
+        """Test that execution metadata records the running environment."""
+        boundary = box(0, 0, 1000, 1000)
+        strategy = GridSampling(SamplingConfig(spacing=250, crs="EPSG:3857"))
+        strategy.generate(boundary)
+
+        metadata = SamplingMetadata.create_from_strategy(
+            strategy=strategy,
+            boundary=boundary,
+            protocol_name="Test Grid Study",
+            description="Test grid sampling protocol"
+        )
+
+        import ssp
+
+        assert re.fullmatch(r"test_grid_study_\d{8}_\d{6}", metadata.protocol_id)
+
+        execution = metadata.execution
+        assert execution.ssp_version == ssp.__version__
+        assert execution.python_version == platform.python_version()
+        assert execution.os_info == f"{platform.system()} {platform.release()}"
+        assert execution.hostname == platform.node()
+        assert execution.timestamp == metadata.created_at
+
+    def test_create_from_strategies_bulk_matches_single(self):
+        """Test that bulk creation matches per-boundary creation."""
+        boundaries = [box(0, 0, 1000, 1000), box(1000.5, 0, 2500.25, 750)]
+        strategies = []
+        for boundary in boundaries:
+            strategy = GridSampling(SamplingConfig(spacing=250, crs="EPSG:3857"))
+            strategy.generate(boundary)
+            strategies.append(strategy)
+
+        bulk = SamplingMetadata.create_from_strategies_bulk(
+            strategies, boundaries, ["Chunk A", "Chunk B"], "Chunked study"
+        )
+        single = [
+            SamplingMetadata.create_from_strategy(
+                strategy, boundary, name, "Chunked study"
+            )
+            for strategy, boundary, name
+            in zip(strategies, boundaries, ["Chunk A", "Chunk B"])
+        ]
+
+        assert [m.protocol_name for m in bulk] == ["Chunk A", "Chunk B"]
+        for bulk_meta, single_meta in zip(bulk, single):
+            assert bulk_meta.boundary == single_meta.boundary
+            assert bulk_meta.parameters == single_meta.parameters
+            assert bulk_meta.results == single_meta.results
+
+    def test_create_from_strategy_reuses_metrics(self, monkeypatch):
+        """Test that metrics are computed once per set of sample points."""
+        boundary = box(0, 0, 1000, 1000)
+        strategy = GridSampling(SamplingConfig(spacing=250, crs="EPSG:3857"))
+        strategy.generate(boundary)
+
+        calls = []
+        compute = strategy.calculate_coverage_metrics
+
+        def counting_metrics():
+            calls.append(1)
+            return compute()
+
+        monkeypatch.setattr(strategy, 'calculate_coverage_metrics', counting_metrics)
+
+        first = SamplingMetadata.create_from_strategy(
+            strategy, boundary, "Study", "First export"
+        )
+        second = SamplingMetadata.create_from_strategy(
+            strategy, boundary, "Study", "Second export"
+        )
+
+        assert len(calls) == 1
+        assert first.results.coverage_metrics == second.results.coverage_metrics
+        assert first.results.coverage_metrics is not second.results.coverage_metrics
+
+        # Regenerating the points invalidates the cached metrics
+        strategy.generate(box(0, 0, 500, 500))
+        third = SamplingMetadata.create_from_strategy(
+            strategy, boundary, "Study", "Third export"
+        )
+
+        assert len(calls) == 2
+        assert third.results.n_points < first.results.n_points
+
+    def test_create_from_road_network_strategy(self):
+        """Test that road-network settings and the OSM source are recorded."""
+        from ssp import RoadNetworkSampling
+
+        boundary = box(0, 0, 0.01, 0.01)
+        strategy = RoadNetworkSampling(
+            SamplingConfig(spacing=100),
+            network_type='drive',
+            road_types={'primary', 'secondary'}
+        )
+
+        metadata = SamplingMetadata.create_from_strategy(
+            strategy, boundary, "Road Study", "Road sampling protocol"
+        )
+        grid_metadata = SamplingMetadata.create_from_strategy(
+            GridSampling(SamplingConfig(spacing=100)), boundary,
+            "Grid Study", "Grid sampling protocol"
+        )
+
+        params = metadata.parameters.additional_params
+        assert params['network_type'] == 'drive'
+        assert sorted(params['road_types']) == ['primary', 'secondary']
+        assert [ds.source_type for ds in metadata.data_sources] == ['osm']
+        assert grid_metadata.parameters.additional_params == {}
+        assert grid_metadata.data_sources == []
+
+    def test_create_from_strategies_bulk_length_mismatch(self):
+        """Test that bulk creation rejects inputs of different lengths."""
+        strategy = GridSampling(SamplingConfig(spacing=250, crs="EPSG:3857"))
+
+        with pytest.raises(ValueError, match="same length"):
+            SamplingMetadata.create_from_strategies_bulk(
+                [strategy], [box(0, 0, 1000, 1000)], [], "Chunked study"
+            )
+
+    def test_models_import_does_not_load_exporter_dependencies(self):
+        """Test that importing the models leaves GeoPandas and PyYAML unloaded."""
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "from ssp.metadata import SamplingMetadata\n"
+            "print('geopandas' in sys.modules, 'yaml' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
 
 class TestMetadataSerializer:
     """Test metadata serialization."""
@@ -313,6 +568,80 @@ class TestMetadataSerializer:
         loaded = serializer.from_json(json_str)
         assert loaded.protocol_id == "test_001"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_encoders_agree(self, monkeypatch, use_orjson):
+        """Test that the orjson and stdlib JSON paths produce the same data."""
+        import ssp.metadata.serializer as serializer_module
+
+        if use_orjson and not serializer_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(serializer_module, 'ORJSON_AVAILABLE', use_orjson)
+
+        meta = SamplingMetadata(
+            protocol_id="test_001",
+            protocol_name="Étude urbaine",
+            description="Test description",
+            boundary=BoundaryMetadata(
+                geometry_wkt="POLYGON ((0 0, 1 0, 1 1, 0 0))",
+                crs="EPSG:4326",
+                area_km2=1.0,
+                bounds=(0, 0, 1, 1)
+            ),
+            results=ResultsMetadata(
+                n_points=10,
+                density_pts_per_km2=5.0,
+                coverage_metrics={'bounds': [0, 0, 1, 1]}
+            ),
+            tags=["urban"]
+        )
+
+        serializer = MetadataSerializer(format='json')
+        json_bytes = serializer.to_json_bytes(meta)
+
+        assert json.loads(json_bytes) == json.loads(json.dumps(meta.to_dict()))
+        assert serializer.from_json(json_bytes.decode('utf-8')).results == meta.results
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_geojson_serialization(self, monkeypatch, tmp_path, use_orjson):
+        """Test GeoJSON export with metadata on both encoder paths."""
+        import geopandas as gpd
+        import ssp.metadata.serializer as serializer_module
+
+        if use_orjson and not serializer_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(serializer_module, 'ORJSON_AVAILABLE', use_orjson)
+
+        meta = SamplingMetadata(
+            protocol_id="test_001",
+            protocol_name="Test Protocol",
+            description="Test description",
+            results=ResultsMetadata(n_points=2, density_pts_per_km2=5.0)
+        )
+        points = gpd.GeoDataFrame(
+            {'sample_id': ['p1', 'p2'], 'order': [1, 2]},
+            geometry=gpd.points_from_xy([0.5, 1.25], [2.0, 3.5]),
+            crs="EPSG:4326"
+        )
+
+        filepath = tmp_path / "points.geojson"
+        MetadataSerializer(format='geojson').to_geojson(meta, points, str(filepath))
+
+        data = json.loads(filepath.read_text())
+        assert data['type'] == 'FeatureCollection'
+        assert data['properties'] == json.loads(json.dumps(meta.to_dict()))
+        assert data['features'] == [
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [0.5, 2.0]},
+                'properties': {'sample_id': 'p1', 'order': 1}
+            },
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [1.25, 3.5]},
+                'properties': {'sample_id': 'p2', 'order': 2}
+            },
+        ]
+
     def test_yaml_string_serialization(self):
         """Test YAML serialization to string (no file)."""
         meta = SamplingMetadata(
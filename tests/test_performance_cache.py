@@ -0,0 +1,403 @@
+"""
+Unit tests for performance cache utilities.
+
+Tests the disk-based cache used for OSM downloads and other
+expensive computations.
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+from ssp.performance import cache as cache_module
+from ssp.performance.cache import DiskCache, Memoized
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Create a disk cache in a temporary directory."""
+    return DiskCache(cache_dir=str(tmp_path / "cache"))
+
+
+class TestDiskCache:
+    """Test suite for DiskCache."""
+
+    def _run_with_timeout(self, func, timeout=5.0):
+        """Run func in a thread and report whether it finished in time."""
+        thread = threading.Thread(target=func, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def test_put_does_not_deadlock(self, disk_cache):
+        """Test that put() completes while saving metadata under the lock."""
+        assert self._run_with_timeout(lambda: disk_cache.put("key", {"a": 1}))
+
+    def test_get_after_put(self, disk_cache):
+        """Test that get() returns a stored value and updates access time."""
+        result = {}
+
+        def roundtrip():
+            disk_cache.put("key", [1, 2, 3])
+            result["value"] = disk_cache.get("key")
+
+        assert self._run_with_timeout(roundtrip)
+        assert result["value"] == [1, 2, 3]
+
+    def test_get_missing_key(self, disk_cache):
+        """Test that a missing key returns None."""
+        assert disk_cache.get("missing") is None
+
+    @pytest.mark.parametrize("value", [
+        {"a": [1, 2.5, "x"], "b": None},
+        (1, 2, 3),
+        {1: "int key"},
+        {"nested": {"set": {1, 2}}},
+    ])
+    def test_roundtrip_preserves_types(self, disk_cache, value):
+        """Test that values come back equal and with the same types."""
+        disk_cache.put("key", value)
+        result = disk_cache.get("key")
+        assert result == value
+        assert type(result) is type(value)
+
+    def test_pickle_fallback_without_msgpack(self, disk_cache, monkeypatch):
+        """Test that entries are pickled with a header when msgpack is missing."""
+        monkeypatch.setattr(cache_module, "MSGPACK_AVAILABLE", False)
+        disk_cache.put("key", {"a": 1})
+        data = disk_cache._get_cache_path("key").read_bytes()
+        assert data[:1] == cache_module._FORMAT_PICKLE
+        assert disk_cache.get("key") == {"a": 1}
+
+    def test_clear_removes_entries(self, disk_cache):
+        """Test that clear() removes stored files and metadata."""
+        disk_cache.put("key", [1])
+        disk_cache.clear()
+        assert disk_cache.get("key") is None
+        assert not list(disk_cache.cache_dir.rglob("*.cache"))
+
+    def test_concurrent_readers_share_lock(self, disk_cache):
+        """Test that get() runs while another thread holds the read lock."""
+        disk_cache.put("key", [1])
+        result = {}
+
+        def read():
+            result["value"] = disk_cache.get("key")
+
+        with disk_cache.lock.read():
+            assert self._run_with_timeout(read)
+        assert result["value"] == [1]
+
+    def test_access_time_flushed(self, disk_cache):
+        """Test that deferred access times reach the metadata file."""
+        disk_cache.put("key", [1])
+        before = disk_cache.metadata["key"]["last_access"]
+        disk_cache.get("key")
+        disk_cache.flush()
+        reloaded = DiskCache(cache_dir=str(disk_cache.cache_dir))
+        assert reloaded.metadata["key"]["last_access"] >= before
+        assert not disk_cache._pending_access
+
+    def test_metadata_replayed_from_journal(self, disk_cache):
+        """Test that puts and deletes survive a reload via the journal."""
+        disk_cache.put("kept", [1])
+        disk_cache.put("dropped", [2])
+        disk_cache.delete("dropped")
+        assert disk_cache.journal_file.exists()
+
+        reloaded = DiskCache(cache_dir=str(disk_cache.cache_dir))
+        assert set(reloaded.metadata) == {"kept"}
+        assert reloaded.get("kept") == [1]
+
+    def test_journal_compacted_into_snapshot(self, disk_cache, monkeypatch):
+        """Test that a full journal is folded into the metadata snapshot."""
+        monkeypatch.setattr(DiskCache, "_JOURNAL_MAX_RECORDS", 3)
+        for i in range(3):
+            disk_cache.put(f"key{i}", i)
+
+        assert not disk_cache.journal_file.exists()
+        reloaded = DiskCache(cache_dir=str(disk_cache.cache_dir))
+        assert set(reloaded.metadata) == {"key0", "key1", "key2"}
+
+    def test_eviction_drops_least_recently_used(self, tmp_path):
+        """Test that eviction removes the least recently used entry first."""
+        cache = DiskCache(cache_dir=str(tmp_path / "lru"))
+        for key in ("a", "b", "c"):
+            cache.put(key, key * 1000)
+        cache.get("a")
+        cache.flush()
+
+        entry_size = cache.metadata["b"]["size_bytes"]
+        cache.max_size_mb = 2.5 * entry_size / (1024 * 1024)
+        cache.put("d", "d" * 1000)
+
+        assert list(cache.metadata) == ["a", "d"]
+        assert cache.get("b") is None
+        assert cache.get_stats()["n_entries"] == 2
+        assert cache._total_size == sum(
+            meta["size_bytes"] for meta in cache.metadata.values()
+        )
+
+    def test_miss_skips_filesystem(self, disk_cache, monkeypatch):
+        """Test that an unknown key is rejected without hashing or stat()."""
+        def fail(key):
+            raise AssertionError("cache path computed for a miss")
+
+        monkeypatch.setattr(disk_cache, "_get_cache_path", fail)
+        assert disk_cache.get("never-stored") is None
+
+    def test_vanished_file_is_forgotten(self, disk_cache):
+        """Test that a key whose file was removed is dropped from metadata."""
+        disk_cache.put("key", [1])
+        disk_cache._get_cache_path("key").unlink()
+        assert disk_cache.get("key") is None
+        assert "key" not in disk_cache.metadata
+
+    def test_concurrent_put_survives_stale_eviction(self, disk_cache, monkeypatch):
+        """Test that get() does not evict a value put() while it waited."""
+        disk_cache.put("key", [1])
+        disk_cache._get_cache_path("key").unlink()
+        write = disk_cache.lock.write
+
+        @contextmanager
+        def put_then_write():
+            # Another thread stores a fresh value before get() gets the lock
+            monkeypatch.setattr(disk_cache.lock, "write", write)
+            disk_cache.put("key", [2])
+            with write():
+                yield
+
+        monkeypatch.setattr(disk_cache.lock, "write", put_then_write)
+        assert disk_cache.get("key") is None
+        assert disk_cache.get("key") == [2]
+
+    def test_cache_path_memo_is_bounded(self, disk_cache, monkeypatch):
+        """Test that memoized paths are stable and the memo stays bounded."""
+        monkeypatch.setattr(DiskCache, "_PATH_MEMO_SIZE", 2)
+        first = disk_cache._get_cache_path("a")
+        disk_cache._get_cache_path("b")
+        disk_cache._get_cache_path("c")
+
+        assert len(disk_cache._paths) <= 2
+        assert disk_cache._get_cache_path("a") == first
+        assert first.name == (
+            "0cc175b9c0f1b6a831c399e269772661.cache"
+        )
+
+    def test_durable_put(self, tmp_path):
+        """Test that a durable cache stores and returns values."""
+        cache = DiskCache(cache_dir=str(tmp_path / "durable"), durable=True)
+        cache.put("key", {"a": 1})
+        assert cache.get("key") == {"a": 1}
+
+    def test_failed_put_keeps_previous_value(self, disk_cache):
+        """Test that a value that cannot be written leaves the old one."""
+        disk_cache.put("key", [1])
+        with pytest.warns(UserWarning, match="Failed to cache"):
+            disk_cache.put("key", lambda: None)
+
+        assert disk_cache.get("key") == [1]
+        assert not list(disk_cache.cache_dir.rglob("*.tmp"))
+
+    def test_total_size_tracks_metadata(self, disk_cache):
+        """Test that the running size total matches metadata after each op."""
+        def assert_consistent():
+            assert disk_cache._total_size == sum(
+                meta["size_bytes"] for meta in disk_cache.metadata.values()
+            )
+
+        disk_cache.put("a", "x" * 100)
+        disk_cache.put("b", "y" * 10)
+        assert_consistent()
+        disk_cache.put("a", "z")
+        assert_consistent()
+        disk_cache.delete("b")
+        assert_consistent()
+        disk_cache.metadata["a"]["ts"] = 0
+        assert disk_cache.get("a") is None
+        assert_consistent()
+        disk_cache.put("c", [1])
+        disk_cache.clear()
+        assert disk_cache._total_size == 0
+
+    def test_legacy_iso_metadata_migrated(self, tmp_path):
+        """Test that ISO-format times from older metadata still expire."""
+        cache_dir = tmp_path / "legacy"
+        cache_dir.mkdir()
+        (cache_dir / "cache_metadata.json").write_text(json.dumps({
+            "old": {"timestamp": "2000-01-01T00:00:00",
+                    "last_access": "2000-01-02T00:00:00", "size_bytes": 1},
+            "new": {"timestamp": datetime.now().isoformat(),
+                    "last_access": datetime.now().isoformat(), "size_bytes": 1},
+        }))
+
+        cache = DiskCache(cache_dir=str(cache_dir))
+        assert list(cache.metadata) == ["old", "new"]
+        assert isinstance(cache.metadata["new"]["ts"], int)
+        assert "timestamp" not in cache.metadata["new"]
+        assert cache.cleanup_expired() == 1
+        assert list(cache.metadata) == ["new"]
+
+    def test_files_sharded_by_hash_prefix(self, disk_cache):
+        """Test that entries live in a directory named after their hash."""
+        disk_cache.put("a", [1])
+        path = disk_cache._get_cache_path("a")
+        assert path.parent == disk_cache.cache_dir / path.name[:2]
+        assert path.exists()
+
+    def test_flat_files_migrated(self, disk_cache):
+        """Test that entries from the flat layout are moved into shards."""
+        disk_cache.put("a", [1])
+        path = disk_cache._get_cache_path("a")
+        path.rename(disk_cache.cache_dir / path.name)
+
+        reloaded = DiskCache(cache_dir=str(disk_cache.cache_dir))
+        assert reloaded.get("a") == [1]
+        assert not list(reloaded.cache_dir.glob("*.cache"))
+
+    def test_clear_leaves_nested_caches(self, tmp_path):
+        """Test that clearing a parent cache keeps a nested cache's files."""
+        parent = DiskCache(cache_dir=str(tmp_path / "cache"))
+        nested = DiskCache(cache_dir=str(tmp_path / "cache" / "osm"))
+        nested.put("graph", [1])
+        parent.put("other", [2])
+
+        parent.clear()
+        assert nested.get("graph") == [1]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_metadata_encoders_interoperate(self, tmp_path, monkeypatch, use_orjson):
+        """Test that metadata written by either JSON encoder reloads."""
+        if not cache_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(cache_module, "ORJSON_AVAILABLE", use_orjson)
+        cache = DiskCache(cache_dir=str(tmp_path / "json"))
+        cache.put("journaled", [1])
+        cache._save_metadata()
+        cache.put("snapshot-then-journal", [2])
+
+        monkeypatch.setattr(cache_module, "ORJSON_AVAILABLE", not use_orjson)
+        reloaded = DiskCache(cache_dir=str(tmp_path / "json"))
+        assert list(reloaded.metadata) == ["journaled", "snapshot-then-journal"]
+
+
+class TestMemoized:
+    """Test suite for Memoized."""
+
+    def _counting(self, **kwargs):
+        """Create a memoized function that records its calls."""
+        calls = []
+
+        def func(*args, **kw):
+            calls.append((args, kw))
+            return len(calls)
+
+        return Memoized(func, **kwargs), calls
+
+    def test_hit_skips_call(self):
+        """Test that repeated arguments reuse the cached result."""
+        memo, calls = self._counting()
+        assert memo(1, b=2) == memo(1, b=2) == 1
+        assert len(calls) == 1
+        assert memo.cache_info() == {'size': 1}
+
+    def test_keys_are_typed(self):
+        """Test that equal values of different types are cached separately."""
+        memo, calls = self._counting()
+        memo(1)
+        memo(1.0)
+        assert len(calls) == 2
+
+    def test_kwargs_order_ignored(self):
+        """Test that keyword argument order does not change the key."""
+        memo, calls = self._counting()
+        memo(a=1, b=2)
+        memo(b=2, a=1)
+        assert len(calls) == 1
+
+    def test_unhashable_arguments(self):
+        """Test that unhashable arguments still memoize."""
+        memo, calls = self._counting()
+        memo([1, 2], opts={"x": 1})
+        memo([1, 2], opts={"x": 1})
+        assert len(calls) == 1
+
+    def test_key_func(self):
+        """Test that a custom key_func decides cache identity."""
+        memo, calls = self._counting(key_func=lambda values: len(values))
+        memo([1, 2])
+        memo([3, 4])
+        memo([5])
+        assert len(calls) == 2
+
+    def test_misses_on_different_shards_run_concurrently(self):
+        """Test that a slow miss does not block misses in other shards."""
+        barrier = threading.Barrier(2, timeout=5)
+        memo = Memoized(lambda x: barrier.wait() is not None)
+
+        def shard_of(x):
+            return hash(memo._make_key((x,), {})) & (Memoized._N_SHARDS - 1)
+
+        first = 0
+        second = next(x for x in range(1, 100) if shard_of(x) != shard_of(first))
+        results = []
+        threads = [
+            threading.Thread(target=lambda x=x: results.append(memo(x)))
+            for x in (first, second)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True, True]
+        assert memo.cache_info() == {'size': 2}
+
+
+def test_osm_cache_is_shared_across_threads(tmp_path, monkeypatch):
+    """Test that concurrent first calls share one OSM cache instance."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cache_module, "_osm_cache", None)
+    barrier = threading.Barrier(8)
+    caches = []
+
+    def fetch():
+        barrier.wait()
+        caches.append(cache_module.get_osm_cache())
+
+    threads = [threading.Thread(target=fetch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(cache) for cache in caches}) == 1
+
+
+def test_clear_all_caches(tmp_path, monkeypatch):
+    """Test that clearing all caches leaves the default cache consistent."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cache_module, "_osm_cache", None)
+    default = DiskCache()
+    for i in range(20):
+        default.put(f"key{i}", [i])
+    default.flush()
+    cache_module.get_osm_cache().put("osm", [1])
+    DiskCache(cache_dir=".ssp_cache/other").put("other", [2])
+
+    cache_module.clear_all_caches()
+
+    root = tmp_path / ".ssp_cache"
+    assert not list(root.rglob("*.cache"))
+    # Shard directories are not treated as caches of their own
+    shards = [d for d in root.iterdir() if cache_module._is_shard_dir(d)]
+    assert shards
+    assert not any((d / "cache_metadata.json").exists() for d in shards)
+
+    reloaded = DiskCache()
+    assert reloaded.metadata == {}
+    assert reloaded.get("key0") is None
+    assert DiskCache(cache_dir=".ssp_cache/other").metadata == {}
@@ -0,0 +1,163 @@
+"""
+Unit tests for performance chunking utilities.
+
+Tests spatial chunk generation and streaming GeoDataFrame processing.
+"""
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point, box
+
+from ssp.performance.chunking import (
+    SpatialChunker,
+    StreamingGeoDataFrameProcessor,
+    TemporalChunker,
+    auto_chunk_size,
+)
+
+
+class TestSpatialChunker:
+    """Test suite for SpatialChunker."""
+
+    def test_square_boundary_tiles_exactly(self):
+        """Test that a square boundary splits into full-size chunks."""
+        chunker = SpatialChunker(chunk_size_km=1)
+        chunks = list(chunker.create_chunks(box(0, 0, 5000, 5000)))
+
+        assert len(chunks) == 25
+        assert all(chunk.area == pytest.approx(1e6) for chunk in chunks)
+        # Column by column: x outer, y inner
+        assert chunks[0].bounds == (0, 0, 1000, 1000)
+        assert chunks[1].bounds == (0, 1000, 1000, 2000)
+
+    def test_chunks_clipped_to_boundary(self):
+        """Test that edge chunks are clipped and outside cells dropped."""
+        boundary = Point(0, 0).buffer(5000)
+        chunker = SpatialChunker(chunk_size_km=1)
+        chunks = list(chunker.create_chunks(boundary))
+
+        assert len(chunks) < chunker.estimate_chunk_count(boundary)
+        assert all(boundary.buffer(1e-6).contains(chunk) for chunk in chunks)
+        assert sum(chunk.area for chunk in chunks) == pytest.approx(
+            boundary.area
+        )
+
+    def test_overlap_extends_chunks(self):
+        """Test that overlap grows chunks beyond the grid cell."""
+        chunker = SpatialChunker(chunk_size_km=1, overlap_m=100)
+        chunks = list(chunker.create_chunks(box(0, 0, 3000, 3000)))
+
+        assert chunks[4].bounds == (900, 900, 2100, 2100)
+
+    def test_max_chunks(self):
+        """Test that max_chunks stops generation early."""
+        chunker = SpatialChunker(chunk_size_km=1)
+        chunks = list(chunker.create_chunks(box(0, 0, 5000, 5000), max_chunks=3))
+
+        assert len(chunks) == 3
+
+
+class TestTemporalChunker:
+    """Test suite for TemporalChunker."""
+
+    def test_chunk_generator(self):
+        """Test that a generator is split into lists with a short tail."""
+        chunker = TemporalChunker(chunk_size=3)
+        chunks = list(chunker.chunk_generator(iter(range(7))))
+        assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_chunk_generator_empty(self):
+        """Test that an empty generator yields no chunks."""
+        chunker = TemporalChunker(chunk_size=3)
+        assert list(chunker.chunk_generator(iter([]))) == []
+
+    def test_chunk_generator_dtype(self):
+        """Test that numeric items can be packed into arrays."""
+        chunker = TemporalChunker(chunk_size=4)
+        chunks = list(chunker.chunk_generator(
+            (i * 0.5 for i in range(6)), dtype=np.float64
+        ))
+
+        assert [len(chunk) for chunk in chunks] == [4, 2]
+        assert all(chunk.dtype == np.float64 for chunk in chunks)
+        np.testing.assert_array_equal(chunks[1], [2.0, 2.5])
+
+
+class TestStreamingGeoDataFrameProcessor:
+    """Test suite for StreamingGeoDataFrameProcessor."""
+
+    @pytest.fixture
+    def points_gdf(self):
+        """Create a small point GeoDataFrame with a non-default index."""
+        return gpd.GeoDataFrame(
+            {"value": range(25)},
+            geometry=[Point(i, i) for i in range(25)],
+            index=range(100, 125),
+            crs="EPSG:3857",
+        )
+
+    @pytest.mark.parametrize("copy_chunks", [True, False])
+    def test_process_large_gdf(self, points_gdf, copy_chunks):
+        """Test that chunks are processed and concatenated in order."""
+        processor = StreamingGeoDataFrameProcessor(chunk_size=10)
+        result = processor.process_large_gdf(
+            points_gdf,
+            process_func=lambda chunk: chunk.assign(double=chunk["value"] * 2),
+            copy_chunks=copy_chunks,
+        )
+
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert list(result.index) == list(range(25))
+        assert list(result["double"]) == [2 * v for v in range(25)]
+        assert result.crs == points_gdf.crs
+
+    def test_process_large_gdf_restores_geodataframe(self, points_gdf):
+        """Test that plain DataFrame chunks are combined into a GeoDataFrame."""
+        processor = StreamingGeoDataFrameProcessor(chunk_size=10)
+        result = processor.process_large_gdf(points_gdf, pd.DataFrame)
+
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert result.crs == points_gdf.crs
+        assert len(result) == 25
+
+    def test_process_large_gdf_empty(self, points_gdf):
+        """Test that an empty input returns an empty GeoDataFrame."""
+        processor = StreamingGeoDataFrameProcessor(chunk_size=10)
+        result = processor.process_large_gdf(points_gdf.iloc[0:0], lambda c: c)
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert len(result) == 0
+        assert list(result.columns) == list(points_gdf.columns)
+
+    def test_process_to_file(self, points_gdf, tmp_path):
+        """Test that processed chunks are appended to one output file."""
+        processor = StreamingGeoDataFrameProcessor(chunk_size=10)
+        path = processor.process_to_file(
+            points_gdf, lambda chunk: chunk, tmp_path / "out.gpkg"
+        )
+
+        written = gpd.read_file(path)
+        assert list(written["value"]) == list(range(25))
+
+
+class TestAutoChunkSize:
+    """Test suite for auto_chunk_size."""
+
+    def test_memory_bound(self):
+        """Test that the chunk size uses 80% of the memory budget."""
+        assert auto_chunk_size(10_000, available_memory_mb=10, item_size_mb=0.01) == 800
+
+    def test_item_count_bound(self):
+        """Test that the chunk size never exceeds the item count."""
+        assert auto_chunk_size(500, available_memory_mb=1024) == 500
+
+    def test_minimum(self):
+        """Test that the chunk size is at least 10."""
+        assert auto_chunk_size(3) == 10
+        assert auto_chunk_size(10_000, available_memory_mb=1, item_size_mb=1) == 10
+
+    @pytest.mark.parametrize("item_size_mb", [0.0, -1.0, 5e-324])
+    def test_degenerate_item_size(self, item_size_mb):
+        """Test that zero, negative and tiny item sizes do not raise."""
+        assert auto_chunk_size(100, item_size_mb=item_size_mb) == 100
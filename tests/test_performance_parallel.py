@@ -0,0 +1,334 @@
+"""
+Unit tests for parallel processing utilities.
+
+Worker functions live at module level so they can be pickled into
+worker processes.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from ssp.performance import parallel
+from ssp.performance.parallel import (
+    ParallelProcessor,
+    _auto_chunksize,
+    get_optimal_n_workers,
+    parallelize_sampling,
+)
+from ssp.performance.progress import track_parallel_progress
+
+
+def scale(x, factor=1):
+    """Multiply an item by a factor."""
+    return x * factor
+
+
+def fail_on_three(x):
+    """Raise for one specific item."""
+    if x == 3:
+        raise ValueError("bad item")
+    return x
+
+
+def double_chunk(chunk):
+    """Double every item of a chunk."""
+    return [x * 2 for x in chunk]
+
+
+def make_array(n):
+    """Build an array large enough to be sent out of band."""
+    return np.arange(n * 1000)
+
+
+class CountingPayload:
+    """Large shared argument that counts how often it is pickled."""
+
+    n_pickled = 0
+
+    def __init__(self, factor):
+        self.factor = factor
+
+    def __reduce__(self):
+        CountingPayload.n_pickled += 1
+        return CountingPayload, (self.factor,)
+
+
+def scale_by_payload(x, payload):
+    """Multiply an item by a payload's factor."""
+    return x * payload.factor
+
+
+def shared_memory_blocks():
+    """List the POSIX shared memory blocks created by multiprocessing."""
+    if not os.path.isdir("/dev/shm"):
+        pytest.skip("no /dev/shm to inspect")
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+def chunk_pids(chunk):
+    """Report which process handled a chunk."""
+    return [os.getpid()]
+
+
+def add(a, b):
+    """Add two numbers."""
+    return a + b
+
+
+def worker_pid(x, payload=None):
+    """Report which process handled an item."""
+    return os.getpid()
+
+
+class TestParallelProcessor:
+    """Test suite for ParallelProcessor."""
+
+    def test_map_preserves_order(self):
+        """Test that results come back in item order."""
+        processor = ParallelProcessor(n_workers=2)
+        results = processor.map(scale, list(range(50)), factor=3)
+        assert results == [x * 3 for x in range(50)]
+
+    def test_map_empty(self):
+        """Test that an empty item list returns an empty list."""
+        assert ParallelProcessor(n_workers=2).map(scale, []) == []
+
+    def test_map_reports_failing_item(self):
+        """Test that a worker failure names the item it came from."""
+        processor = ParallelProcessor(n_workers=2)
+        with pytest.raises(RuntimeError, match="item 3") as excinfo:
+            processor.map(fail_on_three, list(range(10)))
+        # The worker's own exception stays available to callers
+        assert isinstance(excinfo.value.__cause__, ValueError)
+        assert str(excinfo.value.__cause__) == "bad item"
+
+    @pytest.mark.parametrize("n_workers, n_items", [(1, 50), (4, 7)])
+    def test_inline_without_pool(self, n_workers, n_items):
+        """Test that one worker or few items run without a pool."""
+        processor = ParallelProcessor(n_workers=n_workers)
+        processor._worker_pool = None  # any pool use would fail
+
+        assert processor.map(worker_pid, list(range(n_items))) == (
+            [os.getpid()] * n_items
+        )
+        assert processor.starmap(add, [(1, 2)] * n_items) == [3] * n_items
+        assert list(processor.imap(scale, list(range(n_items)))) == (
+            list(range(n_items))
+        )
+
+    def test_inline_failure_is_wrapped(self):
+        """Test that small inputs fail the same way as pooled ones."""
+        processor = ParallelProcessor(n_workers=4)
+        with pytest.raises(RuntimeError, match="item 3") as excinfo:
+            processor.map(fail_on_three, [0, 1, 2, 3])
+        assert isinstance(excinfo.value.__cause__, ValueError)
+
+        with pytest.raises(RuntimeError) as excinfo:
+            list(processor.imap(fail_on_three, [3]))
+        assert isinstance(excinfo.value.__cause__, ValueError)
+
+    def test_map_chunks_flattens(self):
+        """Test that chunk results are flattened in order."""
+        processor = ParallelProcessor(n_workers=2)
+        results = processor.map_chunks(
+            double_chunk, list(range(20)), chunk_size=3
+        )
+        assert results == [x * 2 for x in range(20)]
+
+    def test_map_chunks_array(self):
+        """Test that NumPy arrays are chunked and flattened in order."""
+        processor = ParallelProcessor(n_workers=2)
+        results = processor.map_chunks(double_chunk, np.arange(25), chunk_size=4)
+        assert results == [2 * x for x in range(25)]
+
+    def test_map_chunks_few_chunks_run_in_workers(self):
+        """Test that a few coarse chunks are still spread over workers."""
+        processor = ParallelProcessor(n_workers=4)
+        results = processor.map_chunks(chunk_pids, list(range(6)), chunk_size=1)
+        assert os.getpid() not in results
+
+    def test_map_chunks_default_chunk_size(self):
+        """Test that map_chunks picks a chunk size when none is given."""
+        processor = ParallelProcessor(n_workers=2)
+        results = processor.map_chunks(double_chunk, list(range(40)))
+        assert results == [x * 2 for x in range(40)]
+
+    def test_map_adaptive_chunksize(self):
+        """Test that adaptive batching still returns every result in order."""
+        processor = ParallelProcessor(n_workers=2, adaptive_chunksize=True)
+        results = processor.map(scale, list(range(500)), factor=2)
+        assert results == [x * 2 for x in range(500)]
+
+    def test_map_sends_kwargs_once_per_worker(self):
+        """Test that shared kwargs are not pickled with every batch."""
+        CountingPayload.n_pickled = 0
+        processor = ParallelProcessor(n_workers=2)
+        results = processor.map(
+            scale_by_payload, list(range(200)), payload=CountingPayload(3)
+        )
+
+        assert results == [x * 3 for x in range(200)]
+        assert CountingPayload.n_pickled <= processor.n_workers
+
+    def test_map_shared_memory_transport(self):
+        """Test that array results survive the shared memory transport."""
+        processor = ParallelProcessor(n_workers=2, transport="shared_memory")
+        results = processor.map(make_array, list(range(20)))
+
+        for n, result in zip(range(20), results):
+            np.testing.assert_array_equal(result, np.arange(n * 1000))
+        assert results[5].flags.writeable
+
+    def test_unsupported_transport(self):
+        """Test that an unknown transport is rejected."""
+        with pytest.raises(ValueError, match="Unsupported transport"):
+            ParallelProcessor(transport="carrier-pigeon")
+
+    @pytest.mark.parametrize("adaptive", [False, True])
+    def test_shared_memory_freed_after_failure(self, adaptive):
+        """Test that results pending at a failure are not left in /dev/shm."""
+        before = shared_memory_blocks()
+        processor = ParallelProcessor(
+            n_workers=2, transport="shared_memory", adaptive_chunksize=adaptive
+        )
+        with pytest.raises(RuntimeError):
+            processor.map(fail_on_three, list(range(40)))
+        assert shared_memory_blocks() <= before
+
+    def test_shared_memory_freed_after_early_stop(self):
+        """Test that abandoning imap frees results nobody read."""
+        before = shared_memory_blocks()
+        processor = ParallelProcessor(n_workers=2, transport="shared_memory")
+        results = processor.imap(make_array, list(range(40)))
+        next(results)
+        results.close()
+        assert shared_memory_blocks() <= before
+
+    def test_map_chunks_shared_memory_transport(self):
+        """Test that chunk results use the processor's transport."""
+        processor = ParallelProcessor(n_workers=2, transport="shared_memory")
+        results = processor.map_chunks(double_chunk, list(range(30)), chunk_size=4)
+        assert results == [x * 2 for x in range(30)]
+
+    @pytest.mark.parametrize("start_method", ["spawn", "forkserver"])
+    def test_map_start_method(self, start_method):
+        """Test that map works with non-fork start methods."""
+        processor = ParallelProcessor(n_workers=2, start_method=start_method)
+        assert processor.map(scale, list(range(8)), factor=2) == [
+            x * 2 for x in range(8)
+        ]
+
+    def test_unsupported_start_method(self):
+        """Test that an unknown start method is rejected."""
+        with pytest.raises(ValueError):
+            ParallelProcessor(start_method="teleport")
+
+    @pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+    def test_imap(self, transport):
+        """Test that imap yields every result, in any order."""
+        processor = ParallelProcessor(n_workers=2, transport=transport)
+        results = processor.imap(scale, list(range(50)), factor=2)
+
+        assert sorted(results) == [2 * x for x in range(50)]
+
+    @pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+    def test_imap_failure(self, transport):
+        """Test that a failing item stops imap with an error."""
+        processor = ParallelProcessor(n_workers=2, transport=transport)
+        with pytest.raises(RuntimeError) as excinfo:
+            list(processor.imap(fail_on_three, list(range(10))))
+        assert isinstance(excinfo.value.__cause__, ValueError)
+
+    def test_imap_stopped_early(self):
+        """Test that abandoning imap inside a with block frees the pool."""
+        with ParallelProcessor(n_workers=2) as processor:
+            results = processor.imap(scale, list(range(1000)))
+            next(results)
+            results.close()
+            assert processor._pool is None
+            assert processor.map(scale, list(range(10))) == list(range(10))
+
+    @pytest.mark.parametrize("start_method", [None, "spawn"])
+    def test_starmap(self, start_method):
+        """Test that argument tuples are unpacked in order."""
+        processor = ParallelProcessor(n_workers=2, start_method=start_method)
+        args_list = [(i, 10 * i) for i in range(30)]
+        assert processor.starmap(add, args_list) == [11 * i for i in range(30)]
+
+    def test_pool_reused_inside_with_block(self):
+        """Test that one pool serves several calls inside a with block."""
+        payload = CountingPayload(2)
+        with ParallelProcessor(n_workers=2) as processor:
+            first = processor.map(worker_pid, list(range(20)), payload=payload)
+            pool = processor._pool
+            second = processor.map(worker_pid, list(range(20)), payload=payload)
+            assert processor._pool is pool
+            assert set(first) | set(second) <= {w.pid for w in pool._pool}
+
+            # Different shared kwargs need freshly initialized workers
+            processor.map(worker_pid, list(range(20)), payload=CountingPayload(3))
+            assert processor._pool is not pool
+
+        assert processor._pool is None
+
+    def test_pool_dropped_after_failure(self):
+        """Test that a failed call inside a with block does not poison the pool."""
+        with ParallelProcessor(n_workers=2) as processor:
+            with pytest.raises(RuntimeError):
+                processor.map(fail_on_three, list(range(10)))
+            assert processor.map(scale, list(range(10))) == list(range(10))
+
+
+def test_parallelize_sampling_io_bound():
+    """Test that the thread path keeps order, kwargs and the caller's process."""
+    results = parallelize_sampling(
+        worker_pid, list(range(20)), n_workers=2, io_bound=True, payload=None
+    )
+    assert results == [os.getpid()] * 20
+
+    results = parallelize_sampling(
+        scale, list(range(50)), n_workers=2, io_bound=True, factor=3
+    )
+    assert results == [3 * x for x in range(50)]
+
+    with pytest.raises(RuntimeError, match="item 3") as excinfo:
+        parallelize_sampling(fail_on_three, list(range(10)), io_bound=True)
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+@pytest.mark.parametrize("transport", ["pipe", "shared_memory"])
+def test_track_parallel_progress_transport(transport):
+    """Test that track_parallel_progress returns results via either transport."""
+    results = track_parallel_progress(
+        make_array, [1, 2, 3], n_workers=2, show_progress=False,
+        transport=transport,
+    )
+    for n, result in zip([1, 2, 3], results):
+        np.testing.assert_array_equal(result, np.arange(n * 1000))
+
+
+@pytest.mark.parametrize("n_items, n_workers, expected", [
+    (0, 4, 1),
+    (15, 4, 1),
+    (160, 4, 10),
+    (1000, 3, 83),
+])
+def test_auto_chunksize(n_items, n_workers, expected):
+    """Test the chunk size heuristic."""
+    assert _auto_chunksize(n_items, n_workers) == expected
+
+
+@pytest.mark.parametrize("cpus, task_type, expected", [
+    (8, "osm_download", 4),
+    (2, "osm_download", 2),
+    (8, "sampling", 7),
+    (1, "sampling", 1),
+    (8, "general", 8),
+])
+def test_get_optimal_n_workers(monkeypatch, cpus, task_type, expected):
+    """Test worker counts derived from the usable CPU count."""
+    monkeypatch.setattr(parallel, "_CPU_COUNT", cpus)
+    assert get_optimal_n_workers(task_type) == expected
+    assert ParallelProcessor().n_workers == cpus
@@ -0,0 +1,118 @@
+"""
+Unit tests for progress tracking utilities.
+
+Tests progress trackers and the tracked map helpers.
+"""
+
+import pytest
+
+from ssp.performance import progress
+from ssp.performance.progress import (
+    ProgressTracker,
+    progress_context,
+    track_parallel_progress,
+    track_progress,
+)
+
+
+def square(x):
+    """Square an item."""
+    return x * x
+
+
+class TestProgressTracker:
+    """Test suite for ProgressTracker."""
+
+    @pytest.mark.skipif(not progress.TQDM_AVAILABLE, reason="tqdm not installed")
+    def test_bar_refresh_is_throttled(self):
+        """Test that the tqdm bar redraws by time and item count."""
+        with ProgressTracker(total=10_000) as tracker:
+            assert tracker._pbar.mininterval == 0.5
+            assert tracker._pbar.miniters == 50
+
+    def test_text_progress_is_throttled(self, capsys):
+        """Test that text progress skips redraws but always shows the end."""
+        tracker = ProgressTracker(total=10_000, show_progress=False)
+        for _ in range(10_000):
+            tracker.update(1)
+        tracker.close()
+
+        lines = capsys.readouterr().out.split("\r")[1:]
+        assert 1 <= len(lines) < 100
+        assert lines[-1] == "Processing: 10000/10000 (100.0%)\n"
+
+    def test_silent(self, capsys):
+        """Test that a silent tracker prints nothing."""
+        with ProgressTracker(total=10, silent=True) as tracker:
+            tracker.update(10)
+        assert capsys.readouterr().out == ""
+
+
+@pytest.fixture
+def tracker_updates(monkeypatch):
+    """Record every ProgressTracker.update() call."""
+    calls = []
+    original = ProgressTracker.update
+
+    def update(self, n=1):
+        calls.append(n)
+        original(self, n)
+
+    monkeypatch.setattr(ProgressTracker, "update", update)
+    return calls
+
+
+@pytest.mark.parametrize("options", [
+    {"show_progress": False},
+    {"silent": True},
+])
+def test_progress_context_hidden(capsys, options):
+    """Test that hidden progress yields one shared no-op tracker."""
+    with progress_context(100, **options) as first:
+        first.update(100)
+    with progress_context(100, **options) as second:
+        pass
+
+    assert first is second
+    assert not isinstance(first, ProgressTracker)
+    assert first.get_eta() == 0.0
+    assert capsys.readouterr().out == ""
+
+
+def test_track_progress_hidden(tracker_updates, capsys):
+    """Test that track_progress without progress skips the tracker."""
+    results = track_progress(square, list(range(10)), show_progress=False)
+
+    assert results == [x * x for x in range(10)]
+    assert tracker_updates == []
+    assert capsys.readouterr().out == ""
+
+
+def test_track_progress(tracker_updates):
+    """Test that track_progress maps in order and reports in batches."""
+    results = track_progress(square, list(range(1000)))
+
+    assert results == [x * x for x in range(1000)]
+    assert sum(tracker_updates) == 1000
+    assert len(tracker_updates) == 200
+
+
+def test_track_parallel_progress_batches_updates(tracker_updates):
+    """Test that parallel progress is reported in batches, remainder last."""
+    results = track_parallel_progress(
+        square, list(range(451)), n_workers=2, show_progress=True
+    )
+
+    assert results == [x * x for x in range(451)]
+    assert sum(tracker_updates) == 451
+    assert len(tracker_updates) == 226
+
+
+def test_track_parallel_progress_quiet_by_default(capsys):
+    """Test that track_parallel_progress prints nothing unless asked."""
+    results = track_parallel_progress(square, list(range(10)), n_workers=2)
+
+    assert results == [x * x for x in range(10)]
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
@@ -522,3 +522,58 @@ class TestRoadNetworkSamplingReproducibility:
         multi_index = pd.MultiIndex.from_tuples(index, names=['u', 'v', 'key'])
 
         return gpd.GeoDataFrame(edges_data, index=multi_index, crs='EPSG:3857')
+
+
+class TestRoadNetworkSamplingCache:
+    """Test suite for the on-disk OSM graph cache."""
+
+    @pytest.fixture
+    def osm_cache(self, tmp_path, monkeypatch):
+        """Point the global OSM cache at a temporary directory."""
+        from ssp.performance import cache as cache_module
+
+        disk_cache = cache_module.DiskCache(cache_dir=str(tmp_path / "osm"))
+        monkeypatch.setattr(cache_module, '_osm_cache', disk_cache)
+        return disk_cache
+
+    @patch('ssp.sampling.road_network.ox.graph_from_polygon')
+    def test_second_download_hits_cache(self, mock_download, osm_cache, mock_road_graph):
+        """Test that a repeated request is served from the cache."""
+        mock_download.return_value = mock_road_graph
+        boundary = box(0, 0, 200, 100)
+
+        strategy = RoadNetworkSampling(use_cache=True)
+        first = strategy._download_graph(boundary)
+        second = strategy._download_graph(boundary)
+
+        assert mock_download.call_count == 1
+        assert nx.utils.graphs_equal(first, second)
+        assert osm_cache.get_stats()['n_entries'] == 1
+
+    @patch('ssp.sampling.road_network.ox.graph_from_polygon')
+    def test_refresh_cache_downloads_again(self, mock_download, osm_cache, mock_road_graph):
+        """Test that refresh_cache discards the cached graph."""
+        mock_download.return_value = mock_road_graph
+        boundary = box(0, 0, 200, 100)
+
+        RoadNetworkSampling(use_cache=True)._download_graph(boundary)
+
+        with patch.object(osm_cache, 'delete', wraps=osm_cache.delete) as mock_delete:
+            RoadNetworkSampling(use_cache=True, refresh_cache=True)._download_graph(boundary)
+
+        mock_delete.assert_called_once()
+        assert mock_download.call_count == 2
+
+    @patch('ssp.performance.cache.get_osm_cache')
+    @patch('ssp.sampling.road_network.ox.graph_from_polygon')
+    def test_cache_disabled_never_touches_cache(self, mock_download, mock_get_cache, mock_road_graph):
+        """Test that use_cache=False bypasses the cache entirely."""
+        mock_download.return_value = mock_road_graph
+        boundary = box(0, 0, 200, 100)
+
+        strategy = RoadNetworkSampling()
+        strategy._download_graph(boundary)
+        strategy._download_graph(boundary)
+
+        assert mock_download.call_count == 2
+        mock_get_cache.assert_not_called()
@@ -317,6 +317,30 @@ class TestSamplingStrategy:
 
         assert "Call generate() method first" in str(excinfo.value)
 
+    def test_export_unsupported_format(self):
+        """Test that export rejects formats without a GDAL driver mapping."""
+        strategy = ConcreteSamplingStrategy(SamplingConfig(crs="EPSG:3857"))
+        strategy.generate(box(0, 0, 1000, 1000))
+
+        with pytest.raises(ValueError) as excinfo:
+            strategy.export("test.shp", fmt="shp")
+
+        assert "Unsupported export format" in str(excinfo.value)
+
+    @pytest.mark.parametrize("fmt,suffix", [("fgb", ".fgb"), ("gpkg", ".gpkg")])
+    def test_export_roundtrip(self, tmp_path, fmt, suffix):
+        """Test exporting to binary formats and reading the points back."""
+        strategy = ConcreteSamplingStrategy(SamplingConfig(crs="EPSG:3857"))
+        strategy.generate(box(0, 0, 1000, 1000))
+
+        filepath = tmp_path / f"points{suffix}"
+        strategy.export(str(filepath), fmt=fmt)
+
+        restored = gpd.read_file(filepath)
+        assert len(restored) == 1
+        assert restored.crs == "EPSG:3857"
+        assert restored['sample_id'].iloc[0] == 'test_0001'
+
     def test_repr(self):
         """Test string representation."""
         config = SamplingConfig(spacing=75.0, crs="EPSG:3857", seed=123)
@@ -114,6 +114,57 @@ class TestCompareStrategies:
         assert fig is not None
         plt.close(fig)
 
+    def test_compare_strategies_results_in_name_order(self):
+        """Test that concurrently generated results keep the input order."""
+        boundary = box(0, 0, 0.05, 0.05)
+        names = ['Grid (500m)', 'Grid (100m)', 'Grid (250m)']
+        strategies = {
+            name: GridSampling(SamplingConfig(spacing=float(name[6:-2])))
+            for name in names
+        }
+
+        with patch(
+            'ssp.visualization.comparison._plot_metrics_comparison'
+        ) as mock_plot:
+            fig = compare_strategies(strategies, boundary)
+
+        results = mock_plot.call_args[0][1]
+        assert list(results) == names
+        assert len(results['Grid (100m)']['points']) > len(results['Grid (500m)']['points'])
+        plt.close(fig)
+
+    def test_compare_strategies_one_failure_warns(self):
+        """Test that one failing strategy only produces a warning."""
+        boundary = box(0, 0, 0.05, 0.05)
+        failing = GridSampling(SamplingConfig(spacing=100))
+        failing.generate = MagicMock(side_effect=RuntimeError("boom"))
+        strategies = {
+            'Broken': failing,
+            'Grid (500m)': GridSampling(SamplingConfig(spacing=500))
+        }
+
+        with pytest.warns(UserWarning, match="Failed to generate samples for Broken"):
+            fig = compare_strategies(strategies, boundary)
+
+        assert fig is not None
+        plt.close(fig)
+
+    def test_compare_strategies_dedupes_identical_configs(self):
+        """Test that strategies with the same configuration run once."""
+        boundary = box(0, 0, 0.05, 0.05)
+        first = GridSampling(SamplingConfig(spacing=500))
+        second = GridSampling(SamplingConfig(spacing=500))
+        second.generate = MagicMock(side_effect=AssertionError("not deduped"))
+
+        with patch(
+            'ssp.visualization.comparison._plot_metrics_comparison'
+        ) as mock_plot:
+            fig = compare_strategies({'A': first, 'B': second}, boundary)
+
+        results = mock_plot.call_args[0][1]
+        assert results['A']['points'] is results['B']['points']
+        plt.close(fig)
+
 
 class TestPlotCoverageStatistics:
     """Test suite for plot_coverage_statistics function."""